@@ -1,15 +1,29 @@
 import os
+from collections.abc import Awaitable, Callable
 from typing import Union
 from fastapi import FastAPI
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from starlette.middleware.cors import CORSMiddleware
 
 from src.infrastructure.cache.redis_client import redis_client
 from src.infrastructure.logger.logger import logger
 from src.infrastructure.nats.client import nats_client
 from src.infrastructure.prometheus.metrics import metrics_middleware
+from src.infrastructure.security.password import warm_up_bcrypt_rounds
 from src.infrastructure.sentry.client import init_sentry
+from src.infrastructure.utils.exception_handler import (
+    DomainValidationError,
+    NotFoundError,
+    PreconditionFailedError,
+    domain_validation_error_handler,
+    not_found_handler,
+    pool_timeout_handler,
+    precondition_failed_handler,
+    unhandled_exception_handler,
+)
 from dotenv import load_dotenv
 
+from src.modules.user.core.command import UserIdentityFilterWarmUpUseCase
 from src.modules.user.interface.auth import auth
 from src.modules.user.interface.user import users
 
@@ -28,6 +42,8 @@ class Bootstrap:
         cls._instance = FastAPI()
         cls._router()
         cls._middleware()
+        cls._exception_handler()
+        cls._security()
         cls._database()
         return cls._instance
 
@@ -72,17 +88,38 @@ class Bootstrap:
 
         logger.info("Routers configured.")
 
+    @classmethod
+    def _security(cls):
+        # bcrypt cost는 첫 요청이 아닌 시작 시점에 측정
+        cls._instance.add_event_handler("startup", warm_up_bcrypt_rounds)
+
     @classmethod
     def _database(cls):
         try:
             from src.infrastructure.database.postgres.config import database_engine
             database_engine.connect()
+            cls._instance.add_event_handler("startup", cls._optional_startup("DB pool warm-up", database_engine.warm_async_pool))
             from src.infrastructure.database.redis.config import redis_engine
             redis_engine.connect()
+            cls._instance.add_event_handler(
+                "startup", cls._optional_startup("User bloom filter warm-up", UserIdentityFilterWarmUpUseCase.execute)
+            )
             logger.info("Database initialized")
         except Exception as e:
             logger.error(f"Database initialization failed: {e}")
 
+    @staticmethod
+    def _optional_startup(name: str, handler: Callable[[], Awaitable[None]]) -> Callable[[], Awaitable[None]]:
+        """실패해도 앱 시작을 막지 않는 startup 작업 (DB/Redis 장애 시 경고만 남기고 계속)"""
+
+        async def _run() -> None:
+            try:
+                await handler()
+            except Exception as e:
+                logger.warning(f"{name} failed at startup: {e}")
+
+        return _run
+
     @classmethod
     def _middleware(cls):
         cls._instance.add_middleware(
@@ -97,6 +134,16 @@ class Bootstrap:
 
         logger.info("Middlewares configured")
 
+    @classmethod
+    def _exception_handler(cls):
+        cls._instance.add_exception_handler(DomainValidationError, domain_validation_error_handler)
+        cls._instance.add_exception_handler(NotFoundError, not_found_handler)
+        cls._instance.add_exception_handler(PreconditionFailedError, precondition_failed_handler)
+        cls._instance.add_exception_handler(PoolTimeoutError, pool_timeout_handler)
+        cls._instance.add_exception_handler(Exception, unhandled_exception_handler)
+
+        logger.info("Exception handlers configured")
+
     @property
     def instance(self) -> FastAPI:
         return self._instance
@@ -0,0 +1,91 @@
+import dataclasses
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+
+import msgspec
+import orjson
+from loguru import logger
+from redis import asyncio as aioredis
+
+from .config import redis_config
+
+_async_client: aioredis.Redis | None = None
+
+
+def get_async_redis() -> aioredis.Redis:
+    """cache-aside 전용 비동기 Redis 클라이언트 (첫 사용 시 생성)"""
+    global _async_client
+    if _async_client is None:
+        _async_client = aioredis.Redis(
+            host=redis_config.host,
+            port=redis_config.port,
+            password=redis_config.password,
+            db=redis_config.database,
+            socket_connect_timeout=5,
+            socket_timeout=5,
+        )
+    return _async_client
+
+
+def _version_key(namespace: str) -> str:
+    return f"{namespace}:ver"
+
+
+async def invalidate(namespace: str) -> None:
+    """네임스페이스 버전을 올려 기존 캐시 키를 한 번에 무효화 (O(1))"""
+    try:
+        await get_async_redis().incr(_version_key(namespace))
+    except Exception as e:
+        logger.warning(f"Cache invalidation failed for {namespace}: {e}")
+
+
+def _command_fields(command: Any) -> dict:
+    """커맨드의 필드 값 (msgspec Struct / slots dataclass는 __dict__가 없으므로 타입별로 추출)"""
+    if isinstance(command, msgspec.Struct):
+        return msgspec.structs.asdict(command)
+    if dataclasses.is_dataclass(command):
+        return {field.name: getattr(command, field.name) for field in dataclasses.fields(command)}
+    return vars(command)
+
+
+def _default_key(command: Any) -> str:
+    return ":".join(f"{name}={value}" for name, value in sorted(_command_fields(command).items()))
+
+
+def cache_aside(
+    namespace: str,
+    model: type,
+    ttl: int = 30,
+    key_fn: Callable[[Any], str] = _default_key,
+):
+    """명령 단위 cache-aside 데코레이터 (Redis 장애 시 원본 호출로 폴백)
+
+    캐시 키에는 네임스페이스 버전이 포함되므로 `invalidate(namespace)` 호출만으로 이전 결과가 무시된다.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(self, command):
+            client = get_async_redis()
+            try:
+                version = await client.get(_version_key(namespace)) or b"0"
+                key = f"{namespace}:{version.decode()}:{func.__name__}:{key_fn(command)}"
+                cached = await client.get(key)
+            except Exception as e:
+                logger.warning(f"Cache read failed for {namespace}: {e}")
+                return await func(self, command)
+
+            if cached is not None:
+                return model.model_validate(orjson.loads(cached))
+
+            response = await func(self, command)
+            try:
+                await client.set(key, orjson.dumps(response.model_dump(mode="json")), ex=ttl)
+            except Exception as e:
+                logger.warning(f"Cache write failed for {namespace}: {e}")
+            return response
+
+        return wrapper
+
+    return decorator
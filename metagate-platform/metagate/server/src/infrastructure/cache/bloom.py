@@ -0,0 +1,90 @@
+from collections.abc import Awaitable, Callable, Iterable
+from uuid import uuid4
+
+from loguru import logger
+
+from .aside import get_async_redis
+
+# 재구성 중에 추가된 항목도 새 filter에 넣기 위한 표시 키 (값은 재구성 중인 임시 키, 중단 시 만료)
+_REBUILD_MARKER_TTL = 3600
+
+
+def _rebuild_marker(key: str) -> str:
+    return f"{key}:rebuilding"
+
+
+async def might_contain(key: str, item: str) -> bool:
+    """bloom filter 포함 여부 (False면 확실히 없음)
+
+    filter 키가 없으면(warm-up 실패, Redis 재시작 등) 아무것도 모르는 상태이므로 True로 폴백해 DB 확인을 유도한다.
+    Redis 장애 시에도 True.
+    """
+    try:
+        async with get_async_redis().pipeline(transaction=False) as pipe:
+            key_exists, contains = await pipe.exists(key).execute_command("BF.EXISTS", key, item).execute()
+        return not key_exists or bool(contains)
+    except Exception as e:
+        logger.warning(f"Bloom filter lookup failed for {key}: {e}")
+        return True
+
+
+async def add(key: str, *items: str) -> None:
+    """bloom filter에 항목 추가
+
+    filter를 새로 만들지 않는다 (NOCREATE, 새 항목만 담긴 filter가 생기면 기존 항목을 "없음"으로 답하게 됨).
+    재구성 중이면 재구성 중인 임시 filter에도 추가한다.
+    """
+    if not items:
+        return
+    client = get_async_redis()
+    try:
+        staging_key = await client.get(_rebuild_marker(key))
+        # 임시 filter에 먼저 넣어야 그 사이 RENAME으로 교체돼도 새 filter(교체 전 임시 또는 교체 후 기존 키)에 남는다
+        # 키가 없어 NOCREATE로 실패하는 경우(교체 완료, filter 없음)는 무시
+        async with client.pipeline(transaction=False) as pipe:
+            if staging_key:
+                pipe.execute_command("BF.INSERT", staging_key, "NOCREATE", "ITEMS", *items)
+            pipe.execute_command("BF.INSERT", key, "NOCREATE", "ITEMS", *items)
+            await pipe.execute(raise_on_error=False)
+    except Exception as e:
+        logger.warning(f"Bloom filter add failed for {key}: {e}")
+
+
+async def rebuild(
+    key: str,
+    load_items: Callable[[], Awaitable[Iterable[str]]],
+    capacity: int = 100_000,
+    error_rate: float = 0.001,
+    chunk_size: int = 10000,
+) -> None:
+    """전체 항목으로 새 filter를 만들어 교체 (warm-up, 삭제된 항목 정리용)
+
+    임시 키에 BF.RESERVE로 크기를 정해 만든 뒤 RENAME으로 한 번에 바꾸므로, 재구성 중에도 조회는 기존 filter를 본다.
+    load_items는 재구성 표시 이후에 호출하므로, 그 전에 저장된 항목은 load_items 결과에,
+    그 뒤에 add된 항목은 임시 filter에 함께 들어간다.
+    """
+    client = get_async_redis()
+    marker = _rebuild_marker(key)
+    staging_key = f"{key}:rebuild:{uuid4().hex}"
+    try:
+        await client.execute_command("BF.RESERVE", staging_key, error_rate, capacity)
+        await client.expire(staging_key, _REBUILD_MARKER_TTL)
+        await client.set(marker, staging_key, ex=_REBUILD_MARKER_TTL)
+
+        chunk: list[str] = []
+        for item in await load_items():
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                await client.execute_command("BF.MADD", staging_key, *chunk)
+                chunk.clear()
+        if chunk:
+            await client.execute_command("BF.MADD", staging_key, *chunk)
+
+        async with client.pipeline(transaction=True) as pipe:
+            await pipe.rename(staging_key, key).persist(key).delete(marker).execute()
+    except Exception as e:
+        logger.warning(f"Bloom filter rebuild failed for {key}: {e}")
+        try:
+            await client.delete(marker, staging_key)
+        except Exception:
+            pass
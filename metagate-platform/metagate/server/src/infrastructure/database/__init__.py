@@ -0,0 +1,8 @@
+from sqlalchemy.orm import DeclarativeBase
+from sqlmodel import SQLModel
+
+
+class Base(DeclarativeBase):
+    """SQLAlchemy 선언형 엔티티 베이스 (SQLModel과 metadata를 공유해 create_all 한 번으로 함께 생성)"""
+
+    metadata = SQLModel.metadata
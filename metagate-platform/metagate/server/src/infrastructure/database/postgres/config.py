@@ -1,9 +1,13 @@
-from typing import Annotated, Generator
-from contextlib import contextmanager
+import asyncio
+from uuid import uuid4
+from typing import Annotated, AsyncGenerator, Generator
+from contextlib import asynccontextmanager, contextmanager
 
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlmodel import Session, SQLModel, create_engine
 from pydantic_settings import BaseSettings
+from sqlalchemy import text
 
 
 class DatabaseConfig(BaseSettings):
@@ -12,6 +16,13 @@ class DatabaseConfig(BaseSettings):
     username: str = "postgres"
     password: str = ""
     database: str = "metagate_dev"
+    pool_size: int = 25
+    max_overflow: int = 25
+    pool_recycle: int = 1800
+    pool_timeout: float = 2.0  # 풀이 가득 찼을 때 커넥션을 기다리는 최대 시간 (초과 시 503)
+    pool_warmup: int = 5  # 시작 시 미리 열어 둘 비동기 커넥션 수
+    prepared_statement_cache_size: int = 1024  # 커넥션별 asyncpg prepared statement 캐시 크기
+    pgbouncer: bool = False  # PgBouncer transaction pooling 뒤에서 접속 (DB_PORT=6432, prepared statement 캐시 끔)
 
     class Config:
         env_prefix = "DB_"
@@ -22,10 +33,31 @@ class DatabaseConfig(BaseSettings):
     def url(self) -> str:
         return f"postgresql://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}"
 
+    @property
+    def async_url(self) -> str:
+        return (
+            f"postgresql+asyncpg://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}"
+            f"?prepared_statement_cache_size={0 if self.pgbouncer else self.prepared_statement_cache_size}"
+        )
+
+    @property
+    def async_connect_args(self) -> dict:
+        """asyncpg.connect 인자 (transaction pooling에서는 트랜잭션마다 서버 커넥션이 바뀌므로
+        asyncpg 자체 statement 캐시를 끄고, 남는 prepared statement 이름이 겹치지 않게 매번 새 이름 사용)"""
+        if not self.pgbouncer:
+            return {}
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+
 
 class DatabaseEngine:
     _instance = None
     _engine = None
+    _async_engine: AsyncEngine = None
+    _async_session_factory: async_sessionmaker[AsyncSession] = None
+    _async_config: DatabaseConfig = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -40,8 +72,11 @@ class DatabaseEngine:
             self._engine = create_engine(
                 config.url,
                 echo=False,
+                pool_size=config.pool_size,
+                max_overflow=config.max_overflow,
                 pool_pre_ping=True,
-                pool_recycle=3600,
+                pool_recycle=config.pool_recycle,
+                pool_timeout=config.pool_timeout,
             )
             SQLModel.metadata.create_all(self._engine)
 
@@ -67,12 +102,73 @@ class DatabaseEngine:
                 session.rollback()
                 raise
 
+    def connect_async(self, config: DatabaseConfig = None) -> AsyncEngine:
+        if self._async_engine is None:
+            if config is None:
+                config = DatabaseConfig()
+
+            self._async_engine = create_async_engine(
+                config.async_url,
+                echo=False,
+                pool_size=config.pool_size,
+                max_overflow=config.max_overflow,
+                pool_pre_ping=True,
+                pool_recycle=config.pool_recycle,
+                pool_timeout=config.pool_timeout,
+                connect_args=config.async_connect_args,
+            )
+            self._async_config = config
+            self._async_session_factory = async_sessionmaker(self._async_engine, expire_on_commit=False)
+
+        return self._async_engine
+
+    async def warm_async_pool(self) -> None:
+        """요청 폭주 시 연결 수립 비용이 없도록 pool_warmup 개의 커넥션을 미리 열어 풀에 반납"""
+        engine = self.async_engine
+        count = min(self._async_config.pool_warmup, self._async_config.pool_size)
+        if count <= 0:
+            return
+
+        async def _open() -> None:
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(count):
+                tg.create_task(_open())
+
+    async def get_async_session(self) -> AsyncGenerator[AsyncSession, None]:
+        if self._async_session_factory is None:
+            self.connect_async()
+
+        async with self._async_session_factory() as session:
+            yield session
+
+    @asynccontextmanager
+    async def get_async_db_session(self) -> AsyncGenerator[AsyncSession, None]:
+        if self._async_session_factory is None:
+            self.connect_async()
+
+        async with self._async_session_factory() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
     @property
     def engine(self):
         if self._engine is None:
             self.connect()
         return self._engine
 
+    @property
+    def async_engine(self) -> AsyncEngine:
+        if self._async_engine is None:
+            self.connect_async()
+        return self._async_engine
+
 
 database_engine = DatabaseEngine()
 
@@ -85,4 +181,14 @@ def get_session() -> Generator[Session, None, None]:
     yield from database_engine.get_session()
 
 
-SessionDep = Annotated[Session, Depends(get_session)]
\ No newline at end of file
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    async for session in database_engine.get_async_session():
+        yield session
+
+
+def get_async_db_session():
+    return database_engine.get_async_db_session()
+
+
+SessionDep = Annotated[Session, Depends(get_session)]
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_session)]
\ No newline at end of file
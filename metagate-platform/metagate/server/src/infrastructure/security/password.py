@@ -0,0 +1,93 @@
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+
+import bcrypt
+from loguru import logger
+from passlib.context import CryptContext
+
+_CALIBRATION_PASSWORD = b"x" * 16
+_MIN_ROUNDS = 12
+_MAX_ROUNDS = 14
+
+# bcrypt 해싱/검증 전용 프로세스 풀 (이벤트 루프를 막지 않도록 첫 사용 시 생성)
+_executor: ProcessPoolExecutor | None = None
+
+
+def _measure_hash_ms(rounds: int) -> float:
+    started = time.perf_counter()
+    bcrypt.hashpw(_CALIBRATION_PASSWORD, bcrypt.gensalt(rounds=rounds))
+    return (time.perf_counter() - started) * 1000
+
+
+@cache
+def calibrate_bcrypt_rounds(target_ms: int = 250, floor: int = _MIN_ROUNDS) -> int:
+    """목표 해싱 시간(ms) 안에 들어오는 가장 높은 bcrypt cost 계산 (프로세스당 1회, floor 미만으로는 내려가지 않음)"""
+    elapsed_ms = _measure_hash_ms(floor)
+    if elapsed_ms > target_ms:
+        logger.warning(f"bcrypt cost {floor} takes {elapsed_ms:.0f}ms, exceeding the {target_ms}ms target")
+        return floor
+
+    rounds = floor
+    for cost in range(floor + 1, _MAX_ROUNDS + 1):
+        # cost가 1 증가할 때마다 해싱 시간이 2배가 되므로 초과 시 바로 중단
+        if _measure_hash_ms(cost) > target_ms:
+            break
+        rounds = cost
+
+    logger.info(f"bcrypt cost calibrated to {rounds} (target {target_ms}ms)")
+    return rounds
+
+
+@cache
+def configured_bcrypt_rounds() -> int:
+    """BCRYPT_TARGET_MS(목표 시간), BCRYPT_ROUNDS(하한, 기본 12) 환경 변수 기준 cost"""
+    return calibrate_bcrypt_rounds(
+        target_ms=int(os.getenv("BCRYPT_TARGET_MS", "250")),
+        floor=int(os.getenv("BCRYPT_ROUNDS", str(_MIN_ROUNDS))),
+    )
+
+
+async def warm_up_bcrypt_rounds() -> None:
+    """시작 시 cost calibration 실행 (첫 요청이 측정 시간을 부담하지 않도록, 이벤트 루프 밖 스레드에서)"""
+    await asyncio.to_thread(configured_bcrypt_rounds)
+
+
+@cache
+def password_context(bcrypt_rounds: int) -> CryptContext:
+    """cost별 CryptContext (cost 미만 해시는 needs_update 대상, salt는 bcrypt가 해시마다 생성)"""
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__rounds=bcrypt_rounds,
+        bcrypt__min_rounds=bcrypt_rounds,
+    )
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _executor
+
+
+def _hash(password: str, bcrypt_rounds: int) -> str:
+    return password_context(bcrypt_rounds).hash(password)
+
+
+def _verify(password: str, hashed_password: str, bcrypt_rounds: int) -> bool:
+    return password_context(bcrypt_rounds).verify(password, hashed_password)
+
+
+async def hash_password(password: str, bcrypt_rounds: int) -> str:
+    """프로세스 풀에서 비밀번호 해싱"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), _hash, password, bcrypt_rounds)
+
+
+async def verify_password(password: str, hashed_password: str, bcrypt_rounds: int) -> bool:
+    """프로세스 풀에서 비밀번호 검증"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), _verify, password, hashed_password, bcrypt_rounds)
@@ -5,6 +5,11 @@ from jose import jwt, ExpiredSignatureError, JWTError
 from loguru import logger
 import os
 
+
+class TokenVerificationError(Exception):
+    """만료되었거나 서명이 올바르지 않은 토큰 (401 응답 대상)"""
+
+
 class TokenType(Enum):
     ACCESS = "access"
     REFRESH = "refresh"
@@ -49,9 +54,9 @@ class Token:
             payload = jwt.decode(token, Token.SECRET_KEY, algorithms=[Token.ALGORITHM])
             return payload
         except ExpiredSignatureError:
-            raise Exception("Token has expired")
+            raise TokenVerificationError("Token has expired")
         except JWTError:
-            raise Exception("Invalid token")
+            raise TokenVerificationError("Invalid token")
 
     @staticmethod
     def is_token_expired(token: str) -> bool:
@@ -0,0 +1,26 @@
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import ORJSONResponse
+
+CACHE_CONTROL = "private, max-age=5"
+
+
+def make_etag(data: Any) -> str:
+    """응답 데이터의 weak ETag (BLAKE2b 8바이트)"""
+    digest = hashlib.blake2b(orjson.dumps(data, option=orjson.OPT_SORT_KEYS), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
+
+def conditional_json_response(request: Request, content: dict, data: Any) -> Response:
+    """If-None-Match가 일치하면 본문 없는 304, 아니면 ETag를 붙인 JSON 응답
+
+    ETag는 매 응답마다 바뀌는 envelope(timestamp 등)가 아닌 실제 데이터(`data`)로만 계산한다.
+    """
+    etag = make_etag(data)
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(content=content, headers=headers)
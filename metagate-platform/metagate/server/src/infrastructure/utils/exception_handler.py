@@ -0,0 +1,49 @@
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from src.infrastructure.logger.logger import logger
+
+
+class DomainValidationError(ValueError):
+    """도메인 규칙 위반 (400 응답 대상, 메시지를 그대로 노출해도 되는 것만 이 예외로 던진다)"""
+
+
+class NotFoundError(Exception):
+    """조회 대상 없음 (404 응답 대상, 내장 KeyError/IndexError와 구분하기 위한 도메인 예외)"""
+
+
+class PreconditionFailedError(Exception):
+    """If-Match 등 조건부 요청의 전제 조건 불일치 (다른 요청이 먼저 수정함)"""
+
+
+async def domain_validation_error_handler(request: Request, exc: DomainValidationError) -> JSONResponse:
+    """도메인 검증 실패(DomainValidationError)를 400 응답으로 변환
+
+    내장 ValueError(pydantic ValidationError 포함)는 여기로 오지 않고 500 핸들러에서 메시지 없이 처리된다.
+    """
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
+
+async def not_found_handler(request: Request, exc: NotFoundError) -> JSONResponse:
+    """조회 대상 없음(NotFoundError)을 404 응답으로 변환"""
+    return JSONResponse(status_code=404, content={"detail": str(exc)})
+
+
+async def precondition_failed_handler(request: Request, exc: PreconditionFailedError) -> JSONResponse:
+    """조건부 쓰기 충돌(PreconditionFailedError)을 412 응답으로 변환"""
+    return JSONResponse(status_code=412, content={"detail": str(exc)})
+
+
+async def pool_timeout_handler(request: Request, exc: PoolTimeoutError) -> JSONResponse:
+    """DB 커넥션 풀 대기 시간 초과를 503 응답으로 변환 (무기한 대기 대신 빠르게 실패)"""
+    logger.warning(f"DB pool exhausted on {request.method} {request.url.path}")
+    return JSONResponse(
+        status_code=503, content={"detail": "요청이 많아 잠시 후 다시 시도해 주세요."}, headers={"Retry-After": "1"}
+    )
+
+
+async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    """처리되지 않은 예외를 500 응답으로 변환"""
+    logger.error(f"Unhandled exception on {request.method} {request.url.path}: {exc}")
+    return JSONResponse(status_code=500, content={"detail": "요청 처리 중 오류가 발생했습니다."})
@@ -0,0 +1,47 @@
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable
+
+from fastapi import HTTPException
+
+from src.infrastructure.database.postgres.config import DatabaseConfig
+
+# 풀 전체(pool_size + max_overflow)보다 조금 적게 잡아 데코레이터 밖의 DB 작업(시작 작업, 백그라운드 등) 몫을 남김
+DB_CONCURRENCY_MARGIN = 5
+
+
+def _db_concurrency_limit() -> int:
+    config = DatabaseConfig()
+    return max(1, config.pool_size + config.max_overflow - DB_CONCURRENCY_MARGIN)
+
+
+_db_semaphore = asyncio.Semaphore(_db_concurrency_limit())
+
+
+def limit_db_concurrency(
+    timeout: float = 0.5,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """DB를 쓰는 엔드포인트의 동시 실행 수 제한 데코레이터
+
+    자리가 timeout초 안에 나지 않으면 커넥션 풀 대기열에 쌓이는 대신 즉시 503으로 응답한다.
+    business_errors보다 바깥(라우트 데코레이터 바로 아래)에 둬야 503이 500으로 바뀌지 않는다.
+    """
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                async with asyncio.timeout(timeout):
+                    await _db_semaphore.acquire()
+            except TimeoutError:
+                raise HTTPException(
+                    status_code=503, detail="요청이 많아 잠시 후 다시 시도해 주세요.", headers={"Retry-After": "1"}
+                ) from None
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _db_semaphore.release()
+
+        return wrapper
+
+    return decorator
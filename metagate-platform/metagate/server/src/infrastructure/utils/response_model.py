@@ -1,10 +1,19 @@
+import functools
 from datetime import datetime
-from typing import Any, TypeVar, Generic
+from typing import Any, Awaitable, Callable, Optional, TypeVar, Generic
 
+from fastapi import HTTPException
+from loguru import logger
 from pydantic import BaseModel, Field
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from src.infrastructure.utils.exception_handler import DomainValidationError, NotFoundError, PreconditionFailedError
 
 T = TypeVar("T")
 
+# 전용 예외 핸들러(또는 FastAPI)가 상태 코드를 정하는 예외는 500으로 바꾸지 않고 그대로 전파
+_PASSTHROUGH_EXCEPTIONS = (HTTPException, PoolTimeoutError, NotFoundError, PreconditionFailedError)
+
 
 class SuccessResponse(BaseModel, Generic[T]):
     success: bool = Field(default=True, description="Response success status")
@@ -74,4 +83,38 @@ class BusinessResponse(Generic[T]):
             message=message,
             error=error,
             timestamp=datetime.now().isoformat()
-        )
\ No newline at end of file
+        )
+
+
+def business_errors(
+    error_message: str = "Internal server error",
+    value_error_status: Optional[int] = None,
+    value_error_message: str = "Bad request",
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """엔드포인트 예외를 BusinessResponse.failure로 변환하는 데코레이터
+
+    value_error_status를 주면 DomainValidationError를 해당 상태 코드로, 나머지 예외(내장 ValueError 포함)는 500으로 응답한다.
+    500 응답에는 예외 메시지를 싣지 않고 서버 로그에만 남긴다.
+    HTTPException(503 부하 차단 등), 풀 타임아웃(503), NotFoundError(404), PreconditionFailedError(412)는
+    각자의 핸들러가 처리하도록 다시 던진다.
+    """
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return await func(*args, **kwargs)
+            except _PASSTHROUGH_EXCEPTIONS:
+                raise
+            except DomainValidationError as e:
+                if value_error_status is not None:
+                    return BusinessResponse.failure(value_error_status, str(e), value_error_message)
+                logger.exception(f"{func.__name__} failed")
+                return BusinessResponse.failure(500, None, error_message)
+            except Exception:
+                logger.exception(f"{func.__name__} failed")
+                return BusinessResponse.failure(500, None, error_message)
+
+        return wrapper
+
+    return decorator
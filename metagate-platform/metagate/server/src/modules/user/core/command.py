@@ -1,11 +1,34 @@
-from passlib.context import CryptContext
+from typing import Optional
 
+import msgspec
+
+from src.infrastructure.cache import bloom
+from src.infrastructure.security.password import configured_bcrypt_rounds, hash_password
 from src.infrastructure.security.token import Token, TokenType
+from src.infrastructure.utils.exception_handler import DomainValidationError
 from src.modules.user.core.entity import User
 from src.modules.user.core.repository import SQLModelUserRepository
+from src.modules.user.core.value import AuthProvider, UserRole, UserStatus
 from src.modules.user.interface.adapter import UserRegisterAdapter, UserUpdateAdapter, UserDeleteAdapter, \
     UserLogoutAdapter, UserLoginAdapter
 
+# 가입 폼 중복 확인용 bloom filter 키 (읽기 전용 확인 API에서만 사용, 가입 시 중복 검사는 항상 DB)
+USER_EMAIL_FILTER = "users:emails"
+USER_USERNAME_FILTER = "users:usernames"
+
+
+async def email_might_exist(email: str) -> bool:
+    return await bloom.might_contain(USER_EMAIL_FILTER, email.lower())
+
+
+async def username_might_exist(username: str) -> bool:
+    return await bloom.might_contain(USER_USERNAME_FILTER, username.lower())
+
+
+async def remember_user_identity(email: str, username: str) -> None:
+    await bloom.add(USER_EMAIL_FILTER, email.lower())
+    await bloom.add(USER_USERNAME_FILTER, username.lower())
+
 
 class UserRegisterUseCase:
     def __init__(self):
@@ -14,11 +37,31 @@ class UserRegisterUseCase:
     @classmethod
     async def execute(cls, adapter: UserRegisterAdapter):
         repository = SQLModelUserRepository()
-        if repository.exists_by_email(adapter.email):
-            raise ValueError("already exists with this email address.")
-        hashed_password = CryptContext(schemes=["bcrypt"], deprecated="auto").hash(adapter.password)
+        # bloom filter는 키 유실/재구성 중에 "없음"으로 잘못 답할 수 있으므로 쓰기 경로에서는 DB로 확인
+        if await repository.exists_by_email(adapter.email):
+            raise DomainValidationError("already exists with this email address.")
+        # 해싱은 프로세스 풀에서 (이벤트 루프를 막지 않음), cost는 시작 시 calibration 결과
+        hashed_password = await hash_password(adapter.password, configured_bcrypt_rounds())
         user = await User.register(email=adapter.email, password=hashed_password, username=adapter.username)
         await repository.save(user)
+        await remember_user_identity(user.email, user.username)
+
+
+class UserIdentityFilterWarmUpUseCase:
+    """기존 사용자의 이메일/사용자명으로 bloom filter 재구성"""
+
+    @classmethod
+    async def execute(cls) -> None:
+        repository = SQLModelUserRepository()
+
+        async def emails() -> list[str]:
+            return [email.lower() for email, _ in await repository.find_all_identities()]
+
+        async def usernames() -> list[str]:
+            return [username.lower() for _, username in await repository.find_all_identities()]
+
+        await bloom.rebuild(USER_EMAIL_FILTER, emails)
+        await bloom.rebuild(USER_USERNAME_FILTER, usernames)
 
 
 class UserUpdateUseCase:
@@ -66,4 +109,243 @@ class UserLogoutUseCase:
 
     @classmethod
     async def execute(cls, adapter: UserLogoutAdapter) -> dict:
-        pass
\ No newline at end of file
+        payload = Token.verify(adapter.token)
+
+        return {
+            "email": payload.get("email")
+        }
+
+
+class OAuthLoginCommand(msgspec.Struct, frozen=True):
+    """OAuth 로그인 커맨드 (제공자 응답으로 채워지므로 별도 검증 없이 생성)"""
+
+    provider: AuthProvider
+    provider_id: str
+    email: str
+    username: str
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    avatar_url: Optional[str] = None
+    ip_address: Optional[str] = None
+
+    @classmethod
+    def from_user_info(cls, provider: AuthProvider, user_info: dict) -> "OAuthLoginCommand":
+        """제공자 사용자 정보로부터 생성 (위치 인자로 바로 채움)"""
+        return cls(
+            provider,
+            user_info["id"],
+            user_info["email"],
+            user_info["username"],
+            user_info["first_name"],
+            user_info["last_name"],
+            user_info["avatar_url"],
+        )
+
+
+class FindUserByOAuthCommand(msgspec.Struct, frozen=True):
+    """OAuth 제공자 ID로 사용자 조회 커맨드"""
+
+    provider: AuthProvider
+    provider_id: str
+
+
+class CreateUserCommand(msgspec.Struct, frozen=True):
+    """사용자 생성 커맨드 (OAuth 사용자는 password 없음)"""
+
+    email: str
+    username: str
+    password: str | None = None
+    first_name: str | None = None
+    last_name: str | None = None
+    nickname: str | None = None
+    phone: str | None = None
+    avatar_url: str | None = None
+    bio: str | None = None
+    auth_provider: AuthProvider = AuthProvider.EMAIL
+    auth_provider_id: str | None = None
+    user_role: UserRole = UserRole.USER
+    user_status: UserStatus = UserStatus.ACTIVE
+
+
+class UpdateUserCommand(msgspec.Struct, frozen=True):
+    """사용자 정보 수정 커맨드 (None인 필드는 변경하지 않음)"""
+
+    user_id: str
+    email: str | None = None
+    username: str | None = None
+    first_name: str | None = None
+    last_name: str | None = None
+    nickname: str | None = None
+    phone: str | None = None
+    avatar_url: str | None = None
+    bio: str | None = None
+    user_role: UserRole | None = None
+    user_status: UserStatus | None = None
+    is_active: bool | None = None
+
+
+class ChangePasswordCommand(msgspec.Struct, frozen=True):
+    """비밀번호 변경 커맨드"""
+
+    user_id: str
+    current_password: str
+    new_password: str
+
+
+class ResetPasswordCommand(msgspec.Struct, frozen=True):
+    """비밀번호 재설정 요청 커맨드"""
+
+    email: str
+
+
+class ConfirmPasswordResetCommand(msgspec.Struct, frozen=True):
+    """비밀번호 재설정 확인 커맨드"""
+
+    token: str
+    new_password: str
+
+
+class VerifyEmailCommand(msgspec.Struct, frozen=True):
+    """이메일 인증 커맨드"""
+
+    token: str
+
+
+class SendEmailVerificationCommand(msgspec.Struct, frozen=True):
+    """이메일 인증 메일 발송 커맨드"""
+
+    user_id: str
+
+
+class LoginCommand(msgspec.Struct, frozen=True):
+    """이메일 로그인 커맨드"""
+
+    email: str
+    password: str
+    ip_address: str | None = None
+
+
+class LogoutCommand(msgspec.Struct, frozen=True):
+    """로그아웃 커맨드"""
+
+    user_id: str
+    token: str | None = None
+
+
+class UpdateLastLoginCommand(msgspec.Struct, frozen=True):
+    """마지막 로그인 정보 갱신 커맨드"""
+
+    user_id: str
+    ip_address: str | None = None
+
+
+class ActivateUserCommand(msgspec.Struct, frozen=True):
+    """사용자 활성화 커맨드"""
+
+    user_id: str
+
+
+class DeactivateUserCommand(msgspec.Struct, frozen=True):
+    """사용자 비활성화 커맨드"""
+
+    user_id: str
+
+
+class SuspendUserCommand(msgspec.Struct, frozen=True):
+    """사용자 정지 커맨드"""
+
+    user_id: str
+    reason: str | None = None
+
+
+class DeleteUserCommand(msgspec.Struct, frozen=True):
+    """사용자 삭제 커맨드 (기본은 소프트 삭제)"""
+
+    user_id: str
+    hard_delete: bool = False
+
+
+class PromoteToAdminCommand(msgspec.Struct, frozen=True):
+    """관리자 승격 커맨드"""
+
+    user_id: str
+
+
+class DemoteToUserCommand(msgspec.Struct, frozen=True):
+    """일반 사용자 강등 커맨드"""
+
+    user_id: str
+
+
+class CheckEmailExistsCommand(msgspec.Struct, frozen=True):
+    """이메일 존재 여부 확인 커맨드"""
+
+    email: str
+
+
+class CheckUsernameExistsCommand(msgspec.Struct, frozen=True):
+    """사용자명 존재 여부 확인 커맨드"""
+
+    username: str
+
+
+class FindUserByIdCommand(msgspec.Struct, frozen=True):
+    """ID로 사용자 조회 커맨드"""
+
+    user_id: str
+
+
+class FindUserByEmailCommand(msgspec.Struct, frozen=True):
+    """이메일로 사용자 조회 커맨드"""
+
+    email: str
+
+
+class FindUserByUsernameCommand(msgspec.Struct, frozen=True):
+    """사용자명으로 사용자 조회 커맨드"""
+
+    username: str
+
+
+class FindUserByEmailVerificationTokenCommand(msgspec.Struct, frozen=True):
+    """이메일 인증 토큰으로 사용자 조회 커맨드"""
+
+    token: str
+
+
+class ListUsersCommand(msgspec.Struct, frozen=True):
+    """사용자 목록 조회 커맨드 (None인 조건은 필터하지 않음)"""
+
+    skip: int = 0
+    limit: int = 100
+    search_term: str | None = None
+    role: UserRole | None = None
+    status: UserStatus | None = None
+    auth_provider: AuthProvider | None = None
+    email_verified: bool | None = None
+    is_active: bool | None = None
+
+
+class ListAdminsCommand(msgspec.Struct, frozen=True):
+    """관리자 목록 조회 커맨드"""
+
+    skip: int = 0
+    limit: int = 100
+
+
+class ListActiveUsersCommand(msgspec.Struct, frozen=True):
+    """활성 사용자 목록 조회 커맨드"""
+
+    skip: int = 0
+    limit: int = 100
+
+
+class ListVerifiedUsersCommand(msgspec.Struct, frozen=True):
+    """이메일 인증 완료 사용자 목록 조회 커맨드"""
+
+    skip: int = 0
+    limit: int = 100
+
+
+class GetUserStatisticsCommand(msgspec.Struct, frozen=True):
+    """사용자 통계 조회 커맨드"""
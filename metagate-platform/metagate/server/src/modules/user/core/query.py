@@ -1,3 +1,9 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from src.modules.user.core.value import AuthProvider, UserRole, UserStatus
+
 
 class UsersPaginationQueryUseCase:
     def __init__(self):
@@ -14,4 +20,188 @@ class UserQueryUseCase:
 
     @classmethod
     async def execute(cls, user_id: int):
-        return {"message": f"{user_id} User query executed successfully."}
\ No newline at end of file
+        return {"message": f"{user_id} User query executed successfully."}
+
+class UserResponse(BaseModel):
+    """사용자 정보 응답"""
+
+    id: str
+    email: str
+    username: str
+    first_name: str | None = None
+    last_name: str | None = None
+    nickname: str | None = None
+    phone: str | None = None
+    avatar_url: str | None = None
+    bio: str | None = None
+    auth_provider: AuthProvider
+    auth_provider_id: str | None = None
+    email_verified: bool
+    user_role: UserRole
+    user_status: UserStatus
+    is_active: bool
+    last_login_at: datetime | None = None
+    last_login_ip: str | None = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class UserAuthResponse(BaseModel):
+    """인증된 사용자 정보 + 토큰 응답"""
+
+    id: str
+    email: str
+    username: str
+    user_role: UserRole
+    user_status: UserStatus
+    is_active: bool
+    email_verified: bool
+    auth_provider: AuthProvider
+    access_token: str
+    refresh_token: str
+    token_type: str = "bearer"
+
+
+class UserLoginResponse(BaseModel):
+    """이메일 로그인 응답"""
+
+    user: UserAuthResponse
+    message: str = "로그인 성공"
+
+
+class OAuthLoginResponse(BaseModel):
+    """OAuth 로그인 응답"""
+
+    user: UserAuthResponse
+    is_new_user: bool
+    message: str
+
+
+class UserLogoutResponse(BaseModel):
+    """로그아웃 응답"""
+
+    message: str = "로그아웃되었습니다."
+
+
+class UserRegistrationResponse(BaseModel):
+    """사용자 생성 응답"""
+
+    user_id: str
+    email: str
+    username: str
+    message: str = "사용자가 생성되었습니다."
+
+
+class UserUpdateResponse(BaseModel):
+    """사용자 정보 수정 응답"""
+
+    user: UserResponse
+    message: str = "사용자 정보가 수정되었습니다."
+
+
+class PasswordChangeResponse(BaseModel):
+    """비밀번호 변경 응답"""
+
+    success: bool
+    message: str
+
+
+class PasswordResetResponse(BaseModel):
+    """비밀번호 재설정 요청 응답 (사용자 존재 여부와 무관하게 같은 응답)"""
+
+    email: str
+    message: str = "비밀번호 재설정 메일을 발송했습니다."
+
+
+class PasswordResetConfirmResponse(BaseModel):
+    """비밀번호 재설정 확인 응답"""
+
+    success: bool
+    message: str
+
+
+class EmailVerificationResponse(BaseModel):
+    """이메일 인증 결과 응답"""
+
+    verified: bool
+    message: str
+
+
+class EmailVerificationSentResponse(BaseModel):
+    """이메일 인증 메일 발송 응답"""
+
+    user_id: str
+    message: str = "인증 메일을 발송했습니다."
+
+
+class UserActivationResponse(BaseModel):
+    """사용자 활성화 응답"""
+
+    user_id: str
+    message: str = "사용자가 활성화되었습니다."
+
+
+class UserDeactivationResponse(BaseModel):
+    """사용자 비활성화 응답"""
+
+    user_id: str
+    message: str = "사용자가 비활성화되었습니다."
+
+
+class UserSuspensionResponse(BaseModel):
+    """사용자 정지 응답"""
+
+    user_id: str
+    reason: str | None = None
+    message: str = "사용자가 정지되었습니다."
+
+
+class UserDeleteResponse(BaseModel):
+    """사용자 삭제 응답"""
+
+    user_id: str
+    message: str = "사용자가 삭제되었습니다."
+
+
+class UserPromotionResponse(BaseModel):
+    """관리자 승격 응답"""
+
+    user_id: str
+    new_role: UserRole
+    message: str = "관리자로 승격되었습니다."
+
+
+class UserDemotionResponse(BaseModel):
+    """일반 사용자 강등 응답"""
+
+    user_id: str
+    new_role: UserRole
+    message: str = "일반 사용자로 변경되었습니다."
+
+
+class UserExistsResponse(BaseModel):
+    """이메일/사용자명 존재 여부 응답"""
+
+    exists: bool
+
+
+class UserListResponse(BaseModel):
+    """사용자 목록 응답"""
+
+    users: list[UserResponse]
+    total_count: int
+    skip: int
+    limit: int
+
+
+class UserStatisticsResponse(BaseModel):
+    """사용자 통계 응답"""
+
+    total_users: int
+    active_users: int
+    pending_users: int
+    suspended_users: int
+    deleted_users: int
+    admin_users: int
+    verified_users: int
+    unverified_users: int
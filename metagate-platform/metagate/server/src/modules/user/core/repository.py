@@ -4,6 +4,91 @@ from typing import Optional, List
 from sqlmodel import select
 
 from src.modules.user.core.entity import User
+from src.modules.user.core.value import AuthProvider, UserRole, UserStatus
+
+
+class UserRepository(ABC):
+    """사용자 Repository 인터페이스 (UserService가 의존)"""
+
+    @abstractmethod
+    async def save(self, user: User) -> User:
+        """사용자 저장"""
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, user_id: str) -> User | None:
+        """ID로 사용자 조회"""
+        pass
+
+    @abstractmethod
+    async def find_by_email(self, email: str) -> User | None:
+        """이메일로 사용자 조회"""
+        pass
+
+    @abstractmethod
+    async def find_by_username(self, username: str) -> User | None:
+        """사용자명으로 사용자 조회"""
+        pass
+
+    @abstractmethod
+    async def find_by_auth_provider_id(self, provider: AuthProvider, provider_id: str) -> User | None:
+        """OAuth 제공자 ID로 사용자 조회"""
+        pass
+
+    @abstractmethod
+    async def find_by_email_verification_token(self, token: str) -> User | None:
+        """이메일 인증 토큰으로 사용자 조회"""
+        pass
+
+    @abstractmethod
+    async def find_by_role(self, role: UserRole) -> list[User]:
+        """역할로 사용자 목록 조회"""
+        pass
+
+    @abstractmethod
+    async def find_by_status(self, status: UserStatus) -> list[User]:
+        """상태로 사용자 목록 조회"""
+        pass
+
+    @abstractmethod
+    async def find_all(self, skip: int = 0, limit: int = 100) -> list[User]:
+        """모든 사용자 조회 (페이징)"""
+        pass
+
+    @abstractmethod
+    async def delete(self, user_id: str) -> bool:
+        """사용자 삭제"""
+        pass
+
+    @abstractmethod
+    async def exists_by_id(self, user_id: str) -> bool:
+        """사용자 존재 여부 확인"""
+        pass
+
+    @abstractmethod
+    async def exists_by_email(self, email: str) -> bool:
+        """이메일로 사용자 존재 여부 확인"""
+        pass
+
+    @abstractmethod
+    async def exists_by_username(self, username: str) -> bool:
+        """사용자명으로 사용자 존재 여부 확인"""
+        pass
+
+    @abstractmethod
+    async def search_users(
+        self,
+        search_term: str | None = None,
+        role: UserRole | None = None,
+        status: UserStatus | None = None,
+        auth_provider: AuthProvider | None = None,
+        email_verified: bool | None = None,
+        is_active: bool | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[User]:
+        """조건 검색 (None인 조건은 필터하지 않음)"""
+        pass
 
 
 class SQLModelUserRepository:
@@ -15,84 +100,91 @@ class SQLModelUserRepository:
 
     async def save(self, user: User) -> User:
         """사용자 저장"""
-        with self.database_engine.get_db_session() as session:
+        async with self.database_engine.get_async_db_session() as session:
             session.add(user)
-            session.commit()
-            session.refresh(user)
+            await session.commit()
+            await session.refresh(user)
             return user
 
-    def find_by_id(self, user_id: int) -> Optional[User]:
+    async def find_by_id(self, user_id: int) -> Optional[User]:
         """ID로 사용자 조회"""
-        with self.database_engine.get_db_session() as session:
+        async with self.database_engine.get_async_db_session() as session:
             statement = select(User).where(User.id == user_id)
-            result = session.exec(statement)
-            return result.first()
+            result = await session.execute(statement)
+            return result.scalars().first()
 
-    def find_by_email(self, email: str) -> Optional[User]:
+    async def find_by_email(self, email: str) -> Optional[User]:
         """이메일로 사용자 조회"""
-        with self.database_engine.get_db_session() as session:
+        async with self.database_engine.get_async_db_session() as session:
             statement = select(User).where(User.email == email)
-            result = session.exec(statement)
-            return result.first()
+            result = await session.execute(statement)
+            return result.scalars().first()
 
-    def find_by_username(self, username: str) -> Optional[User]:
+    async def find_by_username(self, username: str) -> Optional[User]:
         """사용자명으로 사용자 조회"""
-        with self.database_engine.get_db_session() as session:
+        async with self.database_engine.get_async_db_session() as session:
             statement = select(User).where(User.username == username)
-            result = session.exec(statement)
-            return result.first()
+            result = await session.execute(statement)
+            return result.scalars().first()
 
-    def find_all(self, skip: int = 0, limit: int = 100) -> List[User]:
+    async def find_all(self, skip: int = 0, limit: int = 100) -> List[User]:
         """모든 사용자 조회 (페이징)"""
-        with self.database_engine.get_db_session() as session:
+        async with self.database_engine.get_async_db_session() as session:
             statement = select(User).offset(skip).limit(limit)
-            result = session.exec(statement)
-            return result.all()
+            result = await session.execute(statement)
+            return list(result.scalars().all())
 
     async def delete(self, user_id: int) -> bool:
-        with self.database_engine.get_db_session() as session:
-            user = self.find_by_id(user_id)
+        async with self.database_engine.get_async_db_session() as session:
+            user = await session.get(User, user_id)
             if user:
-                session.delete(user)
-                session.commit()
+                await session.delete(user)
+                await session.commit()
                 return True
             return False
 
     async def update(self, user_id: int) -> bool:
-        with self.database_engine.get_db_session() as session:
-            user = self.find_by_id(user_id)
+        async with self.database_engine.get_async_db_session() as session:
+            user = await session.get(User, user_id)
             if user:
                 session.add(user)
-                session.commit()
-                session.refresh(user)
+                await session.commit()
+                await session.refresh(user)
                 return True
             return False
 
-    def exists_by_email(self, email: str) -> bool:
+    async def exists_by_email(self, email: str) -> bool:
         """이메일로 사용자 존재 여부 확인"""
-        with self.database_engine.get_db_session() as session:
+        async with self.database_engine.get_async_db_session() as session:
             statement = select(User.id).where(User.email == email)
-            result = session.exec(statement)
+            result = await session.execute(statement)
             return result.first() is not None
 
-    def exists_by_username(self, username: str) -> bool:
+    async def exists_by_username(self, username: str) -> bool:
         """사용자명으로 사용자 존재 여부 확인"""
-        with self.database_engine.get_db_session() as session:
+        async with self.database_engine.get_async_db_session() as session:
             statement = select(User.id).where(User.username == username)
-            result = session.exec(statement)
+            result = await session.execute(statement)
             return result.first() is not None
 
-    def update(self, user: User) -> User:
+    async def find_all_identities(self) -> List[tuple[str, str]]:
+        """전체 사용자의 (이메일, 사용자명) 조회"""
+        async with self.database_engine.get_async_db_session() as session:
+            statement = select(User.email, User.username)
+            result = await session.execute(statement)
+            return [tuple(row) for row in result.all()]
+
+    async def update(self, user: User) -> User:
         """사용자 정보 업데이트"""
-        with self.database_engine.get_db_session() as session:
+        async with self.database_engine.get_async_db_session() as session:
             session.add(user)
-            session.commit()
-            session.refresh(user)
+            await session.commit()
+            await session.refresh(user)
             return user
 
-    def count(self) -> int:
+    async def count(self) -> int:
         """전체 사용자 수 조회"""
-        with self.database_engine.get_db_session() as session:
+        async with self.database_engine.get_async_db_session() as session:
             statement = select(User)
-            result = session.exec(statement)
-            return len(result.all())
\ No newline at end of file
+            result = await session.execute(statement)
+            return len(result.all())
@@ -3,8 +3,10 @@ from datetime import datetime, timedelta
 from typing import List, Optional
 
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 
+from src.infrastructure.cache.aside import cache_aside, invalidate
+from src.infrastructure.security.password import hash_password, password_context, verify_password
+from src.infrastructure.utils.exception_handler import DomainValidationError, NotFoundError
 from src.modules.user.core.command import (
     ActivateUserCommand,
     ChangePasswordCommand,
@@ -35,6 +37,9 @@ from src.modules.user.core.command import (
     UpdateLastLoginCommand,
     UpdateUserCommand,
     VerifyEmailCommand,
+    email_might_exist,
+    remember_user_identity,
+    username_might_exist,
 )
 from src.modules.user.core.entity import User
 from src.modules.user.core.query import (
@@ -63,6 +68,16 @@ from src.modules.user.core.query import (
 from src.modules.user.core.repository import UserRepository
 from src.modules.user.core.value import AuthProvider, UserRole, UserStatus
 
+# 사용자 목록/통계 캐시 네임스페이스 (쓰기 시 버전 증가로 무효화)
+_USER_CACHE = "users"
+
+
+def _list_users_key(command: ListUsersCommand) -> str:
+    return (
+        f"{command.skip}:{command.limit}:{command.search_term}:{command.role}:{command.status}:"
+        f"{command.auth_provider}:{command.email_verified}:{command.is_active}"
+    )
+
 
 class UserService:
     """사용자 서비스"""
@@ -74,7 +89,6 @@ class UserService:
         jwt_algorithm: str = "HS256",
         jwt_access_token_expire_minutes: int = 30,
         jwt_refresh_token_expire_days: int = 7,
-        password_salt: str = "",
         bcrypt_rounds: int = 12,
     ):
         self.user_repository = user_repository
@@ -82,17 +96,20 @@ class UserService:
         self.jwt_algorithm = jwt_algorithm
         self.jwt_access_token_expire_minutes = jwt_access_token_expire_minutes
         self.jwt_refresh_token_expire_days = jwt_refresh_token_expire_days
-        self.password_context = CryptContext(
-            schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=bcrypt_rounds, bcrypt__salt=password_salt.encode() if password_salt else None
-        )
+        self.bcrypt_rounds = bcrypt_rounds
+        self.password_context = password_context(bcrypt_rounds)
 
-    def _hash_password(self, password: str) -> str:
+    async def _hash_password(self, password: str) -> str:
         """비밀번호 해싱"""
-        return self.password_context.hash(password)
+        return await hash_password(password, self.bcrypt_rounds)
 
-    def _verify_password(self, plain_password: str, hashed_password: str) -> bool:
+    async def _verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """비밀번호 검증"""
-        return self.password_context.verify(plain_password, hashed_password)
+        return await verify_password(plain_password, hashed_password, self.bcrypt_rounds)
+
+    def _needs_rehash(self, hashed_password: str) -> bool:
+        """현재 cost보다 낮은 해시인지 확인"""
+        return self.password_context.needs_update(hashed_password)
 
     def _create_access_token(self, data: dict) -> str:
         """액세스 토큰 생성"""
@@ -140,20 +157,20 @@ class UserService:
             updated_at=user.updated_at,
         )
 
-    def create_user(self, command: CreateUserCommand) -> UserRegistrationResponse:
+    async def create_user(self, command: CreateUserCommand) -> UserRegistrationResponse:
         """사용자 생성"""
         # 이메일 중복 확인
-        if self.user_repository.exists_by_email(command.email):
-            raise ValueError("이미 존재하는 이메일입니다.")
+        if await self.user_repository.exists_by_email(command.email):
+            raise DomainValidationError("이미 존재하는 이메일입니다.")
 
         # 사용자명 중복 확인
-        if self.user_repository.exists_by_username(command.username):
-            raise ValueError("이미 존재하는 사용자명입니다.")
+        if await self.user_repository.exists_by_username(command.username):
+            raise DomainValidationError("이미 존재하는 사용자명입니다.")
 
         # 비밀번호 해싱
         password_hash = None
         if command.password:
-            password_hash = self._hash_password(command.password)
+            password_hash = await self._hash_password(command.password)
 
         # 이메일 인증 토큰 생성
         email_verification_token = None
@@ -183,7 +200,9 @@ class UserService:
         if email_verification_token:
             user.set_email_verification_token(email_verification_token, email_verification_expires)
 
-        saved_user = self.user_repository.save(user)
+        saved_user = await self.user_repository.save(user)
+        await invalidate(_USER_CACHE)
+        await remember_user_identity(saved_user.email, saved_user.username)
 
         return UserRegistrationResponse(
             user_id=saved_user.id,
@@ -191,21 +210,21 @@ class UserService:
             username=saved_user.username,
         )
 
-    def update_user(self, command: UpdateUserCommand) -> UserUpdateResponse:
+    async def update_user(self, command: UpdateUserCommand) -> UserUpdateResponse:
         """사용자 정보 업데이트"""
-        user = self.user_repository.find_by_id(command.user_id)
+        user = await self.user_repository.find_by_id(command.user_id)
         if not user:
-            raise ValueError("사용자를 찾을 수 없습니다.")
+            raise NotFoundError("사용자를 찾을 수 없습니다.")
 
         # 이메일 중복 확인 (다른 사용자가 사용 중인지)
         if command.email and command.email != user.email:
-            if self.user_repository.exists_by_email(command.email):
-                raise ValueError("이미 존재하는 이메일입니다.")
+            if await self.user_repository.exists_by_email(command.email):
+                raise DomainValidationError("이미 존재하는 이메일입니다.")
 
         # 사용자명 중복 확인 (다른 사용자가 사용 중인지)
         if command.username and command.username != user.username:
-            if self.user_repository.exists_by_username(command.username):
-                raise ValueError("이미 존재하는 사용자명입니다.")
+            if await self.user_repository.exists_by_username(command.username):
+                raise DomainValidationError("이미 존재하는 사용자명입니다.")
 
         user.update(
             email=command.email,
@@ -221,36 +240,38 @@ class UserService:
             is_active=command.is_active,
         )
 
-        updated_user = self.user_repository.save(user)
+        updated_user = await self.user_repository.save(user)
+        await invalidate(_USER_CACHE)
+        await remember_user_identity(updated_user.email, updated_user.username)
         return UserUpdateResponse(user=self._to_user_response(updated_user))
 
-    def change_password(self, command: ChangePasswordCommand) -> PasswordChangeResponse:
+    async def change_password(self, command: ChangePasswordCommand) -> PasswordChangeResponse:
         """비밀번호 변경"""
-        user = self.user_repository.find_by_id(command.user_id)
+        user = await self.user_repository.find_by_id(command.user_id)
         if not user:
-            raise ValueError("사용자를 찾을 수 없습니다.")
+            raise NotFoundError("사용자를 찾을 수 없습니다.")
 
         if not user.password_hash:
-            raise ValueError("OAuth 사용자는 비밀번호를 변경할 수 없습니다.")
+            raise DomainValidationError("OAuth 사용자는 비밀번호를 변경할 수 없습니다.")
 
-        if not self._verify_password(command.current_password, user.password_hash):
-            raise ValueError("현재 비밀번호가 올바르지 않습니다.")
+        if not await self._verify_password(command.current_password, user.password_hash):
+            raise DomainValidationError("현재 비밀번호가 올바르지 않습니다.")
 
-        new_password_hash = self._hash_password(command.new_password)
+        new_password_hash = await self._hash_password(command.new_password)
         user.update_password(new_password_hash)
-        self.user_repository.save(user)
+        await self.user_repository.save(user)
 
         return PasswordChangeResponse(success=True, message="비밀번호가 변경되었습니다.")
 
-    def reset_password(self, command: ResetPasswordCommand) -> PasswordResetResponse:
+    async def reset_password(self, command: ResetPasswordCommand) -> PasswordResetResponse:
         """비밀번호 재설정 요청"""
-        user = self.user_repository.find_by_email(command.email)
+        user = await self.user_repository.find_by_email(command.email)
         if not user:
             # 보안상 사용자가 존재하지 않아도 성공 응답
             return PasswordResetResponse(email=command.email)
 
         if user.auth_provider != AuthProvider.EMAIL:
-            raise ValueError("OAuth 사용자는 비밀번호 재설정을 사용할 수 없습니다.")
+            raise DomainValidationError("OAuth 사용자는 비밀번호 재설정을 사용할 수 없습니다.")
 
         # 비밀번호 재설정 토큰 생성 및 저장
         reset_token = self._create_password_reset_token()
@@ -264,9 +285,9 @@ class UserService:
         # TODO: 토큰 검증 및 비밀번호 업데이트 로직 구현
         return PasswordResetConfirmResponse(success=True, message="비밀번호가 재설정되었습니다.")
 
-    def verify_email(self, command: VerifyEmailCommand) -> EmailVerificationResponse:
+    async def verify_email(self, command: VerifyEmailCommand) -> EmailVerificationResponse:
         """이메일 인증"""
-        user = self.user_repository.find_by_email_verification_token(command.token)
+        user = await self.user_repository.find_by_email_verification_token(command.token)
         if not user:
             return EmailVerificationResponse(verified=False, message="유효하지 않은 토큰입니다.")
 
@@ -274,47 +295,52 @@ class UserService:
             return EmailVerificationResponse(verified=False, message="만료된 토큰입니다.")
 
         user.verify_email()
-        self.user_repository.save(user)
+        await self.user_repository.save(user)
+        await invalidate(_USER_CACHE)
 
         return EmailVerificationResponse(verified=True, message="이메일 인증이 완료되었습니다.")
 
-    def send_email_verification(self, command: SendEmailVerificationCommand) -> EmailVerificationSentResponse:
+    async def send_email_verification(self, command: SendEmailVerificationCommand) -> EmailVerificationSentResponse:
         """이메일 인증 메일 발송"""
-        user = self.user_repository.find_by_id(command.user_id)
+        user = await self.user_repository.find_by_id(command.user_id)
         if not user:
-            raise ValueError("사용자를 찾을 수 없습니다.")
+            raise NotFoundError("사용자를 찾을 수 없습니다.")
 
         if user.email_verified:
-            raise ValueError("이미 인증된 이메일입니다.")
+            raise DomainValidationError("이미 인증된 이메일입니다.")
 
         # 새로운 인증 토큰 생성
         token = self._create_email_verification_token()
         expires = datetime.utcnow() + timedelta(hours=24)
         user.set_email_verification_token(token, expires)
-        self.user_repository.save(user)
+        await self.user_repository.save(user)
 
         # TODO: 이메일 발송 로직 구현
 
         return EmailVerificationSentResponse(user_id=user.id)
 
-    def login(self, command: LoginCommand) -> UserLoginResponse:
+    async def login(self, command: LoginCommand) -> UserLoginResponse:
         """이메일 로그인"""
-        user = self.user_repository.find_by_email(command.email)
+        user = await self.user_repository.find_by_email(command.email)
         if not user:
-            raise ValueError("이메일 또는 비밀번호가 올바르지 않습니다.")
+            raise DomainValidationError("이메일 또는 비밀번호가 올바르지 않습니다.")
 
         if not user.password_hash:
-            raise ValueError("OAuth 계정입니다. 소셜 로그인을 사용해주세요.")
+            raise DomainValidationError("OAuth 계정입니다. 소셜 로그인을 사용해주세요.")
 
-        if not self._verify_password(command.password, user.password_hash):
-            raise ValueError("이메일 또는 비밀번호가 올바르지 않습니다.")
+        if not await self._verify_password(command.password, user.password_hash):
+            raise DomainValidationError("이메일 또는 비밀번호가 올바르지 않습니다.")
 
         if not user.is_active:
-            raise ValueError("비활성화된 계정입니다.")
+            raise DomainValidationError("비활성화된 계정입니다.")
+
+        # 보정된 cost보다 낮은 해시는 로그인 시 재해싱
+        if self._needs_rehash(user.password_hash):
+            user.update_password(await self._hash_password(command.password))
 
         # 마지막 로그인 정보 업데이트
         user.update_last_login(command.ip_address)
-        self.user_repository.save(user)
+        await self.user_repository.save(user)
 
         # JWT 토큰 생성
         access_token = self._create_access_token({"sub": user.id})
@@ -335,10 +361,10 @@ class UserService:
 
         return UserLoginResponse(user=auth_response)
 
-    def oauth_login(self, command: OAuthLoginCommand) -> OAuthLoginResponse:
+    async def oauth_login(self, command: OAuthLoginCommand) -> OAuthLoginResponse:
         """OAuth 로그인"""
         # 기존 사용자 확인
-        user = self.user_repository.find_by_auth_provider_id(command.provider, command.provider_id)
+        user = await self.user_repository.find_by_auth_provider_id(command.provider, command.provider_id)
         is_new_user = False
 
         if not user:
@@ -360,7 +386,10 @@ class UserService:
 
         # 마지막 로그인 정보 업데이트
         user.update_last_login(command.ip_address)
-        saved_user = self.user_repository.save(user)
+        saved_user = await self.user_repository.save(user)
+        await invalidate(_USER_CACHE)
+        if is_new_user:
+            await remember_user_identity(saved_user.email, saved_user.username)
 
         # JWT 토큰 생성
         access_token = self._create_access_token({"sub": saved_user.id})
@@ -387,111 +416,120 @@ class UserService:
         # TODO: 토큰 블랙리스트 처리 로직 구현
         return UserLogoutResponse()
 
-    def activate_user(self, command: ActivateUserCommand) -> UserActivationResponse:
+    async def activate_user(self, command: ActivateUserCommand) -> UserActivationResponse:
         """사용자 활성화"""
-        user = self.user_repository.find_by_id(command.user_id)
+        user = await self.user_repository.find_by_id(command.user_id)
         if not user:
-            raise ValueError("사용자를 찾을 수 없습니다.")
+            raise NotFoundError("사용자를 찾을 수 없습니다.")
 
         user.activate()
-        self.user_repository.save(user)
+        await self.user_repository.save(user)
+        await invalidate(_USER_CACHE)
 
         return UserActivationResponse(user_id=user.id)
 
-    def deactivate_user(self, command: DeactivateUserCommand) -> UserDeactivationResponse:
+    async def deactivate_user(self, command: DeactivateUserCommand) -> UserDeactivationResponse:
         """사용자 비활성화"""
-        user = self.user_repository.find_by_id(command.user_id)
+        user = await self.user_repository.find_by_id(command.user_id)
         if not user:
-            raise ValueError("사용자를 찾을 수 없습니다.")
+            raise NotFoundError("사용자를 찾을 수 없습니다.")
 
         user.deactivate()
-        self.user_repository.save(user)
+        await self.user_repository.save(user)
+        await invalidate(_USER_CACHE)
 
         return UserDeactivationResponse(user_id=user.id)
 
-    def suspend_user(self, command: SuspendUserCommand) -> UserSuspensionResponse:
+    async def suspend_user(self, command: SuspendUserCommand) -> UserSuspensionResponse:
         """사용자 정지"""
-        user = self.user_repository.find_by_id(command.user_id)
+        user = await self.user_repository.find_by_id(command.user_id)
         if not user:
-            raise ValueError("사용자를 찾을 수 없습니다.")
+            raise NotFoundError("사용자를 찾을 수 없습니다.")
 
         user.suspend()
-        self.user_repository.save(user)
+        await self.user_repository.save(user)
+        await invalidate(_USER_CACHE)
 
         return UserSuspensionResponse(user_id=user.id, reason=command.reason)
 
-    def delete_user(self, command: DeleteUserCommand) -> UserDeleteResponse:
+    async def delete_user(self, command: DeleteUserCommand) -> UserDeleteResponse:
         """사용자 삭제"""
         if command.hard_delete:
             # 하드 삭제
-            success = self.user_repository.delete(command.user_id)
+            success = await self.user_repository.delete(command.user_id)
             if not success:
-                raise ValueError("사용자를 찾을 수 없습니다.")
+                raise NotFoundError("사용자를 찾을 수 없습니다.")
         else:
             # 소프트 삭제
-            user = self.user_repository.find_by_id(command.user_id)
+            user = await self.user_repository.find_by_id(command.user_id)
             if not user:
-                raise ValueError("사용자를 찾을 수 없습니다.")
+                raise NotFoundError("사용자를 찾을 수 없습니다.")
             user.delete()
-            self.user_repository.save(user)
+            await self.user_repository.save(user)
 
+        await invalidate(_USER_CACHE)
         return UserDeleteResponse(user_id=command.user_id)
 
-    def promote_to_admin(self, command: PromoteToAdminCommand) -> UserPromotionResponse:
+    async def promote_to_admin(self, command: PromoteToAdminCommand) -> UserPromotionResponse:
         """관리자로 승격"""
-        user = self.user_repository.find_by_id(command.user_id)
+        user = await self.user_repository.find_by_id(command.user_id)
         if not user:
-            raise ValueError("사용자를 찾을 수 없습니다.")
+            raise NotFoundError("사용자를 찾을 수 없습니다.")
 
         user.promote_to_admin()
-        self.user_repository.save(user)
+        await self.user_repository.save(user)
+        await invalidate(_USER_CACHE)
 
         return UserPromotionResponse(user_id=user.id, new_role=user.user_role)
 
-    def demote_to_user(self, command: DemoteToUserCommand) -> UserDemotionResponse:
+    async def demote_to_user(self, command: DemoteToUserCommand) -> UserDemotionResponse:
         """일반 사용자로 강등"""
-        user = self.user_repository.find_by_id(command.user_id)
+        user = await self.user_repository.find_by_id(command.user_id)
         if not user:
-            raise ValueError("사용자를 찾을 수 없습니다.")
+            raise NotFoundError("사용자를 찾을 수 없습니다.")
 
         user.demote_to_user()
-        self.user_repository.save(user)
+        await self.user_repository.save(user)
+        await invalidate(_USER_CACHE)
 
         return UserDemotionResponse(user_id=user.id, new_role=user.user_role)
 
-    def check_email_exists(self, command: CheckEmailExistsCommand) -> UserExistsResponse:
+    async def check_email_exists(self, command: CheckEmailExistsCommand) -> UserExistsResponse:
         """이메일 존재 여부 확인"""
-        exists = self.user_repository.exists_by_email(command.email)
+        exists = await email_might_exist(command.email) and await self.user_repository.exists_by_email(command.email)
         return UserExistsResponse(exists=exists)
 
-    def check_username_exists(self, command: CheckUsernameExistsCommand) -> UserExistsResponse:
+    async def check_username_exists(self, command: CheckUsernameExistsCommand) -> UserExistsResponse:
         """사용자명 존재 여부 확인"""
-        exists = self.user_repository.exists_by_username(command.username)
+        exists = await username_might_exist(command.username) and await self.user_repository.exists_by_username(
+            command.username
+        )
         return UserExistsResponse(exists=exists)
 
-    def find_user_by_id(self, command: FindUserByIdCommand) -> Optional[UserResponse]:
+    async def find_user_by_id(self, command: FindUserByIdCommand) -> Optional[UserResponse]:
         """ID로 사용자 조회"""
-        user = self.user_repository.find_by_id(command.user_id)
+        user = await self.user_repository.find_by_id(command.user_id)
         return self._to_user_response(user) if user else None
 
-    def find_user_by_email(self, command: FindUserByEmailCommand) -> Optional[UserResponse]:
+    async def find_user_by_email(self, command: FindUserByEmailCommand) -> Optional[UserResponse]:
         """이메일로 사용자 조회"""
-        user = self.user_repository.find_by_email(command.email)
+        user = await self.user_repository.find_by_email(command.email)
         return self._to_user_response(user) if user else None
 
-    def find_user_by_username(self, command: FindUserByUsernameCommand) -> Optional[UserResponse]:
+    async def find_user_by_username(self, command: FindUserByUsernameCommand) -> Optional[UserResponse]:
         """사용자명으로 사용자 조회"""
-        user = self.user_repository.find_by_username(command.username)
+        user = await self.user_repository.find_by_username(command.username)
         return self._to_user_response(user) if user else None
 
-    def find_user_by_oauth(self, command: FindUserByOAuthCommand) -> Optional[UserResponse]:
+    async def find_user_by_oauth(self, command: FindUserByOAuthCommand) -> Optional[UserResponse]:
         """OAuth 제공자 ID로 사용자 조회"""
-        user = self.user_repository.find_by_auth_provider_id(command.provider, command.provider_id)
+        user = await self.user_repository.find_by_auth_provider_id(command.provider, command.provider_id)
         return self._to_user_response(user) if user else None
 
-    def list_users(self, command: ListUsersCommand) -> UserListResponse:
+    @cache_aside(_USER_CACHE, UserListResponse, key_fn=_list_users_key)
+    async def list_users(self, command: ListUsersCommand) -> UserListResponse:
         """사용자 목록 조회"""
-        users = self.user_repository.search_users(
+        users = await self.user_repository.search_users(
             search_term=command.search_term,
             role=command.role,
             status=command.status,
@@ -513,50 +551,27 @@ class UserService:
             limit=command.limit,
         )
 
-    def list_admins(self, command: ListAdminsCommand) -> UserListResponse:
+    async def list_admins(self, command: ListAdminsCommand) -> UserListResponse:
         """관리자 목록 조회"""
-        users = self.user_repository.find_admins()
-        user_responses = [self._to_user_response(user) for user in users]
-
-        return UserListResponse(
-            users=user_responses,
-            total_count=len(user_responses),
-            skip=command.skip,
-            limit=command.limit,
-        )
+        return await self.list_users(ListUsersCommand(skip=command.skip, limit=command.limit, role=UserRole.ADMIN))
 
-    def list_active_users(self, command: ListActiveUsersCommand) -> UserListResponse:
+    async def list_active_users(self, command: ListActiveUsersCommand) -> UserListResponse:
         """활성 사용자 목록 조회"""
-        users = self.user_repository.find_active_users()
-        user_responses = [self._to_user_response(user) for user in users]
-
-        return UserListResponse(
-            users=user_responses,
-            total_count=len(user_responses),
-            skip=command.skip,
-            limit=command.limit,
-        )
+        return await self.list_users(ListUsersCommand(skip=command.skip, limit=command.limit, is_active=True))
 
-    def list_verified_users(self, command: ListVerifiedUsersCommand) -> UserListResponse:
+    async def list_verified_users(self, command: ListVerifiedUsersCommand) -> UserListResponse:
         """이메일 인증 완료된 사용자 목록 조회"""
-        users = self.user_repository.find_verified_users()
-        user_responses = [self._to_user_response(user) for user in users]
-
-        return UserListResponse(
-            users=user_responses,
-            total_count=len(user_responses),
-            skip=command.skip,
-            limit=command.limit,
-        )
+        return await self.list_users(ListUsersCommand(skip=command.skip, limit=command.limit, email_verified=True))
 
-    def get_user_statistics(self, command: GetUserStatisticsCommand) -> UserStatisticsResponse:
+    @cache_aside(_USER_CACHE, UserStatisticsResponse, ttl=60)
+    async def get_user_statistics(self, command: GetUserStatisticsCommand) -> UserStatisticsResponse:
         """사용자 통계 조회"""
-        total_users = self.user_repository.find_all()
-        active_users = self.user_repository.find_by_status(UserStatus.ACTIVE)
-        pending_users = self.user_repository.find_by_status(UserStatus.PENDING)
-        suspended_users = self.user_repository.find_by_status(UserStatus.SUSPENDED)
-        deleted_users = self.user_repository.find_by_status(UserStatus.DELETED)
-        admin_users = self.user_repository.find_by_role(UserRole.ADMIN)
+        total_users = await self.user_repository.find_all()
+        active_users = await self.user_repository.find_by_status(UserStatus.ACTIVE)
+        pending_users = await self.user_repository.find_by_status(UserStatus.PENDING)
+        suspended_users = await self.user_repository.find_by_status(UserStatus.SUSPENDED)
+        deleted_users = await self.user_repository.find_by_status(UserStatus.DELETED)
+        admin_users = await self.user_repository.find_by_role(UserRole.ADMIN)
 
         verified_users = [user for user in total_users if user.email_verified]
         unverified_users = [user for user in total_users if not user.email_verified]
@@ -587,24 +602,24 @@ class UserService:
         email_verified: bool = True,
     ) -> User:
         """관리자가 사용자 생성 (이메일 인증 없이)"""
-        from src.infrastructure.database import get_db_session
+        from src.infrastructure.database.postgres.config import get_async_db_session
         from src.modules.user.infrastructure.repository.repository import SQLAlchemyUserRepository
 
-        with get_db_session() as session:
+        async with get_async_db_session() as session:
             repo = SQLAlchemyUserRepository(session)
 
             # 이메일 중복 확인
-            if repo.exists_by_email(email):
-                raise ValueError("이미 존재하는 이메일입니다.")
+            if await repo.exists_by_email(email):
+                raise DomainValidationError("이미 존재하는 이메일입니다.")
 
             # 사용자명 중복 확인
-            if repo.exists_by_username(username):
-                raise ValueError("이미 존재하는 사용자명입니다.")
+            if await repo.exists_by_username(username):
+                raise DomainValidationError("이미 존재하는 사용자명입니다.")
 
             # 비밀번호 해싱
             password_hash = None
             if password:
-                password_hash = self._hash_password(password)
+                password_hash = await self._hash_password(password)
 
             # 사용자 생성 (관리자는 이메일 인증 없이도 생성 가능)
             user = User.create(
@@ -625,7 +640,10 @@ class UserService:
             if email_verified:
                 user.verify_email()
 
-            return repo.save(user)
+            saved_user = await repo.save(user)
+            await invalidate(_USER_CACHE)
+            await remember_user_identity(saved_user.email, saved_user.username)
+            return saved_user
 
     async def update_user_by_admin(
         self,
@@ -641,23 +659,23 @@ class UserService:
         email_verified: Optional[bool] = None,
     ) -> Optional[User]:
         """관리자가 사용자 정보 수정"""
-        from src.infrastructure.database import get_db_session
+        from src.infrastructure.database.postgres.config import get_async_db_session
         from src.modules.user.infrastructure.repository.repository import SQLAlchemyUserRepository
 
-        with get_db_session() as session:
+        async with get_async_db_session() as session:
             repo = SQLAlchemyUserRepository(session)
 
-            user = repo.find_by_id(user_id)
+            user = await repo.find_by_id(user_id)
             if not user:
                 return None
 
             # 이메일 중복 확인 (다른 사용자가 사용 중인지)
-            if email and email != user.email and repo.exists_by_email(email):
-                raise ValueError("이미 존재하는 이메일입니다.")
+            if email and email != user.email and await repo.exists_by_email(email):
+                raise DomainValidationError("이미 존재하는 이메일입니다.")
 
             # 사용자명 중복 확인 (다른 사용자가 사용 중인지)
-            if username and username != user.username and repo.exists_by_username(username):
-                raise ValueError("이미 존재하는 사용자명입니다.")
+            if username and username != user.username and await repo.exists_by_username(username):
+                raise DomainValidationError("이미 존재하는 사용자명입니다.")
 
             # 정보 업데이트
             user.update(
@@ -678,80 +696,92 @@ class UserService:
                 elif not email_verified and user.email_verified:
                     user.email_verified = False
 
-            return repo.save(user)
+            saved_user = await repo.save(user)
+            await invalidate(_USER_CACHE)
+            await remember_user_identity(saved_user.email, saved_user.username)
+            return saved_user
 
     async def delete_user_by_admin(self, user_id: str) -> bool:
         """관리자가 사용자 삭제"""
-        from src.infrastructure.database import get_db_session
+        from src.infrastructure.database.postgres.config import get_async_db_session
         from src.modules.user.infrastructure.repository.repository import SQLAlchemyUserRepository
 
-        with get_db_session() as session:
+        async with get_async_db_session() as session:
             repo = SQLAlchemyUserRepository(session)
 
-            user = repo.find_by_id(user_id)
+            user = await repo.find_by_id(user_id)
             if not user:
                 return False
 
             user.delete()
-            repo.save(user)
+            await repo.save(user)
+            await invalidate(_USER_CACHE)
             return True
 
     async def activate_user_by_admin(self, user_id: str) -> Optional[User]:
         """관리자가 사용자 활성화"""
-        from src.infrastructure.database import get_db_session
+        from src.infrastructure.database.postgres.config import get_async_db_session
         from src.modules.user.infrastructure.repository.repository import SQLAlchemyUserRepository
 
-        with get_db_session() as session:
+        async with get_async_db_session() as session:
             repo = SQLAlchemyUserRepository(session)
 
-            user = repo.find_by_id(user_id)
+            user = await repo.find_by_id(user_id)
             if not user:
                 return None
 
             user.activate()
-            return repo.save(user)
+            saved_user = await repo.save(user)
+            await invalidate(_USER_CACHE)
+            return saved_user
 
     async def suspend_user_by_admin(self, user_id: str) -> Optional[User]:
         """관리자가 사용자 정지"""
-        from src.infrastructure.database import get_db_session
+        from src.infrastructure.database.postgres.config import get_async_db_session
         from src.modules.user.infrastructure.repository.repository import SQLAlchemyUserRepository
 
-        with get_db_session() as session:
+        async with get_async_db_session() as session:
             repo = SQLAlchemyUserRepository(session)
 
-            user = repo.find_by_id(user_id)
+            user = await repo.find_by_id(user_id)
             if not user:
                 return None
 
             user.suspend()
-            return repo.save(user)
+            saved_user = await repo.save(user)
+            await invalidate(_USER_CACHE)
+            return saved_user
 
     async def promote_to_admin(self, user_id: str) -> Optional[User]:
         """관리자가 사용자를 관리자로 승격"""
-        from src.infrastructure.database import get_db_session
+        from src.infrastructure.database.postgres.config import get_async_db_session
         from src.modules.user.infrastructure.repository.repository import SQLAlchemyUserRepository
 
-        with get_db_session() as session:
+        async with get_async_db_session() as session:
             repo = SQLAlchemyUserRepository(session)
 
-            user = repo.find_by_id(user_id)
+            user = await repo.find_by_id(user_id)
             if not user:
                 return None
 
             user.promote_to_admin()
-            return repo.save(user)
+            saved_user = await repo.save(user)
+            await invalidate(_USER_CACHE)
+            return saved_user
 
     async def demote_to_user(self, user_id: str) -> Optional[User]:
         """관리자가 관리자를 일반 사용자로 강등"""
-        from src.infrastructure.database import get_db_session
+        from src.infrastructure.database.postgres.config import get_async_db_session
         from src.modules.user.infrastructure.repository.repository import SQLAlchemyUserRepository
 
-        with get_db_session() as session:
+        async with get_async_db_session() as session:
             repo = SQLAlchemyUserRepository(session)
 
-            user = repo.find_by_id(user_id)
+            user = await repo.find_by_id(user_id)
             if not user:
                 return None
 
             user.demote_to_user()
-            return repo.save(user)
+            saved_user = await repo.save(user)
+            await invalidate(_USER_CACHE)
+            return saved_user
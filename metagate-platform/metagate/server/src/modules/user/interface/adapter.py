@@ -2,6 +2,8 @@ from typing import Optional
 
 from pydantic import BaseModel
 
+from src.modules.user.core.value import AuthProvider
+
 
 class UserPaginationQuery(BaseModel):
     pass
@@ -16,14 +18,17 @@ class UserRegisterAdapter(BaseModel):
     username: str
     password: str
 
-    class Config:
-        json_schema_extra = {
+    model_config = {
+        "extra": "ignore",
+        "frozen": True,
+        "json_schema_extra": {
             "example": {
                 "email": "example@gmail.com",
                 "username": "example_user",
                 "password": "example_password"
             }
-        }
+        },
+    }
 
 
 class UserUpdateAdapter(BaseModel):
@@ -31,46 +36,77 @@ class UserUpdateAdapter(BaseModel):
     username: Optional[str] = None
     password: Optional[str] = None
 
-    class Config:
-        json_schema_extra = {
+    model_config = {
+        "extra": "ignore",
+        "frozen": True,
+        "json_schema_extra": {
             "example": {
                 "email": "example@gmail.com",
                 "username": "example_user",
                 "password": "example_password"
             }
-        }
+        },
+    }
 
 
 class UserDeleteAdapter(BaseModel):
     id: Optional[int] = None
     email: Optional[str] = None
 
-    class Config:
-        json_schema_extra = {
+    model_config = {
+        "extra": "ignore",
+        "frozen": True,
+        "json_schema_extra": {
             "example": {
                 "id": 1,
                 "email": "example@gmail.com"
             }
-        }
+        },
+    }
 
 class UserLoginAdapter(BaseModel):
     email: str
     password: str
 
-    class Config:
-        json_schema_extra = {
+    model_config = {
+        "extra": "ignore",
+        "frozen": True,
+        "json_schema_extra": {
             "example": {
                 "email": "wjdrlrkdl3@gmail.com",
                 "password": "example_password"
             }
-        }
+        },
+    }
 
 class UserLogoutAdapter(BaseModel):
     token: str
 
-    class Config:
-        json_schema_extra = {
+    model_config = {
+        "extra": "ignore",
+        "frozen": True,
+        "json_schema_extra": {
             "example": {
                 "token": "example_token"
             }
-        }
\ No newline at end of file
+        },
+    }
+
+class UserOAuthLoginRequest(BaseModel):
+    provider: AuthProvider
+    provider_id: str
+    email: str
+    username: str
+
+    model_config = {
+        "extra": "ignore",
+        "frozen": True,
+        "json_schema_extra": {
+            "example": {
+                "provider": "google",
+                "provider_id": "1234567890",
+                "email": "example@gmail.com",
+                "username": "example_user"
+            }
+        },
+    }
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Annotated, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
@@ -17,6 +17,9 @@ from src.modules.user.interface.adapter import (
 # 관리자 전용 라우터
 admin = APIRouter(prefix="/admin/users", tags=["Admin - User Management"])
 
+# 공통 오류 메시지 (예외 인스턴스는 요청 간에 공유하면 traceback이 누적되므로 메시지만 공유)
+_USER_NOT_FOUND = "사용자를 찾을 수 없습니다."
+
 
 # 관리자 권한 확인을 위한 의존성 (TODO: 실제 JWT 토큰 검증 로직 구현 필요)
 async def verify_admin_permission():
@@ -37,8 +40,10 @@ class AdminUserStatisticsSchema(BaseModel):
     verified_users: int = Field(..., description="이메일 인증 완료 사용자 수")
     unverified_users: int = Field(..., description="이메일 미인증 사용자 수")
 
-    class Config:
-        schema_extra = {
+    model_config = {
+        "extra": "ignore",
+        "frozen": True,
+        "json_schema_extra": {
             "example": {
                 "total_users": 150,
                 "active_users": 120,
@@ -49,7 +54,8 @@ class AdminUserStatisticsSchema(BaseModel):
                 "verified_users": 130,
                 "unverified_users": 20,
             }
-        }
+        },
+    }
 
 
 class AdminUserSearchSchema(BaseModel):
@@ -63,8 +69,10 @@ class AdminUserSearchSchema(BaseModel):
     last_login_after: Optional[datetime] = Field(None, description="마지막 로그인 시작")
     last_login_before: Optional[datetime] = Field(None, description="마지막 로그인 종료")
 
-    class Config:
-        schema_extra = {
+    model_config = {
+        "extra": "ignore",
+        "frozen": True,
+        "json_schema_extra": {
             "example": {
                 "search_term": "john",
                 "user_role": "USER",
@@ -74,20 +82,31 @@ class AdminUserSearchSchema(BaseModel):
                 "created_after": "2024-01-01T00:00:00",
                 "created_before": "2024-12-31T23:59:59",
             }
-        }
+        },
+    }
+
+
+class UserListFilter(AdminUserSearchSchema):
+    """사용자 검색 쿼리 파라미터 (단일 모델로 한 번에 검증)"""
+
+    skip: int = Field(0, ge=0, description="건너뛸 레코드 수")
+    limit: int = Field(100, ge=1, le=1000, description="조회할 레코드 수")
 
 
 class AdminUserBulkActionSchema(BaseModel):
     user_ids: List[str] = Field(..., description="대상 사용자 ID 목록", min_items=1)
     action: str = Field(..., description="수행할 액션", example="activate")
 
-    class Config:
-        schema_extra = {
+    model_config = {
+        "extra": "ignore",
+        "frozen": True,
+        "json_schema_extra": {
             "example": {
                 "user_ids": ["user_123", "user_456", "user_789"],
                 "action": "activate",
             }
-        }
+        },
+    }
 
 
 # 관리자 전용 API 엔드포인트들
@@ -131,42 +150,38 @@ async def get_user_statistics(
     _: bool = Depends(verify_admin_permission),
 ):
     """사용자 통계 조회"""
-    try:
-        query = UserQuery()
-        service = UserService()
-
-        # 각 상태별 사용자 수 조회
-        total_users = await query.get_all(limit=10000)
-        active_users = await query.get_by_status(UserStatus.ACTIVE, limit=10000)
-        pending_users = await query.get_by_status(UserStatus.PENDING, limit=10000)
-        suspended_users = await query.get_by_status(UserStatus.SUSPENDED, limit=10000)
-        deleted_users = await query.get_by_status(UserStatus.DELETED, limit=10000)
-
-        # 역할별 사용자 수 조회
-        admin_users = await query.get_by_role(UserRole.ADMIN, limit=10000)
-
-        # 이메일 인증 상태별 사용자 수 (실제 구현에서는 별도 쿼리 필요)
-        verified_count = 0
-        unverified_count = 0
-        for user in total_users:
-            if user.email_verified:
-                verified_count += 1
-            else:
-                unverified_count += 1
-
-        return AdminUserStatisticsSchema(
-            total_users=len(total_users),
-            active_users=len(active_users),
-            pending_users=len(pending_users),
-            suspended_users=len(suspended_users),
-            deleted_users=len(deleted_users),
-            admin_users=len(admin_users),
-            verified_users=verified_count,
-            unverified_users=unverified_count,
-        )
-
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"통계 조회 실패: {str(e)}")
+    query = UserQuery()
+    service = UserService()
+
+    # 각 상태별 사용자 수 조회
+    total_users = await query.get_all(limit=10000)
+    active_users = await query.get_by_status(UserStatus.ACTIVE, limit=10000)
+    pending_users = await query.get_by_status(UserStatus.PENDING, limit=10000)
+    suspended_users = await query.get_by_status(UserStatus.SUSPENDED, limit=10000)
+    deleted_users = await query.get_by_status(UserStatus.DELETED, limit=10000)
+
+    # 역할별 사용자 수 조회
+    admin_users = await query.get_by_role(UserRole.ADMIN, limit=10000)
+
+    # 이메일 인증 상태별 사용자 수 (실제 구현에서는 별도 쿼리 필요)
+    verified_count = 0
+    unverified_count = 0
+    for user in total_users:
+        if user.email_verified:
+            verified_count += 1
+        else:
+            unverified_count += 1
+
+    return AdminUserStatisticsSchema(
+        total_users=len(total_users),
+        active_users=len(active_users),
+        pending_users=len(pending_users),
+        suspended_users=len(suspended_users),
+        deleted_users=len(deleted_users),
+        admin_users=len(admin_users),
+        verified_users=verified_count,
+        unverified_users=unverified_count,
+    )
 
 
 @admin.get(
@@ -210,74 +225,60 @@ async def get_user_statistics(
     },
 )
 async def search_users(
-    search_term: Optional[str] = Query(None, description="검색어"),
-    user_role: Optional[UserRole] = Query(None, description="사용자 역할"),
-    user_status: Optional[UserStatus] = Query(None, description="사용자 상태"),
-    email_verified: Optional[bool] = Query(None, description="이메일 인증 여부"),
-    is_active: Optional[bool] = Query(None, description="활성 상태"),
-    created_after: Optional[datetime] = Query(None, description="생성일 시작"),
-    created_before: Optional[datetime] = Query(None, description="생성일 종료"),
-    last_login_after: Optional[datetime] = Query(None, description="마지막 로그인 시작"),
-    last_login_before: Optional[datetime] = Query(None, description="마지막 로그인 종료"),
-    skip: int = Query(0, ge=0, description="건너뛸 레코드 수"),
-    limit: int = Query(100, ge=1, le=1000, description="조회할 레코드 수"),
+    filters: Annotated[UserListFilter, Query()],
     _: bool = Depends(verify_admin_permission),
 ):
     """사용자 고급 검색"""
-    try:
-        query = UserQuery()
-
-        # TODO: 실제 검색 로직 구현 (현재는 기본 조회만)
-        users = await query.get_all(skip=skip, limit=limit)
-
-        # 필터링 로직 (실제로는 데이터베이스 레벨에서 처리해야 함)
-        filtered_users = []
-        for user in users:
-            # 검색어 필터
-            if search_term:
-                search_lower = search_term.lower()
-                if not (
-                    search_lower in user.email.lower()
-                    or search_lower in user.username.lower()
-                    or (user.first_name and search_lower in user.first_name.lower())
-                    or (user.last_name and search_lower in user.last_name.lower())
-                ):
-                    continue
-
-            # 역할 필터
-            if user_role and user.user_role != user_role:
+    query = UserQuery()
+
+    # TODO: 실제 검색 로직 구현 (현재는 기본 조회만)
+    users = await query.get_all(skip=filters.skip, limit=filters.limit)
+
+    # 필터링 로직 (실제로는 데이터베이스 레벨에서 처리해야 함)
+    filtered_users = []
+    for user in users:
+        # 검색어 필터
+        if filters.search_term:
+            search_lower = filters.search_term.lower()
+            if not (
+                search_lower in user.email.lower()
+                or search_lower in user.username.lower()
+                or (user.first_name and search_lower in user.first_name.lower())
+                or (user.last_name and search_lower in user.last_name.lower())
+            ):
                 continue
 
-            # 상태 필터
-            if user_status and user.user_status != user_status:
-                continue
+        # 역할 필터
+        if filters.user_role and user.user_role != filters.user_role:
+            continue
 
-            # 이메일 인증 필터
-            if email_verified is not None and user.email_verified != email_verified:
-                continue
+        # 상태 필터
+        if filters.user_status and user.user_status != filters.user_status:
+            continue
 
-            # 활성 상태 필터
-            if is_active is not None and user.is_active != is_active:
-                continue
+        # 이메일 인증 필터
+        if filters.email_verified is not None and user.email_verified != filters.email_verified:
+            continue
 
-            # 생성일 필터
-            if created_after and user.created_at < created_after:
-                continue
-            if created_before and user.created_at > created_before:
-                continue
+        # 활성 상태 필터
+        if filters.is_active is not None and user.is_active != filters.is_active:
+            continue
 
-            # 마지막 로그인 필터
-            if last_login_after and (not user.last_login_at or user.last_login_at < last_login_after):
-                continue
-            if last_login_before and (not user.last_login_at or user.last_login_at > last_login_before):
-                continue
+        # 생성일 필터
+        if filters.created_after and user.created_at < filters.created_after:
+            continue
+        if filters.created_before and user.created_at > filters.created_before:
+            continue
 
-            filtered_users.append(user)
+        # 마지막 로그인 필터
+        if filters.last_login_after and (not user.last_login_at or user.last_login_at < filters.last_login_after):
+            continue
+        if filters.last_login_before and (not user.last_login_at or user.last_login_at > filters.last_login_before):
+            continue
 
-        return [UserResponseSchema.from_orm(user) for user in filtered_users]
+        filtered_users.append(user)
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"사용자 검색 실패: {str(e)}")
+    return [UserResponseSchema.from_orm(user) for user in filtered_users]
 
 
 @admin.post(
@@ -320,29 +321,23 @@ async def create_user_by_admin(
     _: bool = Depends(verify_admin_permission),
 ):
     """관리자가 사용자 생성"""
-    try:
-        service = UserService()
-
-        # 관리자는 이메일 인증 없이도 사용자 생성 가능
-        user = await service.create_user_by_admin(
-            email=user_data.email,
-            username=user_data.username,
-            password=user_data.password,
-            first_name=user_data.first_name,
-            last_name=user_data.last_name,
-            nickname=user_data.nickname,
-            phone=user_data.phone,
-            user_role=user_data.user_role,
-            user_status=user_data.user_status,
-            email_verified=user_data.email_verified,
-        )
-
-        return UserResponseSchema.from_orm(user)
-
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"사용자 생성 실패: {str(e)}")
+    service = UserService()
+
+    # 관리자는 이메일 인증 없이도 사용자 생성 가능
+    user = await service.create_user_by_admin(
+        email=user_data.email,
+        username=user_data.username,
+        password=user_data.password,
+        first_name=user_data.first_name,
+        last_name=user_data.last_name,
+        nickname=user_data.nickname,
+        phone=user_data.phone,
+        user_role=user_data.user_role,
+        user_status=user_data.user_status,
+        email_verified=user_data.email_verified,
+    )
+
+    return UserResponseSchema.from_orm(user)
 
 
 @admin.put(
@@ -385,33 +380,25 @@ async def update_user_by_admin(
     _: bool = Depends(verify_admin_permission),
 ):
     """관리자가 사용자 정보 수정"""
-    try:
-        service = UserService()
-
-        user = await service.update_user_by_admin(
-            user_id=user_id,
-            email=user_data.email,
-            username=user_data.username,
-            first_name=user_data.first_name,
-            last_name=user_data.last_name,
-            nickname=user_data.nickname,
-            phone=user_data.phone,
-            user_role=user_data.user_role,
-            user_status=user_data.user_status,
-            email_verified=user_data.email_verified,
-        )
-
-        if not user:
-            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
-
-        return UserResponseSchema.from_orm(user)
-
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"사용자 수정 실패: {str(e)}")
+    service = UserService()
+
+    user = await service.update_user_by_admin(
+        user_id=user_id,
+        email=user_data.email,
+        username=user_data.username,
+        first_name=user_data.first_name,
+        last_name=user_data.last_name,
+        nickname=user_data.nickname,
+        phone=user_data.phone,
+        user_role=user_data.user_role,
+        user_status=user_data.user_status,
+        email_verified=user_data.email_verified,
+    )
+
+    if not user:
+        raise HTTPException(status_code=404, detail=_USER_NOT_FOUND)
+
+    return UserResponseSchema.from_orm(user)
 
 
 @admin.delete(
@@ -437,18 +424,12 @@ async def delete_user_by_admin(
     _: bool = Depends(verify_admin_permission),
 ):
     """관리자가 사용자 삭제"""
-    try:
-        service = UserService()
-
-        success = await service.delete_user_by_admin(user_id=user_id)
+    service = UserService()
 
-        if not success:
-            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+    success = await service.delete_user_by_admin(user_id=user_id)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"사용자 삭제 실패: {str(e)}")
+    if not success:
+        raise HTTPException(status_code=404, detail=_USER_NOT_FOUND)
 
 
 @admin.post(
@@ -467,20 +448,14 @@ async def activate_user(
     _: bool = Depends(verify_admin_permission),
 ):
     """사용자 활성화"""
-    try:
-        service = UserService()
+    service = UserService()
 
-        user = await service.activate_user_by_admin(user_id=user_id)
+    user = await service.activate_user_by_admin(user_id=user_id)
 
-        if not user:
-            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+    if not user:
+        raise HTTPException(status_code=404, detail=_USER_NOT_FOUND)
 
-        return UserResponseSchema.from_orm(user)
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"사용자 활성화 실패: {str(e)}")
+    return UserResponseSchema.from_orm(user)
 
 
 @admin.post(
@@ -499,20 +474,14 @@ async def suspend_user(
     _: bool = Depends(verify_admin_permission),
 ):
     """사용자 정지"""
-    try:
-        service = UserService()
-
-        user = await service.suspend_user_by_admin(user_id=user_id)
+    service = UserService()
 
-        if not user:
-            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+    user = await service.suspend_user_by_admin(user_id=user_id)
 
-        return UserResponseSchema.from_orm(user)
+    if not user:
+        raise HTTPException(status_code=404, detail=_USER_NOT_FOUND)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"사용자 정지 실패: {str(e)}")
+    return UserResponseSchema.from_orm(user)
 
 
 @admin.post(
@@ -531,20 +500,14 @@ async def promote_to_admin(
     _: bool = Depends(verify_admin_permission),
 ):
     """사용자를 관리자로 승격"""
-    try:
-        service = UserService()
+    service = UserService()
 
-        user = await service.promote_to_admin(user_id=user_id)
+    user = await service.promote_to_admin(user_id=user_id)
 
-        if not user:
-            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+    if not user:
+        raise HTTPException(status_code=404, detail=_USER_NOT_FOUND)
 
-        return UserResponseSchema.from_orm(user)
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"관리자 승격 실패: {str(e)}")
+    return UserResponseSchema.from_orm(user)
 
 
 @admin.post(
@@ -563,20 +526,14 @@ async def demote_to_user(
     _: bool = Depends(verify_admin_permission),
 ):
     """관리자를 일반 사용자로 강등"""
-    try:
-        service = UserService()
-
-        user = await service.demote_to_user(user_id=user_id)
+    service = UserService()
 
-        if not user:
-            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+    user = await service.demote_to_user(user_id=user_id)
 
-        return UserResponseSchema.from_orm(user)
+    if not user:
+        raise HTTPException(status_code=404, detail=_USER_NOT_FOUND)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"일반 사용자 강등 실패: {str(e)}")
+    return UserResponseSchema.from_orm(user)
 
 
 @admin.post(
@@ -615,53 +572,47 @@ async def bulk_action(
     _: bool = Depends(verify_admin_permission),
 ):
     """사용자 일괄 작업"""
-    try:
-        service = UserService()
-
-        success_count = 0
-        failed_users = []
-
-        for user_id in action_data.user_ids:
-            try:
-                if action_data.action == "activate":
-                    await service.activate_user_by_admin(user_id=user_id)
-                elif action_data.action == "suspend":
-                    await service.suspend_user_by_admin(user_id=user_id)
-                elif action_data.action == "delete":
-                    await service.delete_user_by_admin(user_id=user_id)
-                elif action_data.action == "promote":
-                    await service.promote_to_admin(user_id=user_id)
-                elif action_data.action == "demote":
-                    await service.demote_to_user(user_id=user_id)
-                else:
-                    raise HTTPException(status_code=400, detail=f"지원하지 않는 액션: {action_data.action}")
-                success_count += 1
-            except Exception:
-                failed_users.append(user_id)
-
-        failed_count = len(failed_users)
-
-        action_names = {
-            "activate": "활성화",
-            "suspend": "정지",
-            "delete": "삭제",
-            "promote": "관리자 승격",
-            "demote": "일반 사용자 강등",
-        }
-
-        action_name = action_names.get(action_data.action, action_data.action)
-
-        return {
-            "success_count": success_count,
-            "failed_count": failed_count,
-            "failed_users": failed_users,
-            "message": f"{success_count}명의 사용자가 성공적으로 {action_name}되었습니다.",
-        }
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"일괄 작업 실패: {str(e)}")
+    service = UserService()
+
+    success_count = 0
+    failed_users = []
+
+    for user_id in action_data.user_ids:
+        try:
+            if action_data.action == "activate":
+                await service.activate_user_by_admin(user_id=user_id)
+            elif action_data.action == "suspend":
+                await service.suspend_user_by_admin(user_id=user_id)
+            elif action_data.action == "delete":
+                await service.delete_user_by_admin(user_id=user_id)
+            elif action_data.action == "promote":
+                await service.promote_to_admin(user_id=user_id)
+            elif action_data.action == "demote":
+                await service.demote_to_user(user_id=user_id)
+            else:
+                raise HTTPException(status_code=400, detail=f"지원하지 않는 액션: {action_data.action}")
+            success_count += 1
+        except Exception:
+            failed_users.append(user_id)
+
+    failed_count = len(failed_users)
+
+    action_names = {
+        "activate": "활성화",
+        "suspend": "정지",
+        "delete": "삭제",
+        "promote": "관리자 승격",
+        "demote": "일반 사용자 강등",
+    }
+
+    action_name = action_names.get(action_data.action, action_data.action)
+
+    return {
+        "success_count": success_count,
+        "failed_count": failed_count,
+        "failed_users": failed_users,
+        "message": f"{success_count}명의 사용자가 성공적으로 {action_name}되었습니다.",
+    }
 
 
 @admin.get(
@@ -702,24 +653,18 @@ async def get_user_activity(
     _: bool = Depends(verify_admin_permission),
 ):
     """사용자 활동 내역 조회"""
-    try:
-        query = UserQuery()
-
-        user = await query.get_by_id(user_id)
-
-        if not user:
-            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
-
-        return {
-            "user_id": user.id,
-            "last_login_at": user.last_login_at,
-            "last_login_ip": user.last_login_ip,
-            "created_at": user.created_at,
-            "updated_at": user.updated_at,
-            "deleted_at": user.deleted_at,
-        }
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"활동 내역 조회 실패: {str(e)}")
+    query = UserQuery()
+
+    user = await query.get_by_id(user_id)
+
+    if not user:
+        raise HTTPException(status_code=404, detail=_USER_NOT_FOUND)
+
+    return {
+        "user_id": user.id,
+        "last_login_at": user.last_login_at,
+        "last_login_ip": user.last_login_ip,
+        "created_at": user.created_at,
+        "updated_at": user.updated_at,
+        "deleted_at": user.deleted_at,
+    }
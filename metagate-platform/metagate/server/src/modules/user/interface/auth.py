@@ -1,7 +1,8 @@
 from typing import Union
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 
+from src.infrastructure.security.token import TokenVerificationError
 from src.infrastructure.utils.response_model import BusinessResponse, SuccessResponse, ErrorResponse
 from src.modules.user.core.command import UserLoginUseCase, UserLogoutUseCase
 from src.modules.user.interface.adapter import UserLoginAdapter, UserLogoutAdapter
@@ -21,16 +22,18 @@ async def login(
         return BusinessResponse.failure(500, e)
 
 
-@auth.post("/logout")
+@auth.post("/logout", response_model=None)
 async def logout(
     adapter: UserLogoutAdapter,
     usecase: UserLogoutUseCase = Depends()
 ) -> Union[SuccessResponse[dict], ErrorResponse]:
     try:
         result = await usecase.execute(adapter)
-        return await BusinessResponse[dict].success(200, result)
+        return BusinessResponse[dict].success(200, result)
+    except TokenVerificationError as e:
+        raise HTTPException(status_code=401, detail=str(e), headers={"WWW-Authenticate": "Bearer"}) from e
     except Exception as e:
-        return await BusinessResponse.failure(500, e)
+        return BusinessResponse.failure(500, e)
 
 
 
@@ -1,369 +1,225 @@
-from typing import Optional
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
+from pydantic import TypeAdapter
 
+from src.infrastructure.database.postgres.config import AsyncSessionDep
+from src.infrastructure.security.password import configured_bcrypt_rounds
+from src.infrastructure.utils.response_model import ErrorResponse
 from src.modules.user.core.command import (
     FindUserByOAuthCommand,
     OAuthLoginCommand,
 )
+from src.modules.user.core.query import OAuthLoginResponse, UserResponse
 from src.modules.user.core.service import UserService
 from src.modules.user.core.value import AuthProvider
-from src.modules.user.interface.adapter import (
-    ErrorResponse,
-    UserOAuthLoginRequest,
-    UserOAuthLoginResponse,
-    UserResponse,
-)
+from src.modules.user.infrastructure.repository.repository import SQLAlchemyUserRepository
+from src.modules.user.interface.adapter import UserOAuthLoginRequest
 
-router = APIRouter(prefix="/oauth", tags=["OAuth"])
+router = APIRouter(prefix="/oauth", tags=["OAuth"], default_response_class=ORJSONResponse)
 
+# 콜백 응답 직렬화기 (UserService.oauth_login 반환 타입 기준, import 시 1회 생성, 라우트마다 응답 모델 재검증을 하지 않음)
+_LOGIN_RESPONSE_ADAPTER = TypeAdapter(OAuthLoginResponse)
 
-def get_user_service() -> UserService:
-    """UserService 의존성 주입"""
-    # TODO: 실제 의존성 주입 구현
-    from src.infrastructure.database import get_session
-    from src.modules.user.infrastructure.repository.repository import SQLAlchemyUserRepository
 
-    session = next(get_session())
-    repository = SQLAlchemyUserRepository(session)
+@dataclass(slots=True, frozen=True)
+class UserServiceConfig:
+    """UserService 설정 (JWT / 비밀번호 해싱)"""
 
-    # 환경 변수에서 설정 가져오기
-    import os
+    jwt_secret_key: str
+    jwt_algorithm: str
+    jwt_access_token_expire_minutes: int
+    jwt_refresh_token_expire_days: int
+    bcrypt_rounds: int
 
-    jwt_secret_key = os.getenv("JWT_SECRET_KEY", "your-secret-key")
-    jwt_algorithm = os.getenv("JWT_ALGORITHM", "HS256")
-    jwt_access_token_expire_minutes = int(os.getenv("JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
-    jwt_refresh_token_expire_days = int(os.getenv("JWT_REFRESH_TOKEN_EXPIRE_DAYS", "7"))
-    password_salt = os.getenv("PASSWORD_SALT", "")
-    bcrypt_rounds = int(os.getenv("BCRYPT_ROUNDS", "12"))
 
-    return UserService(
-        user_repository=repository,
-        jwt_secret_key=jwt_secret_key,
-        jwt_algorithm=jwt_algorithm,
-        jwt_access_token_expire_minutes=jwt_access_token_expire_minutes,
-        jwt_refresh_token_expire_days=jwt_refresh_token_expire_days,
-        password_salt=password_salt,
-        bcrypt_rounds=bcrypt_rounds,
+@lru_cache(maxsize=1)
+def _user_service_config() -> UserServiceConfig:
+    """환경 변수에서 UserService 설정을 읽어 1회만 생성"""
+    return UserServiceConfig(
+        jwt_secret_key=os.getenv("JWT_SECRET_KEY", "your-secret-key"),
+        jwt_algorithm=os.getenv("JWT_ALGORITHM", "HS256"),
+        jwt_access_token_expire_minutes=int(os.getenv("JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "30")),
+        jwt_refresh_token_expire_days=int(os.getenv("JWT_REFRESH_TOKEN_EXPIRE_DAYS", "7")),
+        bcrypt_rounds=configured_bcrypt_rounds(),
     )
 
 
-# 카카오 OAuth 시작
-@router.get(
-    "/kakao",
-    summary="카카오 OAuth 시작",
-    description="카카오 OAuth 인증을 시작합니다.",
-    responses={
-        302: {"description": "카카오 OAuth 페이지로 리다이렉트"},
-    },
-)
-async def kakao_oauth_start():
-    """카카오 OAuth 시작"""
-    try:
-        import os
-
-        client_id = os.getenv("KAKAO_CLIENT_ID")
-        redirect_uri = os.getenv("KAKAO_REDIRECT_URI")
-
-        if not client_id or not redirect_uri:
-            raise HTTPException(status_code=500, detail="카카오 OAuth 설정이 누락되었습니다.")
-
-        auth_url = f"https://kauth.kakao.com/oauth/authorize?client_id={client_id}&redirect_uri={redirect_uri}&response_type=code"
-        return RedirectResponse(url=auth_url)
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="카카오 OAuth 시작 중 오류가 발생했습니다.")
-
-
-# 카카오 OAuth 콜백
-@router.get(
-    "/kakao/callback",
-    summary="카카오 OAuth 콜백",
-    description="카카오 OAuth 인증 후 콜백을 처리합니다.",
-    responses={
-        200: {"description": "카카오 OAuth 로그인 성공"},
-        400: {"model": ErrorResponse, "description": "인증 실패"},
-    },
-)
-async def kakao_oauth_callback(
-    code: str = Query(..., description="인증 코드"),
-    error: Optional[str] = Query(None, description="에러 코드"),
-    user_service: UserService = Depends(get_user_service),
-) -> UserOAuthLoginResponse:
-    """카카오 OAuth 콜백"""
-    try:
-        if error:
-            raise HTTPException(status_code=400, detail=f"카카오 OAuth 인증 실패: {error}")
-
-        # TODO: 카카오 API를 통해 액세스 토큰 및 사용자 정보 획득
-        # 실제 구현에서는 카카오 API를 호출하여 사용자 정보를 가져와야 합니다.
-
-        # 임시 사용자 정보 (실제로는 카카오 API에서 가져온 정보)
-        kakao_user_info = {
-            "id": "temp_kakao_id",
-            "email": "user@example.com",
-            "username": "kakao_user",
-            "first_name": "카카오",
-            "last_name": "사용자",
-            "avatar_url": "https://example.com/avatar.jpg",
-        }
-
-        command = OAuthLoginCommand(
-            provider=AuthProvider.KAKAO,
-            provider_id=kakao_user_info["id"],
-            email=kakao_user_info["email"],
-            username=kakao_user_info["username"],
-            first_name=kakao_user_info["first_name"],
-            last_name=kakao_user_info["last_name"],
-            avatar_url=kakao_user_info["avatar_url"],
-        )
-
-        return user_service.oauth_login(command)
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="카카오 OAuth 콜백 처리 중 오류가 발생했습니다.")
-
-
-# 구글 OAuth 시작
-@router.get(
-    "/google",
-    summary="구글 OAuth 시작",
-    description="구글 OAuth 인증을 시작합니다.",
-    responses={
-        302: {"description": "구글 OAuth 페이지로 리다이렉트"},
-    },
-)
-async def google_oauth_start():
-    """구글 OAuth 시작"""
-    try:
-        import os
-
-        client_id = os.getenv("GOOGLE_CLIENT_ID")
-        redirect_uri = os.getenv("GOOGLE_REDIRECT_URI")
-
-        if not client_id or not redirect_uri:
-            raise HTTPException(status_code=500, detail="구글 OAuth 설정이 누락되었습니다.")
-
-        auth_url = f"https://accounts.google.com/o/oauth2/v2/auth?client_id={client_id}&redirect_uri={redirect_uri}&response_type=code&scope=openid%20email%20profile"
-        return RedirectResponse(url=auth_url)
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="구글 OAuth 시작 중 오류가 발생했습니다.")
-
-
-# 구글 OAuth 콜백
-@router.get(
-    "/google/callback",
-    summary="구글 OAuth 콜백",
-    description="구글 OAuth 인증 후 콜백을 처리합니다.",
-    responses={
-        200: {"description": "구글 OAuth 로그인 성공"},
-        400: {"model": ErrorResponse, "description": "인증 실패"},
-    },
-)
-async def google_oauth_callback(
-    code: str = Query(..., description="인증 코드"),
-    error: Optional[str] = Query(None, description="에러 코드"),
-    user_service: UserService = Depends(get_user_service),
-) -> UserOAuthLoginResponse:
-    """구글 OAuth 콜백"""
-    try:
-        if error:
-            raise HTTPException(status_code=400, detail=f"구글 OAuth 인증 실패: {error}")
-
-        # TODO: 구글 API를 통해 액세스 토큰 및 사용자 정보 획득
-        # 실제 구현에서는 구글 API를 호출하여 사용자 정보를 가져와야 합니다.
-
-        # 임시 사용자 정보 (실제로는 구글 API에서 가져온 정보)
-        google_user_info = {
-            "id": "temp_google_id",
-            "email": "user@example.com",
-            "username": "google_user",
-            "first_name": "구글",
-            "last_name": "사용자",
-            "avatar_url": "https://example.com/avatar.jpg",
-        }
-
-        command = OAuthLoginCommand(
-            provider=AuthProvider.GOOGLE,
-            provider_id=google_user_info["id"],
-            email=google_user_info["email"],
-            username=google_user_info["username"],
-            first_name=google_user_info["first_name"],
-            last_name=google_user_info["last_name"],
-            avatar_url=google_user_info["avatar_url"],
-        )
-
-        return user_service.oauth_login(command)
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="구글 OAuth 콜백 처리 중 오류가 발생했습니다.")
-
-
-# 네이버 OAuth 시작
-@router.get(
-    "/naver",
-    summary="네이버 OAuth 시작",
-    description="네이버 OAuth 인증을 시작합니다.",
-    responses={
-        302: {"description": "네이버 OAuth 페이지로 리다이렉트"},
-    },
-)
-async def naver_oauth_start():
-    """네이버 OAuth 시작"""
-    try:
-        import os
-
-        client_id = os.getenv("NAVER_CLIENT_ID")
-        redirect_uri = os.getenv("NAVER_REDIRECT_URI")
-
-        if not client_id or not redirect_uri:
-            raise HTTPException(status_code=500, detail="네이버 OAuth 설정이 누락되었습니다.")
-
-        auth_url = f"https://nid.naver.com/oauth2.0/authorize?client_id={client_id}&redirect_uri={redirect_uri}&response_type=code"
-        return RedirectResponse(url=auth_url)
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="네이버 OAuth 시작 중 오류가 발생했습니다.")
-
-
-# 네이버 OAuth 콜백
-@router.get(
-    "/naver/callback",
-    summary="네이버 OAuth 콜백",
-    description="네이버 OAuth 인증 후 콜백을 처리합니다.",
-    responses={
-        200: {"description": "네이버 OAuth 로그인 성공"},
-        400: {"model": ErrorResponse, "description": "인증 실패"},
-    },
-)
-async def naver_oauth_callback(
-    code: str = Query(..., description="인증 코드"),
-    error: Optional[str] = Query(None, description="에러 코드"),
-    user_service: UserService = Depends(get_user_service),
-) -> UserOAuthLoginResponse:
-    """네이버 OAuth 콜백"""
-    try:
-        if error:
-            raise HTTPException(status_code=400, detail=f"네이버 OAuth 인증 실패: {error}")
-
-        # TODO: 네이버 API를 통해 액세스 토큰 및 사용자 정보 획득
-        # 실제 구현에서는 네이버 API를 호출하여 사용자 정보를 가져와야 합니다.
-
-        # 임시 사용자 정보 (실제로는 네이버 API에서 가져온 정보)
-        naver_user_info = {
-            "id": "temp_naver_id",
-            "email": "user@example.com",
-            "username": "naver_user",
-            "first_name": "네이버",
-            "last_name": "사용자",
-            "avatar_url": "https://example.com/avatar.jpg",
-        }
-
-        command = OAuthLoginCommand(
-            provider=AuthProvider.NAVER,
-            provider_id=naver_user_info["id"],
-            email=naver_user_info["email"],
-            username=naver_user_info["username"],
-            first_name=naver_user_info["first_name"],
-            last_name=naver_user_info["last_name"],
-            avatar_url=naver_user_info["avatar_url"],
-        )
-
-        return user_service.oauth_login(command)
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="네이버 OAuth 콜백 처리 중 오류가 발생했습니다.")
-
-
-# 깃허브 OAuth 시작
-@router.get(
-    "/github",
-    summary="깃허브 OAuth 시작",
-    description="깃허브 OAuth 인증을 시작합니다.",
-    responses={
-        302: {"description": "깃허브 OAuth 페이지로 리다이렉트"},
-    },
-)
-async def github_oauth_start():
-    """깃허브 OAuth 시작"""
-    try:
-        import os
-
-        client_id = os.getenv("GITHUB_CLIENT_ID")
-        redirect_uri = os.getenv("GITHUB_REDIRECT_URI")
-
-        if not client_id or not redirect_uri:
-            raise HTTPException(status_code=500, detail="깃허브 OAuth 설정이 누락되었습니다.")
-
-        auth_url = f"https://github.com/login/oauth/authorize?client_id={client_id}&redirect_uri={redirect_uri}&scope=user:email"
-        return RedirectResponse(url=auth_url)
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="깃허브 OAuth 시작 중 오류가 발생했습니다.")
-
+def get_user_service(session: AsyncSessionDep) -> UserService:
+    """UserService 의존성 주입"""
+    config = _user_service_config()
 
-# 깃허브 OAuth 콜백
-@router.get(
-    "/github/callback",
-    summary="깃허브 OAuth 콜백",
-    description="깃허브 OAuth 인증 후 콜백을 처리합니다.",
-    responses={
-        200: {"description": "깃허브 OAuth 로그인 성공"},
-        400: {"model": ErrorResponse, "description": "인증 실패"},
-    },
-)
-async def github_oauth_callback(
-    code: str = Query(..., description="인증 코드"),
-    error: Optional[str] = Query(None, description="에러 코드"),
-    user_service: UserService = Depends(get_user_service),
-) -> UserOAuthLoginResponse:
-    """깃허브 OAuth 콜백"""
-    try:
-        if error:
-            raise HTTPException(status_code=400, detail=f"깃허브 OAuth 인증 실패: {error}")
-
-        # TODO: 깃허브 API를 통해 액세스 토큰 및 사용자 정보 획득
-        # 실제 구현에서는 깃허브 API를 호출하여 사용자 정보를 가져와야 합니다.
-
-        # 임시 사용자 정보 (실제로는 깃허브 API에서 가져온 정보)
-        github_user_info = {
-            "id": "temp_github_id",
-            "email": "user@example.com",
-            "username": "github_user",
-            "first_name": "깃허브",
-            "last_name": "사용자",
-            "avatar_url": "https://example.com/avatar.jpg",
-        }
+    return UserService(
+        user_repository=SQLAlchemyUserRepository(session),
+        jwt_secret_key=config.jwt_secret_key,
+        jwt_algorithm=config.jwt_algorithm,
+        jwt_access_token_expire_minutes=config.jwt_access_token_expire_minutes,
+        jwt_refresh_token_expire_days=config.jwt_refresh_token_expire_days,
+        bcrypt_rounds=config.bcrypt_rounds,
+    )
 
-        command = OAuthLoginCommand(
-            provider=AuthProvider.GITHUB,
-            provider_id=github_user_info["id"],
-            email=github_user_info["email"],
-            username=github_user_info["username"],
-            first_name=github_user_info["first_name"],
-            last_name=github_user_info["last_name"],
-            avatar_url=github_user_info["avatar_url"],
-        )
 
-        return user_service.oauth_login(command)
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="깃허브 OAuth 콜백 처리 중 오류가 발생했습니다.")
+UserServiceDep = Annotated[UserService, Depends(get_user_service)]
+
+
+# 제공자별 표시 이름
+_PROVIDER_LABELS = {
+    AuthProvider.KAKAO: "카카오",
+    AuthProvider.GOOGLE: "구글",
+    AuthProvider.NAVER: "네이버",
+    AuthProvider.GITHUB: "깃허브",
+}
+
+# 제공자별 인증 페이지 URL 템플릿
+_AUTHORIZE_URLS = {
+    AuthProvider.KAKAO: "https://kauth.kakao.com/oauth/authorize?client_id={client_id}&redirect_uri={redirect_uri}&response_type=code",
+    AuthProvider.GOOGLE: "https://accounts.google.com/o/oauth2/v2/auth?client_id={client_id}&redirect_uri={redirect_uri}&response_type=code&scope=openid%20email%20profile",
+    AuthProvider.NAVER: "https://nid.naver.com/oauth2.0/authorize?client_id={client_id}&redirect_uri={redirect_uri}&response_type=code",
+    AuthProvider.GITHUB: "https://github.com/login/oauth/authorize?client_id={client_id}&redirect_uri={redirect_uri}&scope=user:email",
+}
+
+
+def _fetch_kakao_user_info(code: str) -> dict:
+    """카카오 사용자 정보 조회"""
+    # TODO: 카카오 API를 통해 액세스 토큰 및 사용자 정보 획득
+    return {
+        "id": "temp_kakao_id",
+        "email": "user@example.com",
+        "username": "kakao_user",
+        "first_name": "카카오",
+        "last_name": "사용자",
+        "avatar_url": "https://example.com/avatar.jpg",
+    }
+
+
+def _fetch_google_user_info(code: str) -> dict:
+    """구글 사용자 정보 조회"""
+    # TODO: 구글 API를 통해 액세스 토큰 및 사용자 정보 획득
+    return {
+        "id": "temp_google_id",
+        "email": "user@example.com",
+        "username": "google_user",
+        "first_name": "구글",
+        "last_name": "사용자",
+        "avatar_url": "https://example.com/avatar.jpg",
+    }
+
+
+def _fetch_naver_user_info(code: str) -> dict:
+    """네이버 사용자 정보 조회"""
+    # TODO: 네이버 API를 통해 액세스 토큰 및 사용자 정보 획득
+    return {
+        "id": "temp_naver_id",
+        "email": "user@example.com",
+        "username": "naver_user",
+        "first_name": "네이버",
+        "last_name": "사용자",
+        "avatar_url": "https://example.com/avatar.jpg",
+    }
+
+
+def _fetch_github_user_info(code: str) -> dict:
+    """깃허브 사용자 정보 조회"""
+    # TODO: 깃허브 API를 통해 액세스 토큰 및 사용자 정보 획득
+    return {
+        "id": "temp_github_id",
+        "email": "user@example.com",
+        "username": "github_user",
+        "first_name": "깃허브",
+        "last_name": "사용자",
+        "avatar_url": "https://example.com/avatar.jpg",
+    }
+
+
+_USER_INFO_FETCHERS = {
+    AuthProvider.KAKAO: _fetch_kakao_user_info,
+    AuthProvider.GOOGLE: _fetch_google_user_info,
+    AuthProvider.NAVER: _fetch_naver_user_info,
+    AuthProvider.GITHUB: _fetch_github_user_info,
+}
+
+
+async def _oauth_start(provider: AuthProvider) -> RedirectResponse:
+    """OAuth 시작 공통 처리"""
+    prefix = provider.name
+    client_id = os.getenv(f"{prefix}_CLIENT_ID")
+    redirect_uri = os.getenv(f"{prefix}_REDIRECT_URI")
+
+    if not client_id or not redirect_uri:
+        raise HTTPException(status_code=500, detail=f"{_PROVIDER_LABELS[provider]} OAuth 설정이 누락되었습니다.")
+
+    auth_url = _AUTHORIZE_URLS[provider].format(client_id=client_id, redirect_uri=redirect_uri)
+    return RedirectResponse(url=auth_url)
+
+
+async def _oauth_callback(provider: AuthProvider, code: str, error: Optional[str], user_service: UserService) -> ORJSONResponse:
+    """OAuth 콜백 공통 처리"""
+    if error:
+        raise HTTPException(status_code=400, detail=f"{_PROVIDER_LABELS[provider]} OAuth 인증 실패: {error}")
+
+    user_info = _USER_INFO_FETCHERS[provider](code)
+
+    command = OAuthLoginCommand.from_user_info(provider, user_info)
+    result = await user_service.oauth_login(command)
+    return ORJSONResponse(_LOGIN_RESPONSE_ADAPTER.dump_python(result, mode="json"))
+
+
+def _make_oauth_start(provider: AuthProvider):
+    async def oauth_start() -> RedirectResponse:
+        return await _oauth_start(provider)
+
+    oauth_start.__name__ = f"{provider.value}_oauth_start"
+    return oauth_start
+
+
+def _make_oauth_callback(provider: AuthProvider):
+    async def oauth_callback(
+        user_service: UserServiceDep,
+        code: str = Query(..., description="인증 코드"),
+        error: Optional[str] = Query(None, description="에러 코드"),
+    ) -> ORJSONResponse:
+        return await _oauth_callback(provider, code, error, user_service)
+
+    oauth_callback.__name__ = f"{provider.value}_oauth_callback"
+    return oauth_callback
+
+
+# 제공자별 OAuth 시작 / 콜백 라우트 등록
+for _provider, _label in _PROVIDER_LABELS.items():
+    router.add_api_route(
+        f"/{_provider.value}",
+        _make_oauth_start(_provider),
+        methods=["GET"],
+        summary=f"{_label} OAuth 시작",
+        description=f"{_label} OAuth 인증을 시작합니다.",
+        responses={
+            302: {"description": f"{_label} OAuth 페이지로 리다이렉트"},
+        },
+    )
+    router.add_api_route(
+        f"/{_provider.value}/callback",
+        _make_oauth_callback(_provider),
+        methods=["GET"],
+        response_model=OAuthLoginResponse,
+        summary=f"{_label} OAuth 콜백",
+        description=f"{_label} OAuth 인증 후 콜백을 처리합니다.",
+        responses={
+            200: {"description": f"{_label} OAuth 로그인 성공"},
+            400: {"model": ErrorResponse, "description": "인증 실패"},
+        },
+    )
 
 
 # OAuth 계정 연결
 @router.post(
     "/link",
+    include_in_schema=False,
     summary="OAuth 계정 연결",
     description="기존 계정에 OAuth 계정을 연결합니다.",
     responses={
@@ -372,20 +228,16 @@ async def github_oauth_callback(
         409: {"model": ErrorResponse, "description": "이미 연결된 계정"},
     },
 )
-async def link_oauth_account(request: UserOAuthLoginRequest, user_service: UserService = Depends(get_user_service)) -> UserOAuthLoginResponse:
+async def link_oauth_account(request: UserOAuthLoginRequest, user_service: UserServiceDep) -> OAuthLoginResponse:
     """OAuth 계정 연결"""
-    try:
-        # TODO: 기존 계정 확인 및 OAuth 계정 연결 로직 구현
-        raise HTTPException(status_code=501, detail="OAuth 계정 연결 기능은 아직 구현되지 않았습니다.")
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="OAuth 계정 연결 중 오류가 발생했습니다.")
+    # TODO: 기존 계정 확인 및 OAuth 계정 연결 로직 구현
+    raise HTTPException(status_code=501, detail="OAuth 계정 연결 기능은 아직 구현되지 않았습니다.")
 
 
 # OAuth 계정 연결 해제
 @router.delete(
     "/unlink/{provider}",
+    include_in_schema=False,
     summary="OAuth 계정 연결 해제",
     description="연결된 OAuth 계정을 해제합니다.",
     responses={
@@ -394,18 +246,22 @@ async def link_oauth_account(request: UserOAuthLoginRequest, user_service: UserS
         404: {"model": ErrorResponse, "description": "연결된 계정을 찾을 수 없음"},
     },
 )
-async def unlink_oauth_account(provider: AuthProvider, user_service: UserService = Depends(get_user_service)) -> dict:
+async def unlink_oauth_account(provider: AuthProvider, user_service: UserServiceDep) -> dict:
     """OAuth 계정 연결 해제"""
-    try:
-        # TODO: OAuth 계정 연결 해제 로직 구현
-        return {"message": f"{provider.value} 계정 연결 해제 기능은 아직 구현되지 않았습니다."}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="OAuth 계정 연결 해제 중 오류가 발생했습니다.")
+    # TODO: OAuth 계정 연결 해제 로직 구현
+    return {"message": f"{provider.value} 계정 연결 해제 기능은 아직 구현되지 않았습니다."}
+
+
+# 연결된 계정 조회 미구현 상태의 고정 응답
+_EMPTY_LINKED_ACCOUNTS = MappingProxyType(
+    {"linked_accounts": (), "message": "연결된 OAuth 계정 목록 조회 기능은 아직 구현되지 않았습니다."}
+)
 
 
 # 연결된 OAuth 계정 목록 조회
 @router.get(
     "/linked-accounts",
+    include_in_schema=False,
     summary="연결된 OAuth 계정 목록 조회",
     description="현재 사용자에게 연결된 OAuth 계정 목록을 조회합니다.",
     responses={
@@ -413,13 +269,10 @@ async def unlink_oauth_account(provider: AuthProvider, user_service: UserService
         401: {"model": ErrorResponse, "description": "인증되지 않은 사용자"},
     },
 )
-async def get_linked_oauth_accounts(user_service: UserService = Depends(get_user_service)) -> dict:
+async def get_linked_oauth_accounts(user_service: UserServiceDep) -> dict:
     """연결된 OAuth 계정 목록 조회"""
-    try:
-        # TODO: 연결된 OAuth 계정 목록 조회 로직 구현
-        return {"linked_accounts": [], "message": "연결된 OAuth 계정 목록 조회 기능은 아직 구현되지 않았습니다."}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="연결된 OAuth 계정 목록 조회 중 오류가 발생했습니다.")
+    # TODO: 연결된 OAuth 계정 목록 조회 로직 구현
+    return _EMPTY_LINKED_ACCOUNTS
 
 
 # OAuth 제공자별 사용자 정보 조회
@@ -433,23 +286,34 @@ async def get_linked_oauth_accounts(user_service: UserService = Depends(get_user
         404: {"model": ErrorResponse, "description": "사용자를 찾을 수 없음"},
     },
 )
-async def get_user_by_oauth(provider: AuthProvider, provider_id: str, user_service: UserService = Depends(get_user_service)) -> UserResponse:
+async def get_user_by_oauth(provider: AuthProvider, provider_id: str, user_service: UserServiceDep) -> UserResponse:
     """OAuth 제공자별 사용자 정보 조회"""
-    try:
-        command = FindUserByOAuthCommand(provider=provider, provider_id=provider_id)
-        user = user_service.find_user_by_oauth(command)
-        if not user:
-            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
-        return user
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="사용자 정보 조회 중 오류가 발생했습니다.")
+    command = FindUserByOAuthCommand(provider, provider_id)
+    user = await user_service.find_user_by_oauth(command)
+    if not user:
+        raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+    return user
+
+
+@lru_cache(maxsize=1)
+def _oauth_status() -> Mapping[str, dict]:
+    """OAuth 설정 상태 (환경 변수는 프로세스 수명 동안 변하지 않으므로 최초 1회만 생성)"""
+    return MappingProxyType(
+        {
+            provider.value: {
+                "enabled": bool(client_id := os.getenv(f"{provider.name}_CLIENT_ID")),
+                "client_id": client_id,
+                "redirect_uri": os.getenv(f"{provider.name}_REDIRECT_URI"),
+            }
+            for provider in _PROVIDER_LABELS
+        }
+    )
 
 
 # OAuth 상태 확인
 @router.get(
     "/status",
+    include_in_schema=False,
     summary="OAuth 상태 확인",
     description="현재 OAuth 설정 상태를 확인합니다.",
     responses={
@@ -458,32 +322,4 @@ async def get_user_by_oauth(provider: AuthProvider, provider_id: str, user_servi
 )
 async def get_oauth_status() -> dict:
     """OAuth 상태 확인"""
-    try:
-        import os
-
-        oauth_status = {
-            "kakao": {
-                "enabled": bool(os.getenv("KAKAO_CLIENT_ID")),
-                "client_id": os.getenv("KAKAO_CLIENT_ID"),
-                "redirect_uri": os.getenv("KAKAO_REDIRECT_URI"),
-            },
-            "google": {
-                "enabled": bool(os.getenv("GOOGLE_CLIENT_ID")),
-                "client_id": os.getenv("GOOGLE_CLIENT_ID"),
-                "redirect_uri": os.getenv("GOOGLE_REDIRECT_URI"),
-            },
-            "naver": {
-                "enabled": bool(os.getenv("NAVER_CLIENT_ID")),
-                "client_id": os.getenv("NAVER_CLIENT_ID"),
-                "redirect_uri": os.getenv("NAVER_REDIRECT_URI"),
-            },
-            "github": {
-                "enabled": bool(os.getenv("GITHUB_CLIENT_ID")),
-                "client_id": os.getenv("GITHUB_CLIENT_ID"),
-                "redirect_uri": os.getenv("GITHUB_REDIRECT_URI"),
-            },
-        }
-
-        return oauth_status
-    except Exception as e:
-        raise HTTPException(status_code=500, detail="OAuth 상태 확인 중 오류가 발생했습니다.")
+    return _oauth_status()
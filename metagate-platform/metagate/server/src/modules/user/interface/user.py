@@ -1,80 +1,72 @@
 from typing import List, Union
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from fastapi.params import Depends
+from fastapi.responses import ORJSONResponse
 
-from src.infrastructure.utils.response_model import BusinessResponse, SuccessResponse, ErrorResponse
+from src.infrastructure.utils.etag import conditional_json_response
+from src.infrastructure.utils.load_shedding import limit_db_concurrency
+from src.infrastructure.utils.response_model import BusinessResponse, SuccessResponse, ErrorResponse, business_errors
 from src.modules.user.core.command import UserRegisterUseCase, UserUpdateUseCase, UserDeleteUseCase
 from src.modules.user.core.entity import User
 from src.modules.user.core.query import UsersPaginationQueryUseCase, UserQueryUseCase
 from src.modules.user.interface.adapter import UserRegisterAdapter, UserUpdateAdapter, UserDeleteAdapter
 
-users = APIRouter(prefix="/users", tags=["user"])
+users = APIRouter(prefix="/users", tags=["user"], default_response_class=ORJSONResponse)
 
 
 @users.get("/", response_model=Union[SuccessResponse[List[User]], ErrorResponse])
+@business_errors("Failed to retrieve users")
 async def get_users(
+    request: Request,
     usecase: UsersPaginationQueryUseCase = Depends(UsersPaginationQueryUseCase)
 ) -> Union[SuccessResponse[List[User]], ErrorResponse]:
-    try:
-        result = await usecase.execute()
-        return BusinessResponse.success(200, result, "Users retrieved successfully")
-    except Exception as e:
-        return BusinessResponse.failure(500, str(e), "Failed to retrieve users")
+    result = await usecase.execute()
+    # 목록 응답은 response_model 재검증/재인코딩을 건너뛰고 바로 직렬화
+    response = BusinessResponse.success(200, result, "Users retrieved successfully").model_dump(mode="json")
+    return conditional_json_response(request, response, response["data"])
 
 
 @users.get("/{user_id}", response_model=Union[SuccessResponse[User], ErrorResponse])
+@business_errors("Failed to retrieve user", value_error_status=404, value_error_message="User not found")
 async def get_user(
-    user_id: int, usecase: UserQueryUseCase = Depends(UserQueryUseCase)
+    user_id: int, request: Request, usecase: UserQueryUseCase = Depends(UserQueryUseCase)
 ) -> Union[SuccessResponse[User], ErrorResponse]:
-    try:
-        user = await usecase.execute(user_id=user_id)
-        return BusinessResponse.success(200, user, "User retrieved successfully")
-    except ValueError as e:
-        return BusinessResponse.failure(404, str(e), "User not found")
-    except Exception as e:
-        return BusinessResponse.failure(500, str(e), "Failed to retrieve user")
+    user = await usecase.execute(user_id=user_id)
+    response = BusinessResponse.success(200, user, "User retrieved successfully").model_dump(mode="json")
+    return conditional_json_response(request, response, response["data"])
 
 
 @users.post("/", response_model=Union[SuccessResponse[User], ErrorResponse])
+@limit_db_concurrency()
+@business_errors(value_error_status=400, value_error_message="Registration failed")
 async def register(
     adapter: UserRegisterAdapter,
     usecase: UserRegisterUseCase = Depends(UserRegisterUseCase)
 ) -> Union[SuccessResponse[User], ErrorResponse]:
-    try:
-        result = await usecase.execute(adapter=adapter)
-        return BusinessResponse.success(201, result, "User registered successfully")
-    except ValueError as e:
-        return BusinessResponse.failure(400, str(e), "Registration failed")
-    except Exception as e:
-        return BusinessResponse.failure(500, str(e), "Internal server error")
+    result = await usecase.execute(adapter=adapter)
+    return BusinessResponse.success(201, result, "User registered successfully")
 
 
 @users.put("/{user_id}", response_model=Union[SuccessResponse[User], ErrorResponse])
+@limit_db_concurrency()
+@business_errors(value_error_status=400, value_error_message="Update failed")
 async def edit(
     user_id: int,
     adapter: UserUpdateAdapter,
     usecase: UserUpdateUseCase = Depends(UserUpdateUseCase)
 ) -> ErrorResponse | SuccessResponse[bool]:
-    try:
-        result = await usecase.execute(adapter=adapter)
-        return BusinessResponse.success(200, result, "User updated successfully")
-    except ValueError as e:
-        return BusinessResponse.failure(400, str(e), "Update failed")
-    except Exception as e:
-        return BusinessResponse.failure(500, str(e), "Internal server error")
+    result = await usecase.execute(adapter=adapter)
+    return BusinessResponse.success(200, result, "User updated successfully")
 
 
 @users.delete("/{user_id}", response_model=Union[SuccessResponse[dict], ErrorResponse])
+@limit_db_concurrency()
+@business_errors(value_error_status=400, value_error_message="Delete failed")
 async def drop(
     user_id: int,
     adapter: UserDeleteAdapter,
     usecase: UserDeleteUseCase = Depends(UserDeleteUseCase)
 ) -> Union[SuccessResponse[dict], ErrorResponse]:
-    try:
-        await usecase.execute(adapter=adapter)
-        return BusinessResponse.success(200, {}, "User deleted successfully")
-    except ValueError as e:
-        return BusinessResponse.failure(400, str(e), "Delete failed")
-    except Exception as e:
-        return BusinessResponse.failure(500, str(e), "Internal server error")
\ No newline at end of file
+    await usecase.execute(adapter=adapter)
+    return BusinessResponse.success(200, {}, "User deleted successfully")
\ No newline at end of file
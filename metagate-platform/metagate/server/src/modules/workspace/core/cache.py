@@ -0,0 +1,58 @@
+import asyncio
+from typing import Awaitable, Callable, Iterable, Optional
+from uuid import UUID
+
+from cachetools import TTLCache
+from sqlalchemy import inspect
+
+from src.modules.workspace.core.entity import Workspace
+
+# id/이름 단건 조회 결과 캐시 (ORM 인스턴스 대신 컬럼 값 스냅샷만 보관, 지연 로드 컬럼 제외)
+_workspace_cache: TTLCache = TTLCache(maxsize=4096, ttl=30)
+_COLUMN_KEYS = tuple(attr.key for attr in inspect(Workspace).column_attrs if not attr.deferred)
+
+# 상태별 통계 캐시 (대시보드 폴링이 잦아도 TTL당 집계 쿼리 1회)
+STATISTICS_TTL = 30
+_statistics_cache: TTLCache = TTLCache(maxsize=1, ttl=STATISTICS_TTL)
+_statistics_lock = asyncio.Lock()
+
+
+def get_cached_workspace(key: tuple[str, UUID | str]) -> Optional[Workspace]:
+    """캐시된 스냅샷으로 새 Workspace 생성 (세션에 연결되지 않은 읽기 전용 객체, 수정/저장에 사용하지 않음)"""
+    snapshot = _workspace_cache.get(key)
+    if snapshot is None:
+        return None
+    return Workspace(**snapshot)
+
+
+def cache_workspace(workspace: Workspace) -> None:
+    """id와 이름 두 키로 스냅샷 저장"""
+    snapshot = {key: getattr(workspace, key) for key in _COLUMN_KEYS}
+    _workspace_cache[("id", workspace.id)] = snapshot
+    _workspace_cache[("name", workspace.name)] = snapshot
+
+
+def evict_workspace(workspace_id: UUID, names: Iterable[str] = ()) -> None:
+    """쓰기 후 해당 워크스페이스의 캐시 제거 (이름을 모르면 스냅샷을 훑어 찾음)"""
+    snapshot = _workspace_cache.pop(("id", workspace_id), None)
+    names = set(names)
+    if snapshot is not None:
+        names.add(snapshot["name"])
+    if not names:
+        names = {key[1] for key, value in list(_workspace_cache.items()) if value["id"] == workspace_id}
+    for name in names:
+        _workspace_cache.pop(("name", name), None)
+
+
+async def get_cached_statistics(compute: Callable[[], Awaitable[dict]]) -> dict:
+    """TTL 동안 통계 재사용, 만료 시 동시 요청 중 하나만 다시 집계"""
+    statistics = _statistics_cache.get("overview")
+    if statistics is not None:
+        return statistics
+
+    async with _statistics_lock:
+        statistics = _statistics_cache.get("overview")
+        if statistics is None:
+            statistics = await compute()
+            _statistics_cache["overview"] = statistics
+    return statistics
@@ -0,0 +1,120 @@
+from collections.abc import Sequence
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.utils.exception_handler import DomainValidationError, PreconditionFailedError
+from src.modules.workspace.core.entity import Workspace
+from src.modules.workspace.core.repository import WorkspaceRepository, workspace_repository
+from src.modules.workspace.core.value import WorkspaceStatus
+
+
+class WorkspaceBulkCreateCommand:
+    """워크스페이스 일괄 생성 Command (대량 import/시드용)"""
+
+    def __init__(self, session: Optional[AsyncSession] = None):
+        self.session = session
+
+    async def execute(self, payloads: List[dict]) -> List[UUID]:
+        """이름 중복을 한 번에 확인한 뒤 일괄 INSERT, 생성된 ID 목록 반환"""
+        names = [payload["name"] for payload in payloads]
+        if len(set(names)) != len(names):
+            raise DomainValidationError("요청 안에 중복된 워크스페이스 이름이 있습니다.")
+
+        async with workspace_repository(self.session) as repo:
+            existing = await repo.find_existing_names(names)
+            if existing:
+                raise DomainValidationError(f"이미 존재하는 워크스페이스 이름입니다: {', '.join(sorted(existing))}")
+
+            return await repo.bulk_create(payloads)
+
+
+class WorkspaceUpdateCommand:
+    """워크스페이스 수정 Command"""
+
+    def __init__(self, session: Optional[AsyncSession] = None):
+        self.session = session
+
+    async def execute(
+        self,
+        workspace_id: UUID,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        workspace_status: Optional[WorkspaceStatus] = None,
+        owner_id: Optional[UUID] = None,
+        team_id: Optional[UUID] = None,
+        client_id: Optional[UUID] = None,
+        expected_updated_at: Optional[Sequence[datetime]] = None,
+    ) -> Optional[Workspace]:
+        """변경할 값이 없거나 기존 값과 같으면 쓰기 트랜잭션 없이 현재 상태 반환
+
+        expected_updated_at(If-Match의 updated_at 목록)을 주면 조회 없이 조건부 UPDATE 한 번으로 수정하고,
+        그 사이 다른 요청이 먼저 수정했으면 PreconditionFailedError를 던진다 (변경 값이 없어도 같은 검사).
+        """
+        changes = {
+            "name": name,
+            "description": description,
+            "start_date": start_date,
+            "end_date": end_date,
+            "workspace_status": workspace_status,
+            "owner_id": owner_id,
+            "team_id": team_id,
+            "client_id": client_id,
+        }
+
+        async with workspace_repository(self.session) as repo:
+            if expected_updated_at is not None and any(value is not None for value in changes.values()):
+                return await self._update_if_unmodified(repo, workspace_id, changes, expected_updated_at)
+
+            workspace = await repo.find_by_id(workspace_id)
+            if workspace is None:
+                return None
+
+            if expected_updated_at is not None and workspace.updated_at not in expected_updated_at:
+                raise PreconditionFailedError("다른 요청이 먼저 워크스페이스를 수정했습니다. 다시 조회 후 시도해 주세요.")
+
+            if all(value is None for value in changes.values()):
+                return workspace
+
+            if name is not None and name != workspace.name and await repo.exists_by_name(name):
+                raise DomainValidationError("이미 존재하는 워크스페이스 이름입니다.")
+
+            if not workspace.update(**changes):
+                return workspace
+
+            return await repo.save(workspace)
+
+    @staticmethod
+    async def _update_if_unmodified(
+        repo: WorkspaceRepository, workspace_id: UUID, changes: dict, expected_updated_at: Sequence[datetime]
+    ) -> Optional[Workspace]:
+        """조건부 UPDATE (0행이면 없는 워크스페이스는 None, 이미 수정된 경우는 PreconditionFailedError)"""
+        name = changes["name"]
+        if name is not None and await repo.exists_by_name(name, exclude_id=workspace_id):
+            raise DomainValidationError("이미 존재하는 워크스페이스 이름입니다.")
+
+        values = {field: value for field, value in changes.items() if value is not None}
+        workspace = await repo.update_if_unmodified(workspace_id, expected_updated_at, values)
+        if workspace is None and await repo.exists_by_id(workspace_id):
+            raise PreconditionFailedError("다른 요청이 먼저 워크스페이스를 수정했습니다. 다시 조회 후 시도해 주세요.")
+        return workspace
+
+
+class WorkspaceDeleteCommand:
+    """워크스페이스 삭제 Command"""
+
+    def __init__(self, session: Optional[AsyncSession] = None):
+        self.session = session
+
+    async def execute(self, workspace_id: UUID, expected_updated_at: Optional[Sequence[datetime]] = None) -> bool:
+        """DELETE 한 번으로 삭제 (없으면 False, expected_updated_at 불일치면 PreconditionFailedError)"""
+        async with workspace_repository(self.session) as repo:
+            if await repo.delete(workspace_id, expected_updated_at):
+                return True
+            if expected_updated_at is not None and await repo.exists_by_id(workspace_id):
+                raise PreconditionFailedError("다른 요청이 먼저 워크스페이스를 수정했습니다. 다시 조회 후 시도해 주세요.")
+            return False
@@ -1,8 +1,9 @@
 from datetime import datetime
 from typing import Optional
+from uuid import UUID
 
-from sqlalchemy import Column, DateTime, String, Text
-from sqlalchemy import Enum as SQLEnum
+from sqlalchemy import Column, Computed, DateTime, Index, SmallInteger, String, Text, TypeDecorator, Uuid
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -10,26 +11,72 @@ from src.infrastructure.database import Base
 from src.modules.workspace.core.value import WorkspaceStatus
 
 
+class WorkspaceStatusCode(TypeDecorator):
+    """WorkspaceStatus <-> SMALLINT 코드 매핑 (코드 값은 저장 포맷이므로 변경 금지)
+
+    workspaces 테이블은 metadata(create_all)로 처음부터 SMALLINT 컬럼으로 생성되므로 별도 변환 스크립트는 없다.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    _CODES = {
+        WorkspaceStatus.ACTIVE: 1,
+        WorkspaceStatus.INACTIVE: 2,
+        WorkspaceStatus.COMPLETED: 3,
+        WorkspaceStatus.CANCELLED: 4,
+        WorkspaceStatus.ON_HOLD: 5,
+        WorkspaceStatus.IN_PROGRESS: 6,
+        WorkspaceStatus.PENDING: 7,
+    }
+    _STATUSES = {code: status for status, code in _CODES.items()}
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else self._CODES[WorkspaceStatus(value)]
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else self._STATUSES[value]
+
+
 class Workspace(Base):
     __tablename__ = "workspaces"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # search_workspaces의 owner/team/client + 상태 + 기간 복합 필터용
+        Index("ix_ws_owner_status_start", "owner_id", "workspace_status", "start_date"),
+        Index("ix_ws_team_status_start", "team_id", "workspace_status", "start_date"),
+        Index("ix_ws_client_status_start", "client_id", "workspace_status", "start_date"),
+        # find_by_status (상태 필터 + 최신순)용
+        Index("ix_ws_status_created", "workspace_status", "created_at"),
+        # search_workspaces keyset 페이징 (created_at DESC, id DESC 역방향 스캔)용
+        Index("ix_ws_created_id", "created_at", "id"),
+        # search_workspaces 단어 앞부분 검색 (search_tsv @@ to_tsquery('단어:*'))용
+        Index("ix_ws_search_tsv", "search_tsv", postgresql_using="gin"),
+    )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, index=True)
+    id: Mapped[UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     workspace_status: Mapped[WorkspaceStatus] = mapped_column(
-        SQLEnum(WorkspaceStatus), default=WorkspaceStatus.ACTIVE, nullable=False
+        WorkspaceStatusCode(), default=WorkspaceStatus.ACTIVE, nullable=False
     )
     start_date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     end_date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
-    owner_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
-    team_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
-    client_id: Mapped[str] = mapped_column(String(36), nullable=False, index=True)
+    owner_id: Mapped[UUID] = mapped_column(Uuid(as_uuid=True), nullable=False, index=True)
+    team_id: Mapped[UUID] = mapped_column(Uuid(as_uuid=True), nullable=False, index=True)
+    client_id: Mapped[UUID] = mapped_column(Uuid(as_uuid=True), nullable=False, index=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=func.now(), onupdate=func.now(), nullable=False
     )
+    # 이름 + 설명 검색 문서 (DB가 생성/갱신, 검색 조건에서만 쓰므로 조회 시 로드하지 않음)
+    search_tsv: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(description, ''))", persisted=True),
+        deferred=True,
+    )
 
     def __repr__(self) -> str:
         return f"<Workspace(id={self.id}, name='{self.name}', status={self.workspace_status.value})>"
@@ -37,15 +84,15 @@ class Workspace(Base):
     @classmethod
     def create(
         cls,
-        id: str,
+        id: UUID,
         name: str,
         description: str,
         start_date: datetime,
         end_date: datetime,
         workspace_status: WorkspaceStatus,
-        owner_id: str,
-        team_id: str,
-        client_id: str,
+        owner_id: UUID,
+        team_id: UUID,
+        client_id: UUID,
     ) -> "Workspace":
         """워크스페이스 생성 팩토리 메서드"""
         return cls(
@@ -67,27 +114,27 @@ class Workspace(Base):
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         workspace_status: Optional[WorkspaceStatus] = None,
-        owner_id: Optional[str] = None,
-        team_id: Optional[str] = None,
-        client_id: Optional[str] = None,
-    ) -> None:
-        """워크스페이스 정보 업데이트"""
-        if name is not None:
-            self.name = name
-        if description is not None:
-            self.description = description
-        if start_date is not None:
-            self.start_date = start_date
-        if end_date is not None:
-            self.end_date = end_date
-        if workspace_status is not None:
-            self.workspace_status = workspace_status
-        if owner_id is not None:
-            self.owner_id = owner_id
-        if team_id is not None:
-            self.team_id = team_id
-        if client_id is not None:
-            self.client_id = client_id
+        owner_id: Optional[UUID] = None,
+        team_id: Optional[UUID] = None,
+        client_id: Optional[UUID] = None,
+    ) -> bool:
+        """워크스페이스 정보 업데이트 (실제로 바뀐 값이 있으면 True)"""
+        changes = {
+            "name": name,
+            "description": description,
+            "start_date": start_date,
+            "end_date": end_date,
+            "workspace_status": workspace_status,
+            "owner_id": owner_id,
+            "team_id": team_id,
+            "client_id": client_id,
+        }
+        dirty = False
+        for field, value in changes.items():
+            if value is not None and value != getattr(self, field):
+                setattr(self, field, value)
+                dirty = True
+        return dirty
 
     def activate(self) -> None:
         """워크스페이스 활성화"""
@@ -127,3 +174,4 @@ class Workspace(Base):
     def is_cancelled(self) -> bool:
         """취소 상태인지 확인"""
         return self.workspace_status == WorkspaceStatus.CANCELLED
+
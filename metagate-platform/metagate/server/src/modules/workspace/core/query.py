@@ -1,84 +1,135 @@
+import asyncio
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
+from uuid import UUID
 
-from src.infrastructure.database import get_db_session
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.modules.workspace.core.cache import cache_workspace, get_cached_statistics, get_cached_workspace
 from src.modules.workspace.core.entity import Workspace
-from src.modules.workspace.core.repository import SQLAlchemyWorkspaceRepository
+from src.modules.workspace.core.repository import workspace_repository
 from src.modules.workspace.core.value import WorkspaceStatus
 
 
 class WorkspaceQuery:
-    """워크스페이스 조회 Query"""
+    """워크스페이스 조회 Query (session을 넘기면 호출자의 커넥션/트랜잭션을 재사용)"""
+
+    def __init__(self, session: Optional[AsyncSession] = None):
+        self.session = session
+
+    async def get_by_id(self, workspace_id: UUID) -> Optional[Workspace]:
+        """ID로 워크스페이스 조회 (세션을 넘긴 경우 트랜잭션 안의 값을 봐야 하므로 캐시 미사용)"""
+        if self.session is not None:
+            async with workspace_repository(self.session) as repo:
+                return await repo.find_by_id(workspace_id)
+
+        cached = get_cached_workspace(("id", workspace_id))
+        if cached is not None:
+            return cached
+
+        async with workspace_repository() as repo:
+            workspace = await repo.find_by_id(workspace_id)
+
+        if workspace is not None:
+            cache_workspace(workspace)
+        return workspace
+
+    async def get_by_ids(self, workspace_ids: List[UUID]) -> List[Workspace]:
+        """여러 ID로 워크스페이스 조회 (캐시에 없는 ID만 한 번에 조회, 요청 순서 유지, 없는 ID 제외)"""
+        found = {}
+        missing = []
+        for workspace_id in dict.fromkeys(workspace_ids):
+            if self.session is not None:
+                # 세션을 넘긴 경우 트랜잭션 안의 값을 봐야 하므로 캐시를 건너뜀
+                missing.append(workspace_id)
+                continue
+            cached = get_cached_workspace(("id", workspace_id))
+            if cached is not None:
+                found[workspace_id] = cached
+            else:
+                missing.append(workspace_id)
+
+        if missing:
+            async with workspace_repository(self.session) as repo:
+                for workspace in await repo.find_by_ids(missing):
+                    if self.session is None:
+                        cache_workspace(workspace)
+                    found[workspace.id] = workspace
+
+        return [found[workspace_id] for workspace_id in dict.fromkeys(workspace_ids) if workspace_id in found]
+
+    async def get_by_name(self, name: str) -> Optional[Workspace]:
+        """이름으로 워크스페이스 조회 (세션을 넘긴 경우 캐시 미사용)"""
+        if self.session is not None:
+            async with workspace_repository(self.session) as repo:
+                return await repo.find_by_name(name)
 
-    def __init__(self):
-        pass
+        cached = get_cached_workspace(("name", name))
+        if cached is not None:
+            return cached
 
-    async def get_by_id(self, workspace_id: str) -> Optional[Workspace]:
-        """ID로 워크스페이스 조회"""
-        with get_db_session() as session:
-            repo = SQLAlchemyWorkspaceRepository(session)
-            return repo.find_by_id(workspace_id)
+        async with workspace_repository() as repo:
+            workspace = await repo.find_by_name(name)
 
-    async def get_by_name(self, name: str) -> Optional[Workspace]:
-        """이름으로 워크스페이스 조회"""
-        with get_db_session() as session:
-            repo = SQLAlchemyWorkspaceRepository(session)
-            return repo.find_by_name(name)
+        if workspace is not None:
+            cache_workspace(workspace)
+        return workspace
 
     async def get_by_owner_id(
-        self, owner_id: str, skip: int = 0, limit: int = 100
+        self, owner_id: UUID, skip: int = 0, limit: int = 100
     ) -> List[Workspace]:
         """소유자 ID로 워크스페이스 목록 조회"""
-        with get_db_session() as session:
-            repo = SQLAlchemyWorkspaceRepository(session)
-            return repo.find_by_owner_id(owner_id)[skip : skip + limit]
+        async with workspace_repository(self.session) as repo:
+            return await repo.find_by_owner_id(owner_id, skip=skip, limit=limit)
 
     async def get_by_team_id(
-        self, team_id: str, skip: int = 0, limit: int = 100
+        self, team_id: UUID, skip: int = 0, limit: int = 100
     ) -> List[Workspace]:
         """팀 ID로 워크스페이스 목록 조회"""
-        with get_db_session() as session:
-            repo = SQLAlchemyWorkspaceRepository(session)
-            return repo.find_by_team_id(team_id)[skip : skip + limit]
+        async with workspace_repository(self.session) as repo:
+            return await repo.find_by_team_id(team_id, skip=skip, limit=limit)
 
     async def get_by_client_id(
-        self, client_id: str, skip: int = 0, limit: int = 100
+        self, client_id: UUID, skip: int = 0, limit: int = 100
     ) -> List[Workspace]:
         """클라이언트 ID로 워크스페이스 목록 조회"""
-        with get_db_session() as session:
-            repo = SQLAlchemyWorkspaceRepository(session)
-            return repo.find_by_client_id(client_id)[skip : skip + limit]
+        async with workspace_repository(self.session) as repo:
+            return await repo.find_by_client_id(client_id, skip=skip, limit=limit)
 
     async def get_by_status(
         self, status: WorkspaceStatus, skip: int = 0, limit: int = 100
     ) -> List[Workspace]:
         """상태로 워크스페이스 목록 조회"""
-        with get_db_session() as session:
-            repo = SQLAlchemyWorkspaceRepository(session)
-            return repo.find_by_status(status)[skip : skip + limit]
+        async with workspace_repository(self.session) as repo:
+            return await repo.find_by_status(status, skip=skip, limit=limit)
 
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[Workspace]:
         """모든 워크스페이스 조회"""
-        with get_db_session() as session:
-            repo = SQLAlchemyWorkspaceRepository(session)
-            return repo.find_all(skip=skip, limit=limit)
+        async with workspace_repository(self.session) as repo:
+            return await repo.find_all(skip=skip, limit=limit)
+
+    async def get_all_summary(self, skip: int = 0, limit: int = 100) -> List[Row]:
+        """목록 화면용 워크스페이스 요약 조회"""
+        async with workspace_repository(self.session) as repo:
+            return await repo.find_all_summary(skip=skip, limit=limit)
 
     async def search(
         self,
         search_term: Optional[str] = None,
         status: Optional[WorkspaceStatus] = None,
-        owner_id: Optional[str] = None,
-        team_id: Optional[str] = None,
-        client_id: Optional[str] = None,
+        owner_id: Optional[UUID] = None,
+        team_id: Optional[UUID] = None,
+        client_id: Optional[UUID] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         skip: int = 0,
         limit: int = 100,
+        after: Optional[Tuple[datetime, UUID]] = None,
     ) -> List[Workspace]:
         """고급 검색"""
-        with get_db_session() as session:
-            repo = SQLAlchemyWorkspaceRepository(session)
-            return repo.search_workspaces(
+        async with workspace_repository(self.session) as repo:
+            return await repo.search_workspaces(
                 search_term=search_term,
                 status=status,
                 owner_id=owner_id,
@@ -88,104 +139,141 @@ class WorkspaceQuery:
                 end_date=end_date,
                 skip=skip,
                 limit=limit,
+                after=after,
             )
 
-    async def exists_by_id(self, workspace_id: str) -> bool:
+    async def count_search(
+        self,
+        search_term: Optional[str] = None,
+        status: Optional[WorkspaceStatus] = None,
+        owner_id: Optional[UUID] = None,
+        team_id: Optional[UUID] = None,
+        client_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> int:
+        """검색 조건에 맞는 전체 개수 조회"""
+        async with workspace_repository(self.session) as repo:
+            return await repo.count_search(
+                search_term=search_term,
+                status=status,
+                owner_id=owner_id,
+                team_id=team_id,
+                client_id=client_id,
+                start_date=start_date,
+                end_date=end_date,
+            )
+
+    async def exists_by_id(self, workspace_id: UUID) -> bool:
         """워크스페이스 존재 여부 확인"""
-        with get_db_session() as session:
-            repo = SQLAlchemyWorkspaceRepository(session)
-            return repo.exists_by_id(workspace_id)
+        async with workspace_repository(self.session) as repo:
+            return await repo.exists_by_id(workspace_id)
+
+    async def exists_by_ids(self, workspace_ids: List[UUID]) -> Set[UUID]:
+        """여러 워크스페이스 존재 여부 일괄 확인 (존재하는 ID 집합 반환)"""
+        async with workspace_repository(self.session) as repo:
+            return await repo.exists_by_ids(workspace_ids)
 
     async def exists_by_name(self, name: str) -> bool:
         """이름으로 워크스페이스 존재 여부 확인"""
-        with get_db_session() as session:
-            repo = SQLAlchemyWorkspaceRepository(session)
-            return repo.exists_by_name(name)
+        async with workspace_repository(self.session) as repo:
+            return await repo.exists_by_name(name)
 
 
 class WorkspaceStatisticsQuery:
     """워크스페이스 통계 Query"""
 
-    def __init__(self):
-        self.query = WorkspaceQuery()
+    def __init__(self, session: Optional[AsyncSession] = None):
+        self.session = session
 
     async def get_status_count(self) -> dict:
         """상태별 워크스페이스 개수 조회"""
-        with get_db_session() as session:
-            repo = SQLAlchemyWorkspaceRepository(session)
+        async with workspace_repository(self.session) as repo:
 
-            stats = {}
-            for status in WorkspaceStatus:
-                workspaces = repo.find_by_status(status)
-                stats[status.value] = len(workspaces)
+            counts = await repo.count_by_status()
+            return {status.value: counts.get(status, 0) for status in WorkspaceStatus}
 
-            return stats
+    async def get_status_overview(self) -> dict:
+        """상태별 개수 + 전체 개수("total") 조회 (쿼리 1회)"""
+        async with workspace_repository(self.session) as repo:
+            counts, total = await repo.count_by_status_with_total()
+        return {"total": total, **{status.value: counts.get(status, 0) for status in WorkspaceStatus}}
 
-    async def get_owner_workspace_count(self, owner_id: str) -> int:
+    async def get_owner_workspace_count(self, owner_id: UUID) -> int:
         """소유자별 워크스페이스 개수 조회"""
-        with get_db_session() as session:
-            repo = SQLAlchemyWorkspaceRepository(session)
-            workspaces = repo.find_by_owner_id(owner_id)
-            return len(workspaces)
+        async with workspace_repository(self.session) as repo:
+            return await repo.count_by_owner_id(owner_id)
 
-    async def get_team_workspace_count(self, team_id: str) -> int:
+    async def get_team_workspace_count(self, team_id: UUID) -> int:
         """팀별 워크스페이스 개수 조회"""
-        with get_db_session() as session:
-            repo = SQLAlchemyWorkspaceRepository(session)
-            workspaces = repo.find_by_team_id(team_id)
-            return len(workspaces)
+        async with workspace_repository(self.session) as repo:
+            return await repo.count_by_team_id(team_id)
 
-    async def get_client_workspace_count(self, client_id: str) -> int:
+    async def get_client_workspace_count(self, client_id: UUID) -> int:
         """클라이언트별 워크스페이스 개수 조회"""
-        with get_db_session() as session:
-            repo = SQLAlchemyWorkspaceRepository(session)
-            workspaces = repo.find_by_client_id(client_id)
-            return len(workspaces)
+        async with workspace_repository(self.session) as repo:
+            return await repo.count_by_client_id(client_id)
 
     async def get_total_count(self) -> int:
         """전체 워크스페이스 개수 조회"""
-        with get_db_session() as session:
-            repo = SQLAlchemyWorkspaceRepository(session)
-            workspaces = repo.find_all(limit=10000)  # 큰 수로 설정하여 전체 조회
-            return len(workspaces)
+        async with workspace_repository(self.session) as repo:
+            return await repo.count_all()
+
+
+# 세션을 넘기지 않는 호출에서 재사용하는 기본 인스턴스 (상태 없음)
+_DEFAULT_QUERY = WorkspaceQuery()
+_DEFAULT_STATISTICS_QUERY = WorkspaceStatisticsQuery()
+
+
+def _workspace_query(session: Optional[AsyncSession]) -> WorkspaceQuery:
+    return _DEFAULT_QUERY if session is None else WorkspaceQuery(session)
 
 
 # 편의를 위한 팩토리 함수들
-async def get_workspace_by_id(workspace_id: str) -> Optional[Workspace]:
+async def get_workspace_by_id(workspace_id: UUID, session: Optional[AsyncSession] = None) -> Optional[Workspace]:
     """ID로 워크스페이스 조회 편의 함수"""
-    query = WorkspaceQuery()
+    query = _workspace_query(session)
     return await query.get_by_id(workspace_id)
 
 
+async def get_workspaces_by_ids(
+    workspace_ids: List[UUID], session: Optional[AsyncSession] = None
+) -> List[Workspace]:
+    """여러 ID로 워크스페이스 조회 편의 함수 (ID마다 get_workspace_by_id를 부르는 대신 사용)"""
+    query = _workspace_query(session)
+    return await query.get_by_ids(workspace_ids)
+
+
 async def get_workspaces_by_owner(
-    owner_id: str, skip: int = 0, limit: int = 100
+    owner_id: UUID, skip: int = 0, limit: int = 100, session: Optional[AsyncSession] = None
 ) -> List[Workspace]:
     """소유자별 워크스페이스 조회 편의 함수"""
-    query = WorkspaceQuery()
+    query = _workspace_query(session)
     return await query.get_by_owner_id(owner_id, skip=skip, limit=limit)
 
 
 async def get_workspaces_by_status(
-    status: WorkspaceStatus, skip: int = 0, limit: int = 100
+    status: WorkspaceStatus, skip: int = 0, limit: int = 100, session: Optional[AsyncSession] = None
 ) -> List[Workspace]:
     """상태별 워크스페이스 조회 편의 함수"""
-    query = WorkspaceQuery()
+    query = _workspace_query(session)
     return await query.get_by_status(status, skip=skip, limit=limit)
 
 
 async def search_workspaces(
     search_term: Optional[str] = None,
     status: Optional[WorkspaceStatus] = None,
-    owner_id: Optional[str] = None,
-    team_id: Optional[str] = None,
-    client_id: Optional[str] = None,
+    owner_id: Optional[UUID] = None,
+    team_id: Optional[UUID] = None,
+    client_id: Optional[UUID] = None,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     skip: int = 0,
     limit: int = 100,
+    session: Optional[AsyncSession] = None,
 ) -> List[Workspace]:
     """워크스페이스 검색 편의 함수"""
-    query = WorkspaceQuery()
+    query = _workspace_query(session)
     return await query.search(
         search_term=search_term,
         status=status,
@@ -199,7 +287,102 @@ async def search_workspaces(
     )
 
 
-async def get_workspace_statistics() -> dict:
-    """워크스페이스 통계 조회 편의 함수"""
-    stats_query = WorkspaceStatisticsQuery()
-    return await stats_query.get_status_count()
+async def count_workspaces(
+    search_term: Optional[str] = None,
+    status: Optional[WorkspaceStatus] = None,
+    owner_id: Optional[UUID] = None,
+    team_id: Optional[UUID] = None,
+    client_id: Optional[UUID] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    session: Optional[AsyncSession] = None,
+) -> int:
+    """검색 조건별 워크스페이스 개수 조회 편의 함수"""
+    query = _workspace_query(session)
+    return await query.count_search(
+        search_term=search_term,
+        status=status,
+        owner_id=owner_id,
+        team_id=team_id,
+        client_id=client_id,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+
+async def search_workspaces_with_total(
+    search_term: Optional[str] = None,
+    status: Optional[WorkspaceStatus] = None,
+    owner_id: Optional[UUID] = None,
+    team_id: Optional[UUID] = None,
+    client_id: Optional[UUID] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    skip: int = 0,
+    limit: int = 100,
+    session: Optional[AsyncSession] = None,
+) -> Tuple[List[Workspace], int]:
+    """목록 화면용 (페이지, 전체 개수) 조회
+
+    세션을 넘기지 않으면 두 쿼리가 각자 커넥션을 받아 동시에 실행되고 (한쪽이 실패하면 다른 쪽은 취소),
+    넘긴 세션은 동시 실행을 지원하지 않으므로 순서대로 실행한다.
+    """
+    filters = {
+        "search_term": search_term,
+        "status": status,
+        "owner_id": owner_id,
+        "team_id": team_id,
+        "client_id": client_id,
+        "start_date": start_date,
+        "end_date": end_date,
+    }
+    if session is not None:
+        query = WorkspaceQuery(session)
+        return await query.search(**filters, skip=skip, limit=limit), await query.count_search(**filters)
+
+    async with asyncio.TaskGroup() as tg:
+        page_task = tg.create_task(_DEFAULT_QUERY.search(**filters, skip=skip, limit=limit))
+        count_task = tg.create_task(_DEFAULT_QUERY.count_search(**filters))
+    return page_task.result(), count_task.result()
+
+
+async def search_workspaces_after(
+    search_term: Optional[str] = None,
+    status: Optional[WorkspaceStatus] = None,
+    owner_id: Optional[UUID] = None,
+    team_id: Optional[UUID] = None,
+    client_id: Optional[UUID] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    after: Optional[Tuple[datetime, UUID]] = None,
+    limit: int = 100,
+    session: Optional[AsyncSession] = None,
+) -> Tuple[List[Workspace], Optional[Tuple[datetime, UUID]]]:
+    """keyset 페이지 조회 (OFFSET 없이 after 다음 행부터, 페이지 깊이와 무관하게 limit건만 읽음)
+
+    limit + 1건을 읽어 다음 페이지 존재 여부를 판단하고,
+    다음 페이지가 있으면 마지막 행의 (created_at, id)를 함께 반환한다.
+    """
+    query = _workspace_query(session)
+    workspaces = await query.search(
+        search_term=search_term,
+        status=status,
+        owner_id=owner_id,
+        team_id=team_id,
+        client_id=client_id,
+        start_date=start_date,
+        end_date=end_date,
+        limit=limit + 1,
+        after=after,
+    )
+    if len(workspaces) <= limit:
+        return workspaces, None
+    workspaces = workspaces[:limit]
+    return workspaces, (workspaces[-1].created_at, workspaces[-1].id)
+
+
+async def get_workspace_statistics(session: Optional[AsyncSession] = None) -> dict:
+    """워크스페이스 통계 조회 편의 함수 (상태별 개수 + "total", 세션 없이 호출하면 STATISTICS_TTL초 캐시)"""
+    if session is not None:
+        return await WorkspaceStatisticsQuery(session).get_status_overview()
+    return await get_cached_statistics(_DEFAULT_STATISTICS_QUERY.get_status_overview)
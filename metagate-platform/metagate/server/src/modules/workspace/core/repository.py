@@ -1,171 +1,402 @@
+import re
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+from uuid import UUID, uuid4
 
-from sqlalchemy import and_, or_, select
-from sqlalchemy.orm import Session
+from sqlalchemy import ColumnElement, Row, and_, delete, event, exists, false, func, inspect, or_, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.infrastructure.database.postgres.config import get_async_db_session
+from src.modules.workspace.core.cache import evict_workspace
 from src.modules.workspace.core.entity import Workspace
 from src.modules.workspace.core.value import WorkspaceStatus
 
+BULK_INSERT_CHUNK_SIZE = 1000
+
+# tsquery 연산자(& | ! ( ) : * ' 등)가 섞이지 않도록 단어 문자만 토큰으로 사용
+_TSQUERY_TOKEN = re.compile(r"\w+")
+
+
+def prefix_search_condition(search_term: str) -> ColumnElement[bool]:
+    """검색어의 모든 단어로 시작하는 단어를 포함하는 워크스페이스 조건 ("work proj" -> 'work':* & 'proj':*)
+
+    ix_ws_search_tsv GIN 인덱스를 사용한다. 단어 앞부분 일치만 지원하며 단어 중간 부분 문자열은 찾지 않는다.
+    """
+    tokens = _TSQUERY_TOKEN.findall(search_term)
+    if not tokens:
+        return false()
+    query = " & ".join(f"{token}:*" for token in tokens)
+    return Workspace.search_tsv.bool_op("@@")(func.to_tsquery("simple", query))
+
 
 class WorkspaceRepository(ABC):
     """워크스페이스 Repository 인터페이스"""
 
     @abstractmethod
-    def save(self, workspace: Workspace) -> Workspace:
+    async def save(self, workspace: Workspace) -> Workspace:
         """워크스페이스 저장"""
         pass
 
     @abstractmethod
-    def find_by_id(self, workspace_id: str) -> Optional[Workspace]:
+    async def find_by_id(self, workspace_id: UUID) -> Optional[Workspace]:
         """ID로 워크스페이스 조회"""
         pass
 
     @abstractmethod
-    def find_by_name(self, name: str) -> Optional[Workspace]:
+    async def find_by_ids(self, workspace_ids: List[UUID]) -> List[Workspace]:
+        """여러 ID로 워크스페이스 일괄 조회"""
+        pass
+
+    @abstractmethod
+    async def find_by_name(self, name: str) -> Optional[Workspace]:
         """이름으로 워크스페이스 조회"""
         pass
 
     @abstractmethod
-    def find_by_owner_id(self, owner_id: str) -> List[Workspace]:
+    async def find_by_owner_id(self, owner_id: UUID, skip: int = 0, limit: int = 100) -> List[Workspace]:
         """소유자 ID로 워크스페이스 목록 조회"""
         pass
 
     @abstractmethod
-    def find_by_team_id(self, team_id: str) -> List[Workspace]:
+    async def find_by_team_id(self, team_id: UUID, skip: int = 0, limit: int = 100) -> List[Workspace]:
         """팀 ID로 워크스페이스 목록 조회"""
         pass
 
     @abstractmethod
-    def find_by_client_id(self, client_id: str) -> List[Workspace]:
+    async def find_by_client_id(self, client_id: UUID, skip: int = 0, limit: int = 100) -> List[Workspace]:
         """클라이언트 ID로 워크스페이스 목록 조회"""
         pass
 
     @abstractmethod
-    def find_by_status(self, status: WorkspaceStatus) -> List[Workspace]:
+    async def find_by_status(self, status: WorkspaceStatus, skip: int = 0, limit: int = 100) -> List[Workspace]:
         """상태로 워크스페이스 목록 조회"""
         pass
 
     @abstractmethod
-    def find_all(self, skip: int = 0, limit: int = 100) -> List[Workspace]:
+    async def find_all(self, skip: int = 0, limit: int = 100) -> List[Workspace]:
         """모든 워크스페이스 조회 (페이징)"""
         pass
 
     @abstractmethod
-    def delete(self, workspace_id: str) -> bool:
+    async def find_all_summary(self, skip: int = 0, limit: int = 100) -> List[Row]:
+        """워크스페이스 요약 (id, 이름, 상태, 소유자) 목록 조회"""
+        pass
+
+    @abstractmethod
+    async def update_if_unmodified(
+        self, workspace_id: UUID, expected_updated_at: Sequence[datetime], values: dict
+    ) -> Optional[Workspace]:
+        """updated_at이 expected_updated_at 중 하나와 같을 때만 워크스페이스 수정 (바뀐 값이 없으면 현재 행 그대로)"""
+        pass
+
+    @abstractmethod
+    async def delete(self, workspace_id: UUID, expected_updated_at: Optional[Sequence[datetime]] = None) -> bool:
         """워크스페이스 삭제"""
         pass
 
     @abstractmethod
-    def exists_by_id(self, workspace_id: str) -> bool:
+    async def exists_by_id(self, workspace_id: UUID) -> bool:
         """워크스페이스 존재 여부 확인"""
         pass
 
     @abstractmethod
-    def exists_by_name(self, name: str) -> bool:
-        """이름으로 워크스페이스 존재 여부 확인"""
+    async def exists_by_ids(self, workspace_ids: List[UUID]) -> Set[UUID]:
+        """주어진 ID 중 존재하는 워크스페이스 ID 조회"""
+        pass
+
+    @abstractmethod
+    async def exists_by_name(self, name: str, exclude_id: UUID | None = None) -> bool:
+        """이름으로 워크스페이스 존재 여부 확인 (exclude_id는 제외)"""
+        pass
+
+    @abstractmethod
+    async def find_existing_names(self, names: List[str]) -> Set[str]:
+        """주어진 이름 중 이미 존재하는 이름 조회"""
+        pass
+
+    @abstractmethod
+    async def bulk_create(self, payloads: List[dict]) -> List[UUID]:
+        """워크스페이스 일괄 생성 (생성된 ID 목록 반환)"""
+        pass
+
+    @abstractmethod
+    async def count_all(self) -> int:
+        """전체 워크스페이스 개수 조회"""
+        pass
+
+    @abstractmethod
+    async def count_by_owner_id(self, owner_id: UUID) -> int:
+        """소유자 ID별 워크스페이스 개수 조회"""
+        pass
+
+    @abstractmethod
+    async def count_by_team_id(self, team_id: UUID) -> int:
+        """팀 ID별 워크스페이스 개수 조회"""
+        pass
+
+    @abstractmethod
+    async def count_by_client_id(self, client_id: UUID) -> int:
+        """클라이언트 ID별 워크스페이스 개수 조회"""
+        pass
+
+    @abstractmethod
+    async def count_by_status(self) -> Dict[WorkspaceStatus, int]:
+        """상태별 워크스페이스 개수 조회"""
+        pass
+
+    @abstractmethod
+    async def count_by_status_with_total(self) -> Tuple[Dict[WorkspaceStatus, int], int]:
+        """상태별 개수와 전체 개수 조회"""
+        pass
+
+    @abstractmethod
+    async def count_search(
+        self,
+        search_term: Optional[str] = None,
+        status: Optional[WorkspaceStatus] = None,
+        owner_id: Optional[UUID] = None,
+        team_id: Optional[UUID] = None,
+        client_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> int:
+        """검색 조건에 맞는 워크스페이스 개수 조회"""
         pass
 
 
 class SQLAlchemyWorkspaceRepository(WorkspaceRepository):
-    """SQLAlchemy 기반 워크스페이스 Repository 구현체"""
+    """SQLAlchemy 기반 워크스페이스 Repository 구현체
 
-    def __init__(self, session: Session):
+    쓰기 메서드는 flush까지만 하고 커밋하지 않는다 (커밋은 세션을 연 쪽에서, workspace_repository 참고).
+    """
+
+    def __init__(self, session: AsyncSession):
         self.session = session
 
-    def save(self, workspace: Workspace) -> Workspace:
+    def _evict(self, workspace_id: UUID, names: Iterable[str] = ()) -> None:
+        """캐시를 지금 비우고 커밋 직후 한 번 더 비움 (커밋 전에 다른 요청이 이전 값을 다시 캐시한 경우 대비)"""
+        names = tuple(names)
+        evict_workspace(workspace_id, names)
+        event.listen(
+            self.session.sync_session, "after_commit", lambda _session: evict_workspace(workspace_id, names), once=True
+        )
+
+    async def save(self, workspace: Workspace) -> Workspace:
         """워크스페이스 저장"""
+        previous_names = inspect(workspace).attrs.name.history.deleted
         self.session.add(workspace)
-        self.session.commit()
-        self.session.refresh(workspace)
+        # created_at/updated_at은 eager_defaults로 INSERT/UPDATE ... RETURNING 시 함께 채워지므로 refresh 불필요
+        await self.session.flush()
+        self._evict(workspace.id, (workspace.name, *previous_names))
         return workspace
 
-    def find_by_id(self, workspace_id: str) -> Optional[Workspace]:
+    async def find_by_id(self, workspace_id: UUID) -> Optional[Workspace]:
         """ID로 워크스페이스 조회"""
-        stmt = select(Workspace).where(Workspace.id == workspace_id)
-        result = self.session.execute(stmt)
-        return result.scalar_one_or_none()
+        # identity map에 있으면 쿼리 없이 반환, 없으면 기본 키 조회 1회
+        return await self.session.get(Workspace, workspace_id)
+
+    async def find_by_ids(self, workspace_ids: List[UUID]) -> List[Workspace]:
+        """여러 ID로 워크스페이스 일괄 조회 (IN 한 번, 없는 ID는 결과에서 빠짐)"""
+        if not workspace_ids:
+            return []
+        stmt = select(Workspace).where(Workspace.id.in_(workspace_ids))
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
 
-    def find_by_name(self, name: str) -> Optional[Workspace]:
+    async def find_by_name(self, name: str) -> Optional[Workspace]:
         """이름으로 워크스페이스 조회"""
         stmt = select(Workspace).where(Workspace.name == name)
-        result = self.session.execute(stmt)
+        result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    def find_by_owner_id(self, owner_id: str) -> List[Workspace]:
+    async def find_by_owner_id(self, owner_id: UUID, skip: int = 0, limit: int = 100) -> List[Workspace]:
         """소유자 ID로 워크스페이스 목록 조회"""
-        stmt = select(Workspace).where(Workspace.owner_id == owner_id)
-        result = self.session.execute(stmt)
+        stmt = (
+            select(Workspace)
+            .where(Workspace.owner_id == owner_id)
+            .order_by(Workspace.created_at.desc(), Workspace.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
-    def find_by_team_id(self, team_id: str) -> List[Workspace]:
+    async def find_by_team_id(self, team_id: UUID, skip: int = 0, limit: int = 100) -> List[Workspace]:
         """팀 ID로 워크스페이스 목록 조회"""
-        stmt = select(Workspace).where(Workspace.team_id == team_id)
-        result = self.session.execute(stmt)
+        stmt = (
+            select(Workspace)
+            .where(Workspace.team_id == team_id)
+            .order_by(Workspace.created_at.desc(), Workspace.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
-    def find_by_client_id(self, client_id: str) -> List[Workspace]:
+    async def find_by_client_id(self, client_id: UUID, skip: int = 0, limit: int = 100) -> List[Workspace]:
         """클라이언트 ID로 워크스페이스 목록 조회"""
-        stmt = select(Workspace).where(Workspace.client_id == client_id)
-        result = self.session.execute(stmt)
+        stmt = (
+            select(Workspace)
+            .where(Workspace.client_id == client_id)
+            .order_by(Workspace.created_at.desc(), Workspace.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
-    def find_by_status(self, status: WorkspaceStatus) -> List[Workspace]:
+    async def find_by_status(self, status: WorkspaceStatus, skip: int = 0, limit: int = 100) -> List[Workspace]:
         """상태로 워크스페이스 목록 조회"""
-        stmt = select(Workspace).where(Workspace.workspace_status == status)
-        result = self.session.execute(stmt)
+        stmt = (
+            select(Workspace)
+            .where(Workspace.workspace_status == status)
+            .order_by(Workspace.created_at.desc(), Workspace.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
-    def find_all(self, skip: int = 0, limit: int = 100) -> List[Workspace]:
+    async def find_all(self, skip: int = 0, limit: int = 100) -> List[Workspace]:
         """모든 워크스페이스 조회 (페이징)"""
         stmt = select(Workspace).offset(skip).limit(limit)
-        result = self.session.execute(stmt)
+        result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
-    def delete(self, workspace_id: str) -> bool:
-        """워크스페이스 삭제"""
-        workspace = self.find_by_id(workspace_id)
-        if workspace:
-            self.session.delete(workspace)
-            self.session.commit()
-            return True
-        return False
-
-    def exists_by_id(self, workspace_id: str) -> bool:
+    async def find_all_summary(self, skip: int = 0, limit: int = 100) -> List[Row]:
+        """워크스페이스 요약 (id, 이름, 상태, 소유자) 목록 조회 (ORM 객체 없이 컬럼만)"""
+        stmt = (
+            select(Workspace.id, Workspace.name, Workspace.workspace_status, Workspace.owner_id)
+            .order_by(Workspace.created_at.desc(), Workspace.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
+    async def update_if_unmodified(
+        self, workspace_id: UUID, expected_updated_at: Sequence[datetime], values: dict
+    ) -> Optional[Workspace]:
+        """updated_at이 expected_updated_at 중 하나와 같을 때만 수정 (UPDATE ... RETURNING 한 번, 불일치/없음이면 None)
+
+        값이 하나도 바뀌지 않으면 UPDATE 하지 않으므로 updated_at(ETag)도 그대로이고, 현재 행을 반환한다.
+        """
+        matched = (Workspace.id == workspace_id, Workspace.updated_at.in_(expected_updated_at))
+        stmt = (
+            update(Workspace)
+            .where(*matched, or_(*(getattr(Workspace, field).is_distinct_from(value) for field, value in values.items())))
+            .values(**values)
+            .returning(Workspace)
+            .execution_options(synchronize_session=False)
+        )
+        workspace = (await self.session.execute(stmt)).scalar_one_or_none()
+        if workspace is not None:
+            self._evict(workspace_id, (workspace.name,))
+            return workspace
+        # 0행: 조건은 맞지만 바뀐 값이 없는 경우만 현재 행, 불일치/없음은 None
+        return (await self.session.execute(select(Workspace).where(*matched))).scalar_one_or_none()
+
+    async def delete(self, workspace_id: UUID, expected_updated_at: Optional[Sequence[datetime]] = None) -> bool:
+        """워크스페이스 삭제 (expected_updated_at을 주면 updated_at이 그중 하나와 같을 때만)"""
+        stmt = delete(Workspace).where(Workspace.id == workspace_id)
+        if expected_updated_at is not None:
+            stmt = stmt.where(Workspace.updated_at.in_(expected_updated_at))
+        result = await self.session.execute(stmt)
+        self._evict(workspace_id)
+        return result.rowcount > 0
+
+    async def exists_by_id(self, workspace_id: UUID) -> bool:
         """워크스페이스 존재 여부 확인"""
-        stmt = select(Workspace.id).where(Workspace.id == workspace_id)
-        result = self.session.execute(stmt)
-        return result.scalar_one_or_none() is not None
-
-    def exists_by_name(self, name: str) -> bool:
-        """이름으로 워크스페이스 존재 여부 확인"""
-        stmt = select(Workspace.id).where(Workspace.name == name)
-        result = self.session.execute(stmt)
-        return result.scalar_one_or_none() is not None
-
-    def search_workspaces(
+        stmt = select(exists().where(Workspace.id == workspace_id))
+        return bool((await self.session.execute(stmt)).scalar())
+
+    async def exists_by_ids(self, workspace_ids: List[UUID]) -> Set[UUID]:
+        """주어진 ID 중 존재하는 워크스페이스 ID 조회 (IN 한 번)"""
+        if not workspace_ids:
+            return set()
+        stmt = select(Workspace.id).where(Workspace.id.in_(workspace_ids))
+        return set((await self.session.execute(stmt)).scalars().all())
+
+    async def exists_by_name(self, name: str, exclude_id: UUID | None = None) -> bool:
+        """이름으로 워크스페이스 존재 여부 확인 (exclude_id는 제외, 행을 로드하지 않는 EXISTS 한 번)"""
+        condition = Workspace.name == name
+        if exclude_id is not None:
+            condition = and_(condition, Workspace.id != exclude_id)
+        stmt = select(exists().where(condition))
+        return bool((await self.session.execute(stmt)).scalar())
+
+    async def find_existing_names(self, names: List[str]) -> Set[str]:
+        """주어진 이름 중 이미 존재하는 이름 조회 (IN 한 번)"""
+        if not names:
+            return set()
+        stmt = select(Workspace.name).where(Workspace.name.in_(names))
+        return set((await self.session.execute(stmt)).scalars().all())
+
+    async def bulk_create(self, payloads: List[dict]) -> List[UUID]:
+        """워크스페이스 일괄 생성 (ORM 객체 없이 1000건 단위 INSERT, 같은 트랜잭션)"""
+        rows = [
+            {"id": uuid4(), "workspace_status": WorkspaceStatus.ACTIVE, **payload}
+            for payload in payloads
+        ]
+        for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+            await self.session.execute(Workspace.__table__.insert(), rows[start : start + BULK_INSERT_CHUNK_SIZE])
+        return [row["id"] for row in rows]
+
+    async def count_all(self) -> int:
+        """전체 워크스페이스 개수 조회"""
+        stmt = select(func.count()).select_from(Workspace)
+        return (await self.session.execute(stmt)).scalar_one()
+
+    async def count_by_owner_id(self, owner_id: UUID) -> int:
+        """소유자 ID별 워크스페이스 개수 조회"""
+        stmt = select(func.count()).select_from(Workspace).where(Workspace.owner_id == owner_id)
+        return (await self.session.execute(stmt)).scalar_one()
+
+    async def count_by_team_id(self, team_id: UUID) -> int:
+        """팀 ID별 워크스페이스 개수 조회"""
+        stmt = select(func.count()).select_from(Workspace).where(Workspace.team_id == team_id)
+        return (await self.session.execute(stmt)).scalar_one()
+
+    async def count_by_client_id(self, client_id: UUID) -> int:
+        """클라이언트 ID별 워크스페이스 개수 조회"""
+        stmt = select(func.count()).select_from(Workspace).where(Workspace.client_id == client_id)
+        return (await self.session.execute(stmt)).scalar_one()
+
+    async def count_by_status(self) -> Dict[WorkspaceStatus, int]:
+        """상태별 워크스페이스 개수 조회 (GROUP BY 한 번으로 전체 상태 집계)"""
+        stmt = select(Workspace.workspace_status, func.count()).group_by(Workspace.workspace_status)
+        return dict((await self.session.execute(stmt)).all())
+
+    async def count_by_status_with_total(self) -> Tuple[Dict[WorkspaceStatus, int], int]:
+        """상태별 개수와 전체 개수를 한 번에 조회 (GROUP BY ROLLUP, 상태가 NULL인 행이 합계)"""
+        stmt = select(Workspace.workspace_status, func.count()).group_by(func.rollup(Workspace.workspace_status))
+        counts: Dict[WorkspaceStatus, int] = {}
+        total = 0
+        for status, count in (await self.session.execute(stmt)).all():
+            if status is None:
+                total = count
+            else:
+                counts[status] = count
+        return counts, total
+
+    def _search_conditions(
         self,
-        search_term: Optional[str] = None,
-        status: Optional[WorkspaceStatus] = None,
-        owner_id: Optional[str] = None,
-        team_id: Optional[str] = None,
-        client_id: Optional[str] = None,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-        skip: int = 0,
-        limit: int = 100,
-    ) -> List[Workspace]:
-        """고급 검색 기능"""
+        search_term: Optional[str],
+        status: Optional[WorkspaceStatus],
+        owner_id: Optional[UUID],
+        team_id: Optional[UUID],
+        client_id: Optional[UUID],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> list:
+        """search_workspaces/count_search가 공유하는 WHERE 조건"""
         conditions = []
 
         if search_term:
-            conditions.append(
-                or_(
-                    Workspace.name.ilike(f"%{search_term}%"),
-                    Workspace.description.ilike(f"%{search_term}%"),
-                )
-            )
+            conditions.append(prefix_search_condition(search_term))
 
         if status:
             conditions.append(Workspace.workspace_status == status)
@@ -185,10 +416,62 @@ class SQLAlchemyWorkspaceRepository(WorkspaceRepository):
         if end_date:
             conditions.append(Workspace.end_date <= end_date)
 
+        return conditions
+
+    async def search_workspaces(
+        self,
+        search_term: Optional[str] = None,
+        status: Optional[WorkspaceStatus] = None,
+        owner_id: Optional[UUID] = None,
+        team_id: Optional[UUID] = None,
+        client_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[Workspace]:
+        """고급 검색 기능 (최신순, after=(created_at, id)를 주면 그 행 다음부터 keyset 페이징)"""
+        conditions = self._search_conditions(search_term, status, owner_id, team_id, client_id, start_date, end_date)
+        if after is not None:
+            conditions.append(tuple_(Workspace.created_at, Workspace.id) < tuple_(*after))
+
         stmt = select(Workspace)
         if conditions:
             stmt = stmt.where(and_(*conditions))
 
-        stmt = stmt.offset(skip).limit(limit)
-        result = self.session.execute(stmt)
+        stmt = stmt.order_by(Workspace.created_at.desc(), Workspace.id.desc()).offset(skip).limit(limit)
+        result = await self.session.execute(stmt)
         return list(result.scalars().all())
+
+    async def count_search(
+        self,
+        search_term: Optional[str] = None,
+        status: Optional[WorkspaceStatus] = None,
+        owner_id: Optional[UUID] = None,
+        team_id: Optional[UUID] = None,
+        client_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> int:
+        """search_workspaces와 같은 조건의 전체 개수 조회 (페이징 없음)"""
+        conditions = self._search_conditions(search_term, status, owner_id, team_id, client_id, start_date, end_date)
+
+        stmt = select(func.count()).select_from(Workspace)
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+        return (await self.session.execute(stmt)).scalar_one()
+
+
+@asynccontextmanager
+async def workspace_repository(session: Optional[AsyncSession] = None) -> AsyncIterator["SQLAlchemyWorkspaceRepository"]:
+    """주어진 세션을 재사용하고, 없으면 새 세션을 열어 Repository 제공
+
+    호출자 세션이면 커밋은 호출자 몫이고, 직접 연 세션은 get_async_db_session이 종료 시 커밋(예외 시 롤백)한다.
+    """
+    if session is not None:
+        yield SQLAlchemyWorkspaceRepository(session)
+        return
+
+    async with get_async_db_session() as new_session:
+        yield SQLAlchemyWorkspaceRepository(new_session)
@@ -1,313 +1,437 @@
+import base64
+import re
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from functools import cache
+from typing import Annotated, Callable, List, Literal, Optional, Tuple, get_args
+from uuid import UUID
 
-from pydantic import BaseModel, Field
+import msgspec
+import orjson
+from fastapi import Path, Query
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, TypeAdapter
 
+from src.infrastructure.utils.exception_handler import DomainValidationError, PreconditionFailedError
+from src.modules.workspace.core.entity import Workspace
 from src.modules.workspace.core.value import WorkspaceStatus
 
+# 스키마 경계에서는 Enum 대신 Literal로 검증하고, 도메인으로 넘길 때만 WorkspaceStatus(lit)로 변환
+WorkspaceStatusLit = Literal["active", "inactive", "completed", "cancelled", "on_hold", "in_progress", "pending"]
+_STATUS_BY_VALUE = {status.value: status for status in WorkspaceStatus}
+# python -O에서도 검사하도록 assert 대신 예외 (Literal과 Enum이 어긋나면 import 시점에 실패)
+if set(get_args(WorkspaceStatusLit)) != _STATUS_BY_VALUE.keys():
+    raise RuntimeError("WorkspaceStatusLit과 WorkspaceStatus 값이 일치하지 않습니다.")
+
+
+def to_workspace_status(value: WorkspaceStatusLit) -> WorkspaceStatus:
+    """검증된 상태 문자열을 도메인 Enum으로 변환 (Enum 생성자 대신 dict 조회)"""
+    return _STATUS_BY_VALUE[value]
+
+
+# 검색어 토큰 (2글자 이상 단어 문자, 장식 기호/한 글자 토큰은 버림)
+_SEARCH_TOKEN = re.compile(r"\w{2,}")
+_MAX_SEARCH_TOKENS = 8
+
+
+def normalize_search_term(search: Optional[str]) -> Optional[str]:
+    """search 쿼리 파라미터를 전문 검색어로 정리 (남는 단어가 없으면 None, 검색 조건 생략)
+
+    각 단어는 이름/설명 단어의 앞부분과 일치해야 한다 ("proj" -> "project" 일치, "ject" -> 불일치).
+    """
+    if not search:
+        return None
+    tokens = _SEARCH_TOKEN.findall(search)[:_MAX_SEARCH_TOKENS]
+    return " ".join(tokens) or None
+
+
+# 생성/수정 스키마가 공유하는 필드 제약 (클래스마다 같은 제약을 다시 만들지 않음)
+WorkspaceName = Annotated[str, StringConstraints(min_length=1, max_length=100)]
+WorkspaceDescription = Annotated[str, StringConstraints(min_length=1, max_length=500)]
+
+# 모든 스키마가 공유하는 설정 (클래스별로 필요한 키만 덮어씀)
+_BASE_CONFIG = ConfigDict(from_attributes=True, extra="ignore")
+
+
+@cache
+def _examples() -> dict:
+    """OpenAPI 예시 (문서 생성 시 처음 호출될 때만 만들어짐)"""
+    return {
+        "WorkspaceCreateSchema": {
+            "name": "새로운 프로젝트",
+            "description": "이 프로젝트는 새로운 기능을 개발하는 워크스페이스입니다.",
+            "start_date": "2024-01-01T00:00:00",
+            "end_date": "2024-12-31T23:59:59",
+            "workspace_status": "active",
+            "owner_id": "0d8f5a62-7c1e-4b9a-8f3d-5e6a7b8c9d01",
+            "team_id": "a3c4e5f6-1b2d-4e8f-9a0b-c1d2e3f4a5b6",
+            "client_id": "b7d8e9f0-3a4b-4c5d-8e6f-7a8b9c0d1e2f",
+        },
+        "WorkspaceUpdateSchema": {
+            "name": "수정된 프로젝트명",
+            "description": "수정된 프로젝트 설명입니다.",
+            "start_date": "2024-01-01T00:00:00",
+            "end_date": "2024-12-31T23:59:59",
+            "workspace_status": "in_progress",
+            "owner_id": "0d8f5a62-7c1e-4b9a-8f3d-5e6a7b8c9d01",
+            "team_id": "a3c4e5f6-1b2d-4e8f-9a0b-c1d2e3f4a5b6",
+            "client_id": "b7d8e9f0-3a4b-4c5d-8e6f-7a8b9c0d1e2f",
+        },
+    }
+
+
+@cache
+def _descriptions() -> dict:
+    """OpenAPI 필드 설명 (Field 메타데이터 대신 스키마 생성 시점에만 주입)"""
+    return {
+        "WorkspaceCreateSchema": {
+            "name": "워크스페이스 이름",
+            "description": "워크스페이스 설명",
+            "start_date": "워크스페이스 시작 날짜 및 시간",
+            "end_date": "워크스페이스 종료 날짜 및 시간 (시작 날짜보다 이후여야 함)",
+            "workspace_status": "워크스페이스 상태 (기본값: active)",
+            "owner_id": "워크스페이스 소유자 ID",
+            "team_id": "워크스페이스 담당 팀 ID",
+            "client_id": "워크스페이스 클라이언트 ID",
+        },
+        "WorkspaceUpdateSchema": {
+            "name": "워크스페이스 이름 (수정 시에만 제공)",
+            "description": "워크스페이스 설명 (수정 시에만 제공)",
+            "start_date": "워크스페이스 시작 날짜 및 시간 (수정 시에만 제공)",
+            "end_date": "워크스페이스 종료 날짜 및 시간 (수정 시에만 제공, 시작 날짜보다 이후여야 함)",
+            "workspace_status": "워크스페이스 상태 (수정 시에만 제공)",
+            "owner_id": "워크스페이스 소유자 ID (수정 시에만 제공)",
+            "team_id": "워크스페이스 담당 팀 ID (수정 시에만 제공)",
+            "client_id": "워크스페이스 클라이언트 ID (수정 시에만 제공)",
+        },
+        "WorkspaceStatusChangeSchema": {
+            "workspace_id": "상태를 변경할 워크스페이스의 고유 ID",
+            "new_status": "새로운 워크스페이스 상태",
+        },
+        "WorkspaceResponseSchema": {
+            "id": "워크스페이스 고유 ID",
+            "name": "워크스페이스 이름",
+            "description": "워크스페이스 설명",
+            "start_date": "시작 날짜",
+            "end_date": "종료 날짜",
+            "workspace_status": "워크스페이스 상태",
+            "owner_id": "소유자 ID",
+            "team_id": "팀 ID",
+            "client_id": "클라이언트 ID",
+            "created_at": "생성 날짜",
+            "updated_at": "수정 날짜",
+        },
+        "WorkspaceListResponseSchema": {
+            "workspaces": "워크스페이스 목록",
+            "total": "전체 워크스페이스 개수 (cursor 조회 시 생략)",
+            "page": "현재 페이지 번호 (cursor 조회 시 생략)",
+            "limit": "페이지 크기",
+            "has_next": "다음 페이지 존재 여부",
+            "has_prev": "이전 페이지 존재 여부",
+            "next_cursor": "다음 페이지 조회용 cursor (마지막 페이지면 null)",
+        },
+    }
+
+
+def _lazy_schema_extra(name: str) -> Callable[[dict], None]:
+    """스키마 생성 시 필드 설명과 예시를 채우는 json_schema_extra"""
+
+    def _extend(schema: dict) -> None:
+        properties = schema.get("properties", {})
+        for field, text in _descriptions()[name].items():
+            if field in properties:
+                properties[field].setdefault("description", text)
+        if name in _examples():
+            schema.setdefault("example", _examples()[name])
+
+    return _extend
+
 
 class WorkspaceCreateSchema(BaseModel):
-    name: str = Field(
-        ...,
-        description="워크스페이스 이름",
-        min_length=1,
-        max_length=100,
-        example="새로운 프로젝트",
-    )
-    description: str = Field(
-        ...,
-        description="워크스페이스 설명",
-        min_length=1,
-        max_length=500,
-        example="이 프로젝트는 새로운 기능을 개발하는 워크스페이스입니다.",
-    )
-    start_date: datetime = Field(
-        ..., description="워크스페이스 시작 날짜 및 시간", example="2024-01-01T00:00:00"
-    )
-    end_date: datetime = Field(
-        ...,
-        description="워크스페이스 종료 날짜 및 시간 (시작 날짜보다 이후여야 함)",
-        example="2024-12-31T23:59:59",
-    )
-    workspace_status: WorkspaceStatus = Field(
-        default=WorkspaceStatus.ACTIVE,
-        description="워크스페이스 상태 (기본값: ACTIVE)",
-        example=WorkspaceStatus.ACTIVE,
-    )
-    owner_id: str = Field(
-        ..., description="워크스페이스 소유자 ID", min_length=1, example="user_123456"
-    )
-    team_id: str = Field(
-        ..., description="워크스페이스 담당 팀 ID", min_length=1, example="team_789"
-    )
-    client_id: str = Field(
-        ...,
-        description="워크스페이스 클라이언트 ID",
-        min_length=1,
-        example="client_456",
-    )
+    name: WorkspaceName
+    description: WorkspaceDescription
+    start_date: datetime
+    end_date: datetime
+    workspace_status: WorkspaceStatusLit = "active"
+    owner_id: UUID
+    team_id: UUID
+    client_id: UUID
 
-    class Config:
-        schema_extra = {
-            "example": {
-                "name": "새로운 프로젝트",
-                "description": "이 프로젝트는 새로운 기능을 개발하는 워크스페이스입니다.",
-                "start_date": "2024-01-01T00:00:00",
-                "end_date": "2024-12-31T23:59:59",
-                "workspace_status": "ACTIVE",
-                "owner_id": "user_123456",
-                "team_id": "team_789",
-                "client_id": "client_456",
-            }
-        }
+    model_config = {
+        **_BASE_CONFIG,
+        "json_schema_extra": _lazy_schema_extra("WorkspaceCreateSchema"),
+    }
+
+
+class WorkspaceBulkCreateItem(msgspec.Struct, kw_only=True):
+    """일괄 생성 요청 항목 (건수가 많아 Pydantic 대신 msgspec으로 디코드+검증)"""
+
+    name: Annotated[str, msgspec.Meta(min_length=1, max_length=100)]
+    description: Annotated[str, msgspec.Meta(min_length=1, max_length=500)]
+    start_date: datetime
+    end_date: datetime
+    workspace_status: WorkspaceStatus = WorkspaceStatus.ACTIVE
+    owner_id: UUID
+    team_id: UUID
+    client_id: UUID
+
+    def __post_init__(self) -> None:
+        """디코드 직후 호출 (여기서 던진 예외는 decode()의 ValidationError로 전달됨)"""
+        if self.end_date < self.start_date:
+            raise msgspec.ValidationError("end_date는 start_date보다 이전일 수 없습니다.")
+
+
+_WORKSPACE_BULK_CREATE_DECODER = msgspec.json.Decoder(list[WorkspaceBulkCreateItem])
+
+
+def decode_workspace_bulk_create(body: bytes) -> List[dict]:
+    """요청 본문을 WorkspaceBulkCreateCommand 입력 형태로 디코드 (검증 실패 시 DomainValidationError)"""
+    try:
+        items = _WORKSPACE_BULK_CREATE_DECODER.decode(body)
+    except msgspec.DecodeError as e:
+        raise DomainValidationError(str(e)) from e
+    return [msgspec.structs.asdict(item) for item in items]
 
 
 class WorkspaceUpdateSchema(BaseModel):
-    name: Optional[str] = Field(
-        None,
-        description="워크스페이스 이름 (수정 시에만 제공)",
-        min_length=1,
-        max_length=100,
-        example="수정된 프로젝트명",
-    )
-    description: Optional[str] = Field(
-        None,
-        description="워크스페이스 설명 (수정 시에만 제공)",
-        min_length=1,
-        max_length=500,
-        example="수정된 프로젝트 설명입니다.",
-    )
-    start_date: Optional[datetime] = Field(
-        None,
-        description="워크스페이스 시작 날짜 및 시간 (수정 시에만 제공)",
-        example="2024-01-01T00:00:00",
-    )
-    end_date: Optional[datetime] = Field(
-        None,
-        description="워크스페이스 종료 날짜 및 시간 (수정 시에만 제공, 시작 날짜보다 이후여야 함)",
-        example="2024-12-31T23:59:59",
-    )
-    workspace_status: Optional[WorkspaceStatus] = Field(
-        None,
-        description="워크스페이스 상태 (수정 시에만 제공)",
-        example=WorkspaceStatus.IN_PROGRESS,
-    )
-    owner_id: Optional[str] = Field(
-        None,
-        description="워크스페이스 소유자 ID (수정 시에만 제공)",
-        min_length=1,
-        example="user_123456",
-    )
-    team_id: Optional[str] = Field(
-        None,
-        description="워크스페이스 담당 팀 ID (수정 시에만 제공)",
-        min_length=1,
-        example="team_789",
-    )
-    client_id: Optional[str] = Field(
-        None,
-        description="워크스페이스 클라이언트 ID (수정 시에만 제공)",
-        min_length=1,
-        example="client_456",
-    )
+    name: WorkspaceName = Field(None)
+    description: WorkspaceDescription = Field(None)
+    start_date: datetime = Field(None)
+    end_date: datetime = Field(None)
+    workspace_status: WorkspaceStatusLit = Field(None)
+    owner_id: UUID = Field(None)
+    team_id: UUID = Field(None)
+    client_id: UUID = Field(None)
 
-    class Config:
-        schema_extra = {
-            "example": {
-                "name": "수정된 프로젝트명",
-                "description": "수정된 프로젝트 설명입니다.",
-                "start_date": "2024-01-01T00:00:00",
-                "end_date": "2024-12-31T23:59:59",
-                "workspace_status": "IN_PROGRESS",
-                "owner_id": "user_123456",
-                "team_id": "team_789",
-                "client_id": "client_456",
-            }
-        }
+    # 미전송 필드는 None 대신 model_fields_set에서 빠지는 것으로 구분 (Optional 유니온 불필요)
+    model_config = {
+        **_BASE_CONFIG,
+        "extra": "forbid",
+        "json_schema_extra": _lazy_schema_extra("WorkspaceUpdateSchema"),
+    }
 
+    def changes(self) -> dict:
+        """요청에 실제로 포함된 필드만 반환 (WorkspaceUpdateCommand.execute 인자)"""
+        changes = {field: getattr(self, field) for field in self.model_fields_set}
+        if "workspace_status" in changes:
+            changes["workspace_status"] = to_workspace_status(changes["workspace_status"])
+        return changes
 
-class WorkspaceDeleteSchema(BaseModel):
-    workspace_id: str = Field(
-        ...,
-        description="삭제할 워크스페이스의 고유 ID",
-        min_length=1,
-        example="ws_123456",
-    )
 
-    class Config:
-        schema_extra = {"example": {"workspace_id": "ws_123456"}}
+# 단건 조회/삭제는 모델 대신 경로 파라미터로 받음 (예: workspace_id: WorkspaceIdPath)
+WorkspaceIdPath = Annotated[UUID, Path(description="워크스페이스 고유 ID")]
 
 
-class WorkspaceGetSchema(BaseModel):
-    workspace_id: str = Field(
-        ...,
-        description="조회할 워크스페이스의 고유 ID",
-        min_length=1,
-        example="ws_123456",
-    )
+class WorkspaceIdsSchema(BaseModel):
+    """여러 워크스페이스 일괄 조회 요청 본문 (get_workspaces_by_ids 입력)"""
 
-    class Config:
-        schema_extra = {"example": {"workspace_id": "ws_123456"}}
+    ids: list[UUID] = Field(min_length=1, max_length=100, description="조회할 워크스페이스 ID 목록 (최대 100개)")
 
+    model_config = _BASE_CONFIG
 
-class WorkspaceListSchema(BaseModel):
-    page: int = Field(
-        default=1, ge=1, description="페이지 번호 (1부터 시작)", example=1
-    )
-    limit: int = Field(
-        default=10, ge=1, le=100, description="페이지 크기 (최대 100개)", example=10
-    )
-    search: Optional[str] = Field(
-        None,
-        description="검색어 (워크스페이스 이름 또는 설명에서 검색)",
-        min_length=1,
-        example="프로젝트",
-    )
-    status: Optional[WorkspaceStatus] = Field(
-        None, description="상태별 필터링", example=WorkspaceStatus.ACTIVE
-    )
-    owner_id: Optional[str] = Field(
-        None, description="소유자 ID로 필터링", min_length=1, example="user_123456"
-    )
-    team_id: Optional[str] = Field(
-        None, description="팀 ID로 필터링", min_length=1, example="team_789"
-    )
-    client_id: Optional[str] = Field(
-        None, description="클라이언트 ID로 필터링", min_length=1, example="client_456"
-    )
 
-    class Config:
-        schema_extra = {
-            "example": {
-                "page": 1,
-                "limit": 10,
-                "search": "프로젝트",
-                "status": "ACTIVE",
-                "owner_id": "user_123456",
-                "team_id": "team_789",
-                "client_id": "client_456",
-            }
-        }
+@dataclass(slots=True)
+class WorkspaceListSchema:
+    """목록 조회 쿼리 파라미터 (Depends()로 주입, 요청마다 모델 인스턴스를 만들지 않음)"""
+
+    page: Annotated[int, Query(ge=1, deprecated=True, description="페이지 번호 (1부터 시작, cursor 사용 권장)")] = 1
+    cursor: Annotated[Optional[str], Query(min_length=1, description="이전 응답의 next_cursor (주면 page 무시)")] = None
+    limit: Annotated[int, Query(ge=1, le=100, description="페이지 크기 (최대 100개)")] = 10
+    search: Annotated[
+        Optional[str],
+        Query(
+            min_length=1,
+            description=(
+                "검색어 (워크스페이스 이름 또는 설명에서 검색). 공백/기호로 나눈 모든 단어가 이름/설명 단어의 "
+                "앞부분과 일치해야 한다 (\"proj\" -> \"project\" 일치). 단어 중간 부분 문자열이나 붙여 쓴 "
+                "복합어 내부는 찾지 않으며 (\"ject\", \"프로젝트관리\"에서 \"관리\" 불일치), "
+                "한 글자 단어는 무시하고 앞의 8개 단어만 사용한다."
+            ),
+        ),
+    ] = None
+    status: Annotated[Optional[WorkspaceStatusLit], Query(description="상태별 필터링")] = None
+    owner_id: Annotated[Optional[UUID], Query(description="소유자 ID로 필터링")] = None
+    team_id: Annotated[Optional[UUID], Query(description="팀 ID로 필터링")] = None
+    client_id: Annotated[Optional[UUID], Query(description="클라이언트 ID로 필터링")] = None
 
 
 class WorkspaceStatusChangeSchema(BaseModel):
-    workspace_id: str = Field(
-        ...,
-        description="상태를 변경할 워크스페이스의 고유 ID",
-        min_length=1,
-        example="ws_123456",
-    )
-    new_status: WorkspaceStatus = Field(
-        ..., description="새로운 워크스페이스 상태", example=WorkspaceStatus.IN_PROGRESS
-    )
+    workspace_id: UUID
+    new_status: WorkspaceStatusLit
 
-    class Config:
-        schema_extra = {
-            "example": {"workspace_id": "ws_123456", "new_status": "IN_PROGRESS"}
-        }
+    model_config = {**_BASE_CONFIG, "json_schema_extra": _lazy_schema_extra("WorkspaceStatusChangeSchema")}
 
 
-class WorkspaceResponseSchema(BaseModel):
-    id: str = Field(..., description="워크스페이스 고유 ID", example="ws_123456")
-    name: str = Field(..., description="워크스페이스 이름", example="새로운 프로젝트")
-    description: Optional[str] = Field(
-        None, description="워크스페이스 설명", example="프로젝트 설명"
-    )
-    start_date: datetime = Field(
-        ..., description="시작 날짜", example="2024-01-01T00:00:00"
-    )
-    end_date: datetime = Field(
-        ..., description="종료 날짜", example="2024-12-31T23:59:59"
-    )
-    workspace_status: WorkspaceStatus = Field(
-        ..., description="워크스페이스 상태", example=WorkspaceStatus.ACTIVE
-    )
-    owner_id: str = Field(..., description="소유자 ID", example="user_123456")
-    team_id: str = Field(..., description="팀 ID", example="team_789")
-    client_id: str = Field(..., description="클라이언트 ID", example="client_456")
-    created_at: datetime = Field(
-        ..., description="생성 날짜", example="2024-01-01T00:00:00"
-    )
-    updated_at: datetime = Field(
-        ..., description="수정 날짜", example="2024-01-01T00:00:00"
-    )
+@dataclass(slots=True, frozen=True)
+class WorkspaceResponseSchema:
+    """워크스페이스 응답 (목록 응답에서 수백 건이 동시에 만들어지므로 __dict__ 없는 slots 사용)"""
 
-    class Config:
-        from_attributes = True
-        schema_extra = {
-            "example": {
-                "id": "ws_123456",
-                "name": "새로운 프로젝트",
-                "description": "프로젝트 설명",
-                "start_date": "2024-01-01T00:00:00",
-                "end_date": "2024-12-31T23:59:59",
-                "workspace_status": "ACTIVE",
-                "owner_id": "user_123456",
-                "team_id": "team_789",
-                "client_id": "client_456",
-                "created_at": "2024-01-01T00:00:00",
-                "updated_at": "2024-01-01T00:00:00",
-            }
-        }
+    __pydantic_config__ = ConfigDict(json_schema_extra=_lazy_schema_extra("WorkspaceResponseSchema"))
+
+    id: UUID
+    name: str
+    description: Optional[str]
+    start_date: datetime
+    end_date: datetime
+    workspace_status: WorkspaceStatusLit
+    owner_id: UUID
+    team_id: UUID
+    client_id: UUID
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_orm_fast(cls, row: Workspace) -> "WorkspaceResponseSchema":
+        """DB에서 읽은 행 전용 변환 (검증 없음, 사용자 입력에는 사용 금지)"""
+        return cls(
+            id=row.id,
+            name=row.name,
+            description=row.description,
+            start_date=row.start_date,
+            end_date=row.end_date,
+            workspace_status=row.workspace_status.value,
+            owner_id=row.owner_id,
+            team_id=row.team_id,
+            client_id=row.client_id,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+
+
+def encode_cursor(key: Tuple[datetime, UUID]) -> str:
+    """keyset 위치 (created_at, id)를 URL에 넣을 수 있는 cursor 문자열로 변환"""
+    created_at, workspace_id = key
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{workspace_id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """cursor 문자열을 (created_at, id)로 복원 (형식이 잘못되면 ValueError)"""
+    created_at, workspace_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+    return datetime.fromisoformat(created_at), UUID(workspace_id)
+
+
+def _next_cursor(rows: List[Workspace], has_next: bool) -> Optional[str]:
+    """다음 페이지가 있으면 마지막 행 위치로 cursor 생성 (page 조회에서도 cursor로 이어갈 수 있게)"""
+    return encode_cursor((rows[-1].created_at, rows[-1].id)) if has_next and rows else None
+
+
+def _paginate(total: int, page: int, limit: int) -> tuple[bool, bool]:
+    """(has_next, has_prev) 계산 (응답 모델에 validator/computed_field를 두지 않기 위해 밖에서 계산)"""
+    return page * limit < total, page > 1
 
 
 class WorkspaceListResponseSchema(BaseModel):
-    workspaces: list[WorkspaceResponseSchema] = Field(
-        ..., description="워크스페이스 목록"
-    )
-    total: int = Field(..., description="전체 워크스페이스 개수", example=100)
-    page: int = Field(..., description="현재 페이지 번호", example=1)
-    limit: int = Field(..., description="페이지 크기", example=10)
-    has_next: bool = Field(..., description="다음 페이지 존재 여부", example=False)
-    has_prev: bool = Field(..., description="이전 페이지 존재 여부", example=False)
-
-    class Config:
-        schema_extra = {
-            "example": {
-                "workspaces": [
-                    {
-                        "id": "ws_123456",
-                        "name": "새로운 프로젝트",
-                        "description": "프로젝트 설명",
-                        "start_date": "2024-01-01T00:00:00",
-                        "end_date": "2024-12-31T23:59:59",
-                        "workspace_status": "ACTIVE",
-                        "owner_id": "user_123456",
-                        "team_id": "team_789",
-                        "client_id": "client_456",
-                        "created_at": "2024-01-01T00:00:00",
-                        "updated_at": "2024-01-01T00:00:00",
-                    }
-                ],
-                "total": 100,
-                "page": 1,
-                "limit": 10,
-                "has_next": False,
-                "has_prev": False,
-            }
+    workspaces: list[WorkspaceResponseSchema]
+    total: Optional[int] = None
+    page: Optional[int] = None
+    limit: int
+    has_next: bool
+    has_prev: bool
+    next_cursor: Optional[str] = None
+
+    model_config = {**_BASE_CONFIG, "json_schema_extra": _lazy_schema_extra("WorkspaceListResponseSchema")}
+
+    @classmethod
+    def from_rows(cls, rows: List[Workspace], total: int, page: int, limit: int) -> "WorkspaceListResponseSchema":
+        """DB 조회 결과로 목록 응답 구성 (검증 생략)"""
+        has_next, has_prev = _paginate(total, page, limit)
+        return cls.model_construct(
+            workspaces=[WorkspaceResponseSchema.from_orm_fast(row) for row in rows],
+            total=total,
+            page=page,
+            limit=limit,
+            has_next=has_next,
+            has_prev=has_prev,
+            next_cursor=_next_cursor(rows, has_next),
+        )
+
+    @classmethod
+    def from_keyset(
+        cls, rows: List[Workspace], limit: int, next_key: Optional[Tuple[datetime, UUID]], has_prev: bool
+    ) -> "WorkspaceListResponseSchema":
+        """search_workspaces_after 결과로 목록 응답 구성 (전체 개수를 세지 않음)"""
+        return cls.model_construct(
+            workspaces=[WorkspaceResponseSchema.from_orm_fast(row) for row in rows],
+            total=None,
+            page=None,
+            limit=limit,
+            has_next=next_key is not None,
+            has_prev=has_prev,
+            next_cursor=None if next_key is None else encode_cursor(next_key),
+        )
+
+
+def workspace_etag(row: Workspace) -> str:
+    """updated_at 기반 ETag (If-Match로 돌아오면 parse_if_match로 조건부 쓰기에 사용)"""
+    return f'"{row.updated_at.isoformat()}"'
+
+
+def parse_if_match(if_match: Optional[str]) -> Optional[list[datetime]]:
+    """If-Match 헤더를 expected_updated_at 목록으로 변환 (없거나 "*"이면 None)
+
+    쉼표로 나열된 ETag 중 하나라도 현재 버전과 같으면 통과한다. workspace_etag 형식이 아닌 ETag는
+    어떤 버전과도 일치할 수 없으므로 버리고, 남는 것이 없으면 PreconditionFailedError(412)를 던진다.
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+
+    versions = []
+    for etag in if_match.split(","):
+        try:
+            versions.append(datetime.fromisoformat(etag.strip().removeprefix("W/").strip('"')))
+        except ValueError:
+            continue
+    if not versions:
+        raise PreconditionFailedError("If-Match가 현재 워크스페이스 버전과 일치하지 않습니다.")
+    return versions
+
+
+def dump_workspace_json(row: Workspace) -> bytes:
+    """단건 조회 응답 직렬화 (orjson이 slots dataclass와 datetime/UUID를 직접 인코딩)"""
+    return orjson.dumps(WorkspaceResponseSchema.from_orm_fast(row))
+
+
+def dump_workspaces_json(rows: List[Workspace]) -> bytes:
+    """목록 조회 응답 직렬화"""
+    return orjson.dumps([WorkspaceResponseSchema.from_orm_fast(row) for row in rows])
+
+
+def dump_workspace_list_json(rows: List[Workspace], total: int, page: int, limit: int) -> bytes:
+    """페이지 목록 응답 직렬화 (WorkspaceListResponseSchema와 같은 형태)"""
+    has_next, has_prev = _paginate(total, page, limit)
+    return orjson.dumps(
+        {
+            "workspaces": [WorkspaceResponseSchema.from_orm_fast(row) for row in rows],
+            "total": total,
+            "page": page,
+            "limit": limit,
+            "has_next": has_next,
+            "has_prev": has_prev,
+            "next_cursor": _next_cursor(rows, has_next),
         }
+    )
 
 
-class WorkspaceStatisticsResponseSchema(BaseModel):
-    total: int = Field(..., description="전체 워크스페이스 수", example=100)
-    active: int = Field(..., description="활성 워크스페이스 수", example=30)
-    inactive: int = Field(..., description="비활성 워크스페이스 수", example=10)
-    completed: int = Field(..., description="완료된 워크스페이스 수", example=40)
-    cancelled: int = Field(..., description="취소된 워크스페이스 수", example=5)
-    on_hold: int = Field(..., description="보류 중인 워크스페이스 수", example=8)
-    in_progress: int = Field(..., description="진행 중인 워크스페이스 수", example=5)
-    pending: int = Field(..., description="대기 중인 워크스페이스 수", example=2)
-
-    class Config:
-        schema_extra = {
-            "example": {
-                "total": 100,
-                "active": 30,
-                "inactive": 10,
-                "completed": 40,
-                "cancelled": 5,
-                "on_hold": 8,
-                "in_progress": 5,
-                "pending": 2,
-            }
+def dump_workspace_keyset_json(
+    rows: List[Workspace], limit: int, next_key: Optional[Tuple[datetime, UUID]], has_prev: bool
+) -> bytes:
+    """cursor 목록 응답 직렬화 (WorkspaceListResponseSchema.from_keyset과 같은 형태)"""
+    return orjson.dumps(
+        {
+            "workspaces": [WorkspaceResponseSchema.from_orm_fast(row) for row in rows],
+            "total": None,
+            "page": None,
+            "limit": limit,
+            "has_next": next_key is not None,
+            "has_prev": has_prev,
+            "next_cursor": None if next_key is None else encode_cursor(next_key),
         }
+    )
+
+
+# 상태별 개수 + "total" 응답 (get_workspace_statistics 결과, 상태가 늘어도 스키마 수정 불필요)
+_STATS_ADAPTER = TypeAdapter(dict[WorkspaceStatusLit | Literal["total"], int])
+
+
+def dump_workspace_statistics_json(counts: dict) -> bytes:
+    """상태별 워크스페이스 개수 직렬화"""
+    return _STATS_ADAPTER.dump_json(counts)
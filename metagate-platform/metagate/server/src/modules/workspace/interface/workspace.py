@@ -0,0 +1,4 @@
+from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
+
+workspaces = APIRouter(prefix="/workspaces", tags=["workspace"], default_response_class=ORJSONResponse)
@@ -0,0 +1,27 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@asynccontextmanager
+async def count_queries(session: AsyncSession) -> AsyncIterator[list[str]]:
+    """블록 안에서 실행된 SQL 문을 수집 (Command/Query 쿼리 수 회귀 검사용)
+
+    사용 예:
+        async with count_queries(session) as statements:
+            await WorkspaceUpdateCommand(session).execute(workspace_id, name="new")
+        assert len(statements) <= 2
+    """
+    statements: list[str] = []
+    engine = session.sync_session.get_bind()
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
@@ -0,0 +1,54 @@
+"""전역 예외 핸들러 테스트 (도메인 예외만 메시지를 노출하는지 확인)"""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.infrastructure.utils.exception_handler import (
+    DomainValidationError,
+    NotFoundError,
+    domain_validation_error_handler,
+    not_found_handler,
+    unhandled_exception_handler,
+)
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.add_exception_handler(DomainValidationError, domain_validation_error_handler)
+    app.add_exception_handler(NotFoundError, not_found_handler)
+    app.add_exception_handler(Exception, unhandled_exception_handler)
+
+    @app.get("/domain")
+    async def domain():
+        raise DomainValidationError("이미 존재하는 이메일입니다.")
+
+    @app.get("/missing")
+    async def missing():
+        raise NotFoundError("사용자를 찾을 수 없습니다.")
+
+    @app.get("/stray")
+    async def stray():
+        int("internal detail")
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_domain_validation_error_is_400_with_message():
+    response = _client().get("/domain")
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "이미 존재하는 이메일입니다."}
+
+
+def test_not_found_error_is_404():
+    response = _client().get("/missing")
+
+    assert response.status_code == 404
+    assert response.json() == {"detail": "사용자를 찾을 수 없습니다."}
+
+
+def test_builtin_value_error_is_500_without_message():
+    response = _client().get("/stray")
+
+    assert response.status_code == 500
+    assert "internal detail" not in response.text
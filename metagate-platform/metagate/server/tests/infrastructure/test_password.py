@@ -0,0 +1,35 @@
+"""비밀번호 해싱 헬퍼 테스트 (테스트 시간을 줄이기 위해 bcrypt 최소 cost 사용)"""
+
+import asyncio
+
+from src.infrastructure.security.password import hash_password, password_context, verify_password
+
+TEST_ROUNDS = 4
+
+
+def test_password_context_hashes_and_verifies():
+    context = password_context(TEST_ROUNDS)
+    hashed = context.hash("correct horse")
+
+    assert context.verify("correct horse", hashed)
+    assert not context.verify("wrong horse", hashed)
+    # salt는 해시마다 새로 생성
+    assert context.hash("correct horse") != hashed
+
+
+def test_password_context_flags_lower_cost_hashes_for_update():
+    hashed = password_context(TEST_ROUNDS).hash("correct horse")
+
+    assert not password_context(TEST_ROUNDS).needs_update(hashed)
+    assert password_context(TEST_ROUNDS + 1).needs_update(hashed)
+
+
+def test_hash_and_verify_in_process_pool():
+    async def scenario() -> tuple[bool, bool]:
+        hashed = await hash_password("correct horse", TEST_ROUNDS)
+        return (
+            await verify_password("correct horse", hashed, TEST_ROUNDS),
+            await verify_password("wrong horse", hashed, TEST_ROUNDS),
+        )
+
+    assert asyncio.run(scenario()) == (True, False)
@@ -0,0 +1,33 @@
+"""워크스페이스 일괄 생성 요청 디코드 테스트 (DB 불필요)"""
+
+from uuid import uuid4
+
+import orjson
+import pytest
+
+from src.infrastructure.utils.exception_handler import DomainValidationError
+from src.modules.workspace.interface.adapter import decode_workspace_bulk_create
+
+
+def _item(start_date: str, end_date: str) -> dict:
+    return {
+        "name": "bulk",
+        "description": "일괄 생성",
+        "start_date": start_date,
+        "end_date": end_date,
+        "owner_id": str(uuid4()),
+        "team_id": str(uuid4()),
+        "client_id": str(uuid4()),
+    }
+
+
+def test_decode_accepts_ordered_dates():
+    items = decode_workspace_bulk_create(orjson.dumps([_item("2026-01-01T00:00:00", "2026-12-31T00:00:00")]))
+
+    assert len(items) == 1
+    assert items[0]["end_date"] > items[0]["start_date"]
+
+
+def test_decode_rejects_end_date_before_start_date():
+    with pytest.raises(DomainValidationError, match="end_date"):
+        decode_workspace_bulk_create(orjson.dumps([_item("2026-12-31T00:00:00", "2026-01-01T00:00:00")]))
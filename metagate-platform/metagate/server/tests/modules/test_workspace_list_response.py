@@ -0,0 +1,26 @@
+"""WorkspaceListResponseSchema 형태 회귀 테스트 (DB 불필요)"""
+
+import orjson
+
+from src.modules.workspace.interface.adapter import WorkspaceListResponseSchema, dump_workspace_list_json
+
+LIST_RESPONSE_FIELDS = ["workspaces", "total", "page", "limit", "has_next", "has_prev", "next_cursor"]
+
+
+def test_list_response_declares_only_plain_fields():
+    assert list(WorkspaceListResponseSchema.model_fields) == LIST_RESPONSE_FIELDS
+    assert WorkspaceListResponseSchema.model_computed_fields == {}
+
+
+def test_from_rows_computes_pagination_flags():
+    response = WorkspaceListResponseSchema.from_rows([], total=45, page=2, limit=20)
+
+    assert (response.has_next, response.has_prev) == (True, True)
+    assert response.next_cursor is None
+
+
+def test_dumped_list_matches_schema_fields():
+    dumped = orjson.loads(dump_workspace_list_json([], total=45, page=3, limit=20))
+
+    assert list(dumped) == LIST_RESPONSE_FIELDS
+    assert (dumped["has_next"], dumped["has_prev"]) == (False, True)